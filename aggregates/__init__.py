@@ -0,0 +1,9 @@
+"""
+Description: The aggregates package.  It re-exports the public names of
+aggregates/aggregates.py.
+"""
+
+from .aggregates import Aggregates, AggregateSnapshot, track, untrack, is_tracking
+
+# The names this package exports.
+__all__ = ["Aggregates", "AggregateSnapshot", "track", "untrack", "is_tracking"]
@@ -0,0 +1,292 @@
+"""
+Description: Live counts of library items by genre, borrowed status and
+publication decade, and of library users by status, kept up to date as
+items and users join, leave and change rather than recounted on every
+refresh.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# threading: Guards the counters, which circulation threads update concurrently.
+# namedtuple: Gives each snapshot a small, immutable and readable record.
+# GENRES_BY_CODE, STATUSES_BY_CODE: Map the counters' indexes back to genres and statuses.
+import threading
+from collections import namedtuple
+from genre import GENRES_BY_CODE
+from borrower_status import STATUSES_BY_CODE
+
+class AggregateSnapshot(namedtuple("AggregateSnapshot", ["items", "borrowed", "available", "items_by_genre",
+                                                         "items_by_decade", "users", "users_by_status"])):
+    """
+    The counts at one moment.
+
+    Attributes:
+        items (int): The number of items.
+        borrowed (int): The number of items on loan.
+        available (int): The number of items not on loan.
+        items_by_genre (dict): Genre -> number of items, for every genre.
+        items_by_decade (dict): First year of a decade (e.g. 1960) -> number of items, for decades with items.
+        users (int): The number of users.
+        users_by_status (dict): BorrowerStatus -> number of users, for every status.
+    """
+
+    __slots__ = ()
+
+class Aggregates:
+    """
+    A class to hold incrementally maintained counts of items and users.
+
+    Items and users are counted by id: adding one whose id is already
+    counted replaces it, so an object rebuilt from storage and saved again
+    is not counted twice.  Counts are kept in lists indexed by genre and
+    status code, so every update is a dictionary lookup and a couple of
+    index operations under one lock, and a snapshot copies only a few
+    small lists.
+    """
+
+    def __init__(self, items=(), users=()):
+        """
+        Initializes the Aggregates, counting any existing items and users.
+
+        Args:
+            items (iterable of LibraryItem, optional): Items to count.
+            users (iterable of LibraryUser, optional): Users to count.
+        """
+        self.__lock = threading.Lock()
+        self.__by_genre = [0] * len(GENRES_BY_CODE)
+        self.__by_decade = {}
+        self.__borrowed = 0
+        self.__by_status = [0] * len(STATUSES_BY_CODE)
+        # item_id -> (genre code, decade, is_borrowed) and user_id -> status code, for everything counted.
+        self.__items = {}
+        self.__users = {}
+        for item in items:
+            self.add_item(item)
+        for user in users:
+            self.add_user(user)
+
+    def add_item(self, item):
+        """Counts an item, replacing the item with the same id if there is one."""
+        entry = (item.genre.code, _decade(item.publication_year), bool(item.is_borrowed))
+        with self.__lock:
+            old = self.__items.get(item.item_id)
+            if old is not None:
+                self.__uncount_item(old)
+            self.__items[item.item_id] = entry
+            self.__by_genre[entry[0]] += 1
+            self.__by_decade[entry[1]] = self.__by_decade.get(entry[1], 0) + 1
+            self.__borrowed += entry[2]
+
+    def remove_item(self, item):
+        """Stops counting an item, for example one withdrawn from the collection."""
+        with self.__lock:
+            old = self.__items.pop(item.item_id, None)
+            if old is not None:
+                self.__uncount_item(old)
+
+    def set_borrowed(self, item_id, is_borrowed):
+        """Counts an item moving between borrowed and available; items not counted are ignored."""
+        with self.__lock:
+            entry = self.__items.get(item_id)
+            if entry is not None and entry[2] != is_borrowed:
+                self.__items[item_id] = (entry[0], entry[1], is_borrowed)
+                self.__borrowed += 1 if is_borrowed else -1
+
+    def add_user(self, user):
+        """Counts a user, replacing the user with the same id if there is one."""
+        with self.__lock:
+            old = self.__users.get(user.user_id)
+            if old is not None:
+                self.__by_status[old] -= 1
+            self.__users[user.user_id] = user.status.code
+            self.__by_status[user.status.code] += 1
+
+    def remove_user(self, user):
+        """Stops counting a user."""
+        with self.__lock:
+            old = self.__users.pop(user.user_id, None)
+            if old is not None:
+                self.__by_status[old] -= 1
+
+    def set_status(self, user_id, status):
+        """Counts a user moving to a new status; users not counted are ignored."""
+        with self.__lock:
+            old = self.__users.get(user_id)
+            if old is not None and old != status.code:
+                self.__users[user_id] = status.code
+                self.__by_status[old] -= 1
+                self.__by_status[status.code] += 1
+
+    def snapshot(self):
+        """
+        Returns the current counts.
+
+        Returns:
+            AggregateSnapshot: A consistent copy of every count.
+        """
+        with self.__lock:
+            by_genre = list(self.__by_genre)
+            by_decade = dict(self.__by_decade)
+            borrowed = self.__borrowed
+            by_status = list(self.__by_status)
+        items = sum(by_genre)
+        by_decade = dict(sorted(by_decade.items(), key=_decade_order))
+        return AggregateSnapshot(items, borrowed, items - borrowed, dict(zip(GENRES_BY_CODE, by_genre)), by_decade,
+                                 sum(by_status), dict(zip(STATUSES_BY_CODE, by_status)))
+
+    def __uncount_item(self, entry):
+        # Take a counted item's entry out of the counts; the caller holds the lock.
+        genre, decade, is_borrowed = entry
+        self.__by_genre[genre] -= 1
+        count = self.__by_decade[decade] - 1
+        if count:
+            self.__by_decade[decade] = count
+        else:
+            del self.__by_decade[decade]
+        self.__borrowed -= is_borrowed
+
+# The methods replaced by track(), as (class, name) -> original attribute.
+_originals = {}
+
+def track(items=(), users=()):
+    """
+    Starts keeping live counts of the items and users in the library.
+
+    Membership comes from the collections that hold items and users, not
+    from constructing objects: items are counted when added to a Catalog
+    or saved to a SQLiteRepository and uncounted when removed from a
+    Catalog, and users are counted when saved to a SQLiteRepository.
+    Objects built from storage, or only built to be checked, are not
+    counted until saved.  Use the Aggregates' add and remove methods for
+    other collections.
+
+    is_borrowed and status changes on any object with a counted id,
+    LibraryUser.return_item and SQLiteRepository.write_changes are
+    replaced by wrappers that update the counts in O(1).  Each wrapper
+    makes its change and reports it under one lock, so racing changes to
+    an object are counted in the order they were made.  Objects that
+    already exist are only counted if they are passed in.  While not
+    tracking, the original methods are in place and cost nothing extra.
+
+    When combined with instrumentation.enable, stop in the reverse order of
+    starting, so each one restores the methods it replaced.
+
+    Args:
+        items (iterable of LibraryItem, optional): Existing items to count.
+        users (iterable of LibraryUser, optional): Existing users to count.
+
+    Returns:
+        Aggregates: The counts the wrappers update.
+    """
+    from catalog import Catalog
+    from library_item import LibraryItem, SlottedLibraryItem
+    from library_user import LibraryUser
+    from repository import SQLiteRepository
+
+    untrack()
+    aggregates = Aggregates(items, users)
+    # Shared by every wrapper.  Reentrant, since return_item sets is_borrowed.
+    lock = threading.RLock()
+    _patch(Catalog, "add", _adding(Catalog.__dict__["add"], aggregates.add_item))
+    _patch(Catalog, "remove", _removing(Catalog.__dict__["remove"], aggregates.remove_item))
+    _patch(SQLiteRepository, "save_items", _saving(SQLiteRepository.__dict__["save_items"], aggregates.add_item))
+    _patch(SQLiteRepository, "save_users", _saving(SQLiteRepository.__dict__["save_users"], aggregates.add_user))
+    _patch(SQLiteRepository, "write_changes", _writing(SQLiteRepository.__dict__["write_changes"], aggregates))
+    for cls in (LibraryItem, SlottedLibraryItem):
+        _patch(cls, "is_borrowed", _observed(cls.__dict__["is_borrowed"], cls.__dict__["item_id"].fget,
+                                                 aggregates.set_borrowed, lock))
+    _patch(LibraryUser, "status", _observed(LibraryUser.__dict__["status"], LibraryUser.__dict__["user_id"].fget,
+                                                   aggregates.set_status, lock))
+    _patch(LibraryUser, "return_item", _status_watching(LibraryUser.__dict__["return_item"], aggregates.set_status, lock))
+    return aggregates
+
+def untrack():
+    """
+    Stops keeping live counts, restoring the original methods.
+    """
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+def is_tracking():
+    """Returns True while items and users are being counted."""
+    return bool(_originals)
+
+def _patch(cls, name, replacement):
+    # Replace a class attribute, remembering the original for untrack().
+    _originals[(cls, name)] = cls.__dict__[name]
+    setattr(cls, name, replacement)
+
+def _wraps(wrapper, function):
+    # Mark a wrapper as standing in for function.
+    wrapper.__wrapped__ = function
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+def _adding(add, count):
+    # Count an item once the catalog has accepted it.
+    def wrapper(self, item):
+        add(self, item)
+        count(item)
+
+    return _wraps(wrapper, add)
+
+def _removing(remove, uncount):
+    # Stop counting the item the catalog removed.
+    def wrapper(self, item_id):
+        item = remove(self, item_id)
+        uncount(item)
+        return item
+
+    return _wraps(wrapper, remove)
+
+def _saving(save, count):
+    # Count every object once the repository has stored it.
+    def wrapper(self, objects):
+        objects = list(objects)
+        save(self, objects)
+        for obj in objects:
+            count(obj)
+
+    return _wraps(wrapper, save)
+
+def _writing(write_changes, aggregates):
+    # Count the borrowed and status changes written straight to the repository.
+    def wrapper(self, borrowed, statuses):
+        write_changes(self, borrowed, statuses)
+        for item_id, is_borrowed in borrowed.items():
+            aggregates.set_borrowed(item_id, is_borrowed)
+        for user_id, status in statuses.items():
+            aggregates.set_status(user_id, status)
+
+    return _wraps(wrapper, write_changes)
+
+def _observed(prop, key, changed, lock):
+    # A copy of a property whose setter reports the object's id and new value.
+    # The setter has validated the value by the time it is reported.
+    getter, setter = prop.fget, prop.fset
+
+    def observing_setter(self, value):
+        with lock:
+            setter(self, value)
+            changed(key(self), value)
+
+    return property(getter, observing_setter, prop.fdel, prop.__doc__)
+
+def _status_watching(method, changed, lock):
+    # Report a status change made inside a method without going through the status setter.
+    def return_item(self, item=None):
+        with lock:
+            result = method(self, item)
+            changed(self.user_id, self.status)
+        return result
+
+    return _wraps(return_item, method)
+
+def _decade_order(pair):
+    # Sort decades in order, with the None decade of non-integer years last.
+    return (pair[0] is None, pair[0] or 0)
+
+def _decade(year):
+    # The first year of the decade holding year, or None for a year that is not an integer.
+    return year - year % 10 if isinstance(year, int) else None
@@ -0,0 +1,9 @@
+"""
+Description: The batch_codec package.  It re-exports the public names of
+batch_codec/batch_codec.py.
+"""
+
+from .batch_codec import encode_items, encode_users, decode, Batch, ItemBatch, ItemView, UserBatch, UserView
+
+# The names this package exports.
+__all__ = ["encode_items", "encode_users", "decode", "Batch", "ItemBatch", "ItemView", "UserBatch", "UserView"]
@@ -0,0 +1,421 @@
+"""
+Description: A compact binary wire format for batches of library items and
+users, so catalog batches can be shipped between services without pickling
+or JSON-encoding every object.  Decoding is lazy: a batch is a view over the
+received buffer, and fields are only decoded when they are read.
+Author: Apurba Khan
+Date: 2026-10-17
+
+Batch layout (little-endian):
+    header    magic (4s), version (B), kind (B), padding, record count (I)
+    sections  the byte length of every section (I each), then the sections
+
+Columns are stored one after another rather than record by record, so
+every value in a column has the same encoding:
+    ids       zigzag varints of the difference from the previous id
+    years     a zigzag varint base year, then varints of year - base
+    codes     one byte per record: the Genre or BorrowerStatus code
+    borrowed  is_borrowed packed eight records to a byte, lowest bit first
+    strings   varint UTF-8 byte lengths, then the concatenated bytes
+"""
+
+# struct: Packs and unpacks the fixed-width header and section table.
+# accumulate: Turns lengths and id differences into offsets and ids without a Python loop.
+import struct
+from itertools import accumulate
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import GENRES_BY_CODE
+from borrower_status import STATUSES_BY_CODE
+
+_HEADER = struct.Struct("<4sBBxxI")
+_MAGIC = b"LBAT"
+_VERSION = 1
+
+# The kind byte, and the sections of each kind in order.
+_ITEMS = 1
+_USERS = 2
+_ITEM_SECTIONS = struct.Struct("<8I")  # ids, years, genres, borrowed, title lengths, titles, author lengths, authors
+_USER_SECTIONS = struct.Struct("<6I")  # ids, statuses, name lengths, names, email lengths, emails
+
+def encode_items(items):
+    """
+    Encodes library items as one batch.
+
+    Args:
+        items (iterable): LibraryItem-compatible objects.
+
+    Returns:
+        bytes: The encoded batch.
+
+    Raises:
+        ValueError: If a publication year is not an integer.
+    """
+    items = items if isinstance(items, list) else list(items)
+    years = [item.publication_year for item in items]
+    # Ensure the publication years can be stored as varints.
+    if not all(type(year) is int for year in years):
+        raise ValueError("Publication Year must be numeric.")
+    base = min(years, default=0)
+    sections = (_ids([item.item_id for item in items]),
+                _varints([_zigzag(base)]) + _varints([year - base for year in years]),
+                bytes([item.genre.code for item in items]),
+                _bits([item.is_borrowed for item in items]),
+                *_strings([item.title for item in items]),
+                *_strings([item.author for item in items]))
+    return _pack(_ITEMS, _ITEM_SECTIONS, len(items), sections)
+
+def encode_users(users):
+    """
+    Encodes library users as one batch.
+
+    Args:
+        users (iterable): LibraryUser-compatible objects.
+
+    Returns:
+        bytes: The encoded batch.
+    """
+    users = users if isinstance(users, list) else list(users)
+    sections = (_ids([user.user_id for user in users]),
+                bytes([user.status.code for user in users]),
+                *_strings([user.name for user in users]),
+                *_strings([user.email for user in users]))
+    return _pack(_USERS, _USER_SECTIONS, len(users), sections)
+
+def decode(buffer):
+    """
+    Opens an encoded batch without decoding its records.
+
+    The batch keeps a memoryview of buffer rather than a copy, so buffer
+    must not be changed while the batch is in use.
+
+    Args:
+        buffer (bytes-like): A batch made by encode_items or encode_users.
+
+    Returns:
+        ItemBatch or UserBatch: A lazy view of the records.
+
+    Raises:
+        ValueError: If buffer is not a complete batch.
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < _HEADER.size:
+        raise ValueError("Invalid batch.")
+    magic, version, kind, count = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC or version != _VERSION or kind not in (_ITEMS, _USERS):
+        raise ValueError("Invalid batch.")
+    layout = _ITEM_SECTIONS if kind == _ITEMS else _USER_SECTIONS
+    if len(view) < _HEADER.size + layout.size:
+        raise ValueError("Invalid batch.")
+
+    # Slice the sections out of the buffer; slicing a memoryview copies nothing.
+    sections = []
+    offset = _HEADER.size + layout.size
+    for length in layout.unpack_from(view, _HEADER.size):
+        sections.append(view[offset:offset + length])
+        offset += length
+    if offset != len(view):
+        raise ValueError("Invalid batch.")
+
+    # Check the fixed-width columns up front, so views can read them without checks.
+    if kind == _ITEMS:
+        codes, table = sections[2], GENRES_BY_CODE
+        if len(sections[3]) != (count + 7) // 8:
+            raise ValueError("Invalid batch.")
+    else:
+        codes, table = sections[1], STATUSES_BY_CODE
+    if len(codes) != count or (count and max(codes) >= len(table)):
+        raise ValueError("Invalid batch.")
+    return (ItemBatch if kind == _ITEMS else UserBatch)(count, sections)
+
+class Batch:
+    """
+    A base class for decoded batches.
+
+    Fixed-width columns are read straight from the buffer.  Variable-width
+    columns (ids, years and string offsets) are decoded in one pass the
+    first time any record needs them, and kept for later records.
+
+    Attributes:
+        size (int): The number of records in the batch.
+    """
+
+    def __init__(self, count, sections):
+        self.__count = count
+        self._sections = sections
+        self.__columns = {}
+
+    # Property to access the number of records.
+    @property
+    def size(self):
+        return self.__count
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(self.__count))]
+        if position < 0:
+            position += self.__count
+        if not 0 <= position < self.__count:
+            raise IndexError("Batch index out of range.")
+        return self._view(self, position)
+
+    def __iter__(self):
+        view = self._view
+        for position in range(self.__count):
+            yield view(self, position)
+
+    def _column(self, section, decode):
+        # Decode a variable-width column once, checking it holds one value per record.
+        column = self.__columns.get(section)
+        if column is None:
+            column = decode(self._sections[section], self.__count)
+            self.__columns[section] = column
+        return column
+
+    def _ids(self):
+        return self._column(0, _decode_ids)
+
+    def _offsets(self, lengths):
+        # The start of every string in a column, and the end of the last one.
+        offsets = self.__columns.get(lengths)
+        if offsets is None:
+            offsets = self._column(lengths, _decode_offsets)
+            if offsets[-1] != len(self._sections[lengths + 1]):
+                del self.__columns[lengths]
+                raise ValueError("Invalid batch.")
+        return offsets
+
+    def _string(self, lengths, position):
+        # Decode one string from its slice of the buffer.
+        offsets = self._offsets(lengths)
+        return str(self._sections[lengths + 1][offsets[position]:offsets[position + 1]], "utf-8")
+
+    def _strings(self, lengths):
+        # Decode every string in a column, from one decode of the whole section when it is ASCII.
+        offsets = self._offsets(lengths)
+        data = self._sections[lengths + 1]
+        text = str(data, "utf-8")
+        if len(text) != len(data):
+            return [str(data[start:end], "utf-8") for start, end in zip(offsets, offsets[1:])]
+        return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+class ItemView:
+    """
+    A LibraryItem-compatible view of one record in an ItemBatch.
+
+    Nothing is decoded until a field is read.
+    """
+
+    __slots__ = ("__batch", "__position")
+
+    def __init__(self, batch, position):
+        self.__batch = batch
+        self.__position = position
+
+    @property
+    def item_id(self):
+        return self.__batch._ids()[self.__position]
+
+    @property
+    def title(self):
+        return self.__batch._string(4, self.__position)
+
+    @property
+    def author(self):
+        return self.__batch._string(6, self.__position)
+
+    @property
+    def publication_year(self):
+        return self.__batch._years()[self.__position]
+
+    @property
+    def genre(self):
+        return self.__batch._genre(self.__position)
+
+    @property
+    def is_borrowed(self):
+        return self.__batch._borrowed(self.__position)
+
+    def to_item(self):
+        """
+        Returns a LibraryItem holding a copy of the record.
+
+        Returns:
+            LibraryItem: The item.
+        """
+        return LibraryItem(self.item_id, self.title, self.author, self.publication_year, self.genre, self.is_borrowed)
+
+class ItemBatch(Batch):
+    """
+    A lazy, sequence-like view of a batch of library items.
+    """
+
+    _view = ItemView
+
+    def _years(self):
+        return self._column(1, _decode_years)
+
+    def _genre(self, position):
+        return GENRES_BY_CODE[self._sections[2][position]]
+
+    def _borrowed(self, position):
+        return bool(self._sections[3][position >> 3] >> (position & 7) & 1)
+
+    def to_items(self):
+        """
+        Builds a LibraryItem for every record, validating them in bulk.
+
+        Returns:
+            tuple: A list of the valid LibraryItem objects and a list of RecordError for the rejected rows.
+
+        Raises:
+            ValueError: If the batch is corrupt.
+        """
+        count = len(self)
+        genres, borrowed = self._sections[2], self._sections[3]
+        flags = format(int.from_bytes(borrowed, "little"), f"0{len(borrowed) * 8}b")[:-count - 1:-1] if count else ""
+        return LibraryItem.from_records(list(zip(self._ids(), self._strings(4), self._strings(6), self._years(),
+                                                 map(GENRES_BY_CODE.__getitem__, genres),
+                                                 map("1".__eq__, flags))))
+
+class UserView:
+    """
+    A LibraryUser-compatible view of one record in a UserBatch.
+    """
+
+    __slots__ = ("__batch", "__position")
+
+    def __init__(self, batch, position):
+        self.__batch = batch
+        self.__position = position
+
+    @property
+    def user_id(self):
+        return self.__batch._ids()[self.__position]
+
+    @property
+    def name(self):
+        return self.__batch._string(2, self.__position)
+
+    @property
+    def email(self):
+        return self.__batch._string(4, self.__position)
+
+    @property
+    def status(self):
+        return self.__batch._status(self.__position)
+
+    def to_user(self):
+        """
+        Returns a LibraryUser holding a copy of the record.
+
+        Returns:
+            LibraryUser: The user.
+        """
+        return LibraryUser(self.user_id, self.name, self.email, self.status)
+
+class UserBatch(Batch):
+    """
+    A lazy, sequence-like view of a batch of library users.
+    """
+
+    _view = UserView
+
+    def _status(self, position):
+        return STATUSES_BY_CODE[self._sections[1][position]]
+
+    def to_users(self):
+        """
+        Builds a LibraryUser for every record, validating them in bulk.
+
+        Returns:
+            tuple: A list of the valid LibraryUser objects and a list of RecordError for the rejected rows.
+
+        Raises:
+            ValueError: If the batch is corrupt.
+        """
+        statuses = self._sections[1]
+        return LibraryUser.from_records(list(zip(self._ids(), self._strings(2), self._strings(4),
+                                                 map(STATUSES_BY_CODE.__getitem__, statuses))))
+
+def _pack(kind, layout, count, sections):
+    # Join the header, the section table and the sections.
+    return b"".join((_HEADER.pack(_MAGIC, _VERSION, kind, count), layout.pack(*map(len, sections)), *sections))
+
+def _zigzag(value):
+    # Map signed integers to unsigned ones so small negatives stay short: 0, -1, 1, -2 -> 0, 1, 2, 3.
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+def _unzigzag(value):
+    # The inverse of _zigzag.
+    return value >> 1 if not value & 1 else ~(value >> 1)
+
+def _varints(values):
+    # Seven bits per byte, lowest first, with the high bit set on every byte but the last.
+    if max(values, default=0) < 0x80 and min(values, default=0) >= 0:
+        # Values below 128 are a single byte each, which bytes() packs in C.
+        return bytes(values)
+    data = bytearray()
+    append = data.append
+    for value in values:
+        if value < 0:
+            raise ValueError("Varints must not be negative.")
+        while value > 0x7F:
+            append(value & 0x7F | 0x80)
+            value >>= 7
+        append(value)
+    return bytes(data)
+
+def _read_varints(data, count):
+    # Decode count varints that must fill data exactly.
+    if len(data) == count and (not count or max(data) < 0x80):
+        return list(data)
+    values = []
+    append = values.append
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            append(value)
+            value = shift = 0
+    if shift or len(values) != count:
+        raise ValueError("Invalid batch.")
+    return values
+
+def _ids(ids):
+    # Differences between neighbouring ids are small for ordered batches whatever the ids' size.
+    return _varints([_zigzag(value - previous) for previous, value in zip([0, *ids], ids)])
+
+def _decode_ids(data, count):
+    return list(accumulate(map(_unzigzag, _read_varints(data, count))))
+
+def _decode_years(data, count):
+    # Split off the base year so the single-byte fast path can apply to the rest.
+    end = next((position + 1 for position, byte in enumerate(data) if byte < 0x80), None)
+    if end is None:
+        raise ValueError("Invalid batch.")
+    base = _unzigzag(_read_varints(data[:end], 1)[0])
+    return [base + value for value in _read_varints(data[end:], count)]
+
+def _bits(flags):
+    # Build the bitmap as one integer from a string of digits, last flag first.
+    if not flags:
+        return b""
+    bits = int("".join(["1" if flag else "0" for flag in reversed(flags)]), 2)
+    return bits.to_bytes((len(flags) + 7) // 8, "little")
+
+def _strings(values):
+    # The length section and the data section of a string column.
+    data = "".join(values).encode("utf-8")
+    if len(data) == sum(map(len, values)):
+        # Every string is ASCII, so character counts are byte counts.
+        return _varints(list(map(len, values))), data
+    return _varints([len(value.encode("utf-8")) for value in values]), data
+
+def _decode_offsets(data, count):
+    return list(accumulate(_read_varints(data, count), initial=0))
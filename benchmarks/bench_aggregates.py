@@ -0,0 +1,75 @@
+"""
+Description: Compares a dashboard refresh from the live aggregates with a
+full rescan of every item and user, and measures what tracking adds to
+adding items to a catalog and to a borrow/return cycle.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_aggregates [items]
+"""
+
+import sys
+from time import perf_counter
+import aggregates
+from aggregates import Aggregates
+from catalog import Catalog
+from borrower_status import STATUSES_BY_CODE, BorrowerStatus
+from genre import GENRES_BY_CODE
+from library_item import LibraryItem
+from library_user import LibraryUser
+
+def build(count):
+    """Creates count items and a user per ten items."""
+    items = [LibraryItem(100 + n, f"Title {n}", "Author", 1900 + n % 125, GENRES_BY_CODE[n % 8]) for n in range(count)]
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", STATUSES_BY_CODE[n % 4])
+             for n in range(count // 10)]
+    return items, users
+
+def cycle(items, user):
+    """Borrows and returns every item once."""
+    for item in items:
+        user.borrow_item(item)
+        user.return_item(item)
+
+def main():
+    """Prints catalog and circulation overhead, and refresh cost both ways."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    borrower = LibraryUser(99_999_999, "Borrower", "borrower@example.com", BorrowerStatus.ACTIVE)
+    quota = LibraryUser.quota_for(BorrowerStatus.ACTIVE)
+    LibraryUser.set_quotas({BorrowerStatus.ACTIVE: count})
+    try:
+        timings = {}
+        for tracking in (False, True):
+            items, users = build(count)
+            counts = aggregates.track(users=users) if tracking else None
+            started = perf_counter()
+            Catalog(items)
+            catalogued = perf_counter() - started
+            started = perf_counter()
+            cycle(items, borrower)
+            circulated = perf_counter() - started
+            timings[tracking] = (catalogued, circulated, counts)
+            aggregates.untrack()
+    finally:
+        LibraryUser.set_quotas({BorrowerStatus.ACTIVE: quota})
+
+    for label, index, events in (("catalog add", 0, count), ("borrow+return", 1, count)):
+        plain, tracked = timings[False][index], timings[True][index]
+        print(f"{label:<14} {plain / events * 1e9:7.0f} ns untracked  {tracked / events * 1e9:7.0f} ns tracked "
+              f"({(tracked - plain) / events * 1e9:+.0f} ns)")
+
+    counts = timings[True][2]
+    rounds = 1000
+    started = perf_counter()
+    for _ in range(rounds):
+        counts.snapshot()
+    elapsed = perf_counter() - started
+    print(f"refresh, live snapshot {elapsed / rounds * 1e6:10.1f} us")
+    started = perf_counter()
+    Aggregates(items, users).snapshot()
+    elapsed = perf_counter() - started
+    print(f"refresh, full rescan   {elapsed * 1e6:10.1f} us ({len(items):,} items, {len(users):,} users)")
+
+if __name__ == "__main__":
+    main()
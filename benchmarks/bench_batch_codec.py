@@ -0,0 +1,64 @@
+"""
+Description: Compares the size and speed of shipping a batch of library
+items as a binary batch, with pickle and with JSON.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_batch_codec [items]
+"""
+
+import json
+import pickle
+import sys
+from time import perf_counter
+from batch_codec import decode, encode_items
+from genre import Genre, GENRES_BY_CODE
+from library_item import LibraryItem
+
+def to_json(items):
+    """Encodes items as a JSON list of objects."""
+    return json.dumps([{"item_id": item.item_id, "title": item.title, "author": item.author,
+                        "publication_year": item.publication_year, "genre": item.genre.name,
+                        "is_borrowed": item.is_borrowed} for item in items]).encode("utf-8")
+
+def from_json(data):
+    """Decodes a JSON list of objects back into items."""
+    return [LibraryItem(row["item_id"], row["title"], row["author"], row["publication_year"],
+                        Genre[row["genre"]], row["is_borrowed"]) for row in json.loads(data)]
+
+def timed(function, *args):
+    """Returns the result of function and the seconds it took."""
+    started = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - started
+
+def main():
+    """Prints the encoded size and the encode and decode times of each format."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    items = [LibraryItem(100 + n, f"Title {n}", f"Author {n % 5000}", 1900 + n % 125, GENRES_BY_CODE[n % 8],
+                         n % 3 == 0) for n in range(count)]
+
+    formats = (("pickle", lambda: pickle.dumps(items, pickle.HIGHEST_PROTOCOL), pickle.loads),
+               ("json", lambda: to_json(items), from_json),
+               ("batch", lambda: encode_items(items), lambda data: decode(data).to_items()[0]))
+    for name, encode, full_decode in formats:
+        data, encoded = timed(encode)
+        _, decoded = timed(full_decode, data)
+        print(f"{name:<7} {len(data) / count:6.1f} bytes/item  encode {encoded / count * 1e9:6.0f} ns/item  "
+              f"decode {decoded / count * 1e9:6.0f} ns/item")
+
+    # Opening a batch and reading a few records decodes only what is read.
+    data = encode_items(items)
+    started = perf_counter()
+    batch = decode(data)
+    titles = [batch[position].title for position in range(0, count, count // 10)]
+    elapsed = perf_counter() - started
+    print(f"batch, open and read {len(titles)} titles {elapsed * 1e6:8.1f} us")
+    started = perf_counter()
+    borrowed = sum(record.is_borrowed for record in batch)
+    elapsed = perf_counter() - started
+    print(f"batch, scan is_borrowed {elapsed / count * 1e9:6.0f} ns/item ({borrowed:,} borrowed)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Description: A local load generator for the CirculationService that 
+reports p50/p99 latency at 10,000 concurrent requests, compared with 
+running the synchronous calls in an executor.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_circulation_service [requests]
+"""
+
+import asyncio
+import random
+import sys
+from time import perf_counter
+from circulation_service import CirculationService
+from checkout_engine import CheckoutEngine
+from catalog import Catalog
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+def make_library(users, items):
+    """Builds the users and catalog used by both runs."""
+    people = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE) for n in range(users)]
+    catalog = Catalog(LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, False) for n in range(items))
+    return people, catalog
+
+def percentile(latencies, fraction):
+    """Returns a percentile of a sorted list of latencies in milliseconds."""
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+async def timed(call):
+    """Runs one request and returns its latency, ignoring refusals."""
+    started = perf_counter()
+    try:
+        await call()
+    except Exception:
+        pass
+    return perf_counter() - started
+
+async def run(requests, use_executor):
+    """Fires all requests at once and returns their sorted latencies."""
+    users, catalog = make_library(requests, 1000)
+    rng = random.Random(7)
+    pairs = [(user.user_id, 100 + rng.randrange(1000)) for user in users[:requests]]
+    if use_executor:
+        engine = CheckoutEngine(catalog=catalog)
+        by_id = {user.user_id: user for user in users}
+        loop = asyncio.get_running_loop()
+        call = lambda user_id, item_id: loop.run_in_executor(None, engine.borrow, by_id[user_id], catalog.get(item_id))
+    else:
+        service = CirculationService(users, catalog)
+        call = service.borrow
+    latencies = await asyncio.gather(*(timed(lambda pair=pair: call(*pair)) for pair in pairs))
+    return sorted(latencies)
+
+def main():
+    """Prints p50/p99 latency for the service and for the executor approach."""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for name, use_executor in (("CirculationService", False), ("run_in_executor", True)):
+        started = perf_counter()
+        latencies = asyncio.run(run(requests, use_executor))
+        elapsed = perf_counter() - started
+        print(f"{name:<20}{requests} requests  p50 {percentile(latencies, 0.50):8.2f} ms"
+              f"  p99 {percentile(latencies, 0.99):8.2f} ms  {requests / elapsed:,.0f} req/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Description: Compares batch eligibility evaluation against calling 
+LibraryUser.can_borrow in a Python double loop.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_eligibility [users] [items]
+"""
+
+import sys
+from time import perf_counter
+from eligibility import eligibility_matrix, eligible_pairs
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+def timed(function):
+    """Returns the seconds taken by one call of function."""
+    started = perf_counter()
+    function()
+    return perf_counter() - started
+
+def main():
+    """Prints the time for each approach over users x items pairs."""
+    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    item_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    statuses = list(BorrowerStatus)
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", statuses[n % 4]) for n in range(user_count)]
+    items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, n % 5 == 0) for n in range(item_count)]
+
+    loop = timed(lambda: [[user.can_borrow(item) for item in items] for user in users])
+    matrix = timed(lambda: eligibility_matrix(users, items))
+    pairs = timed(lambda: eligible_pairs(users, items))
+    print(f"{user_count * item_count:,} pairs")
+    print(f"can_borrow loop     {loop * 1000:10.1f} ms")
+    print(f"eligibility_matrix  {matrix * 1000:10.1f} ms  {loop / matrix:8.0f}x")
+    print(f"eligible_pairs      {pairs * 1000:10.1f} ms  {loop / pairs:8.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Description: Measures EventLog append throughput, with appends that wait
+for the disk from several threads and with delayed group commits, and
+recovery time against the number of events since the last snapshot.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_event_log [events]
+"""
+
+import sys
+import tempfile
+import threading
+from time import perf_counter
+from event_log import EventLog, recover, BORROW, RETURN
+
+def fill(directory, events, threads=1, **options):
+    """Appends alternating borrow and return events from several threads and returns the seconds taken."""
+    def worker(offset):
+        for n in range(offset, events, threads):
+            log.append({"type": BORROW if n % 2 == 0 else RETURN, "user_id": 100 + n % 977, "item_id": 100 + (n // 2) % 5003})
+
+    started = perf_counter()
+    with EventLog(directory, snapshot_every=10**9, **options) as log:
+        workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    return perf_counter() - started
+
+def main():
+    """Prints events/sec for waiting and delayed appends, and recovery time per log size."""
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    # Every append waits for its event to reach the disk; concurrent appenders share each fsync.
+    for threads in (1, 16, 64):
+        count = events // 100 * threads if threads < 64 else events // 2
+        with tempfile.TemporaryDirectory() as directory:
+            elapsed = fill(directory, count, threads)
+        print(f"waiting, {threads:>3} threads     {count / elapsed:>12,.0f} events/s")
+
+    # Appends return at once and are written in groups, at most 10 ms late.
+    for group_size in (64, 1024):
+        with tempfile.TemporaryDirectory() as directory:
+            elapsed = fill(directory, events, group_size=group_size, max_delay=0.01)
+        print(f"delayed, group of {group_size:>5}  {events / elapsed:>12,.0f} events/s")
+
+    for tail in (events // 100, events // 10, events):
+        with tempfile.TemporaryDirectory() as directory:
+            # Snapshot once after the bulk of the history, leaving `tail` events to replay.
+            with EventLog(directory, group_size=1024, snapshot_every=10**9) as log:
+                for n in range(events):
+                    log.append({"type": BORROW, "user_id": 100 + n % 977, "item_id": 100 + n})
+                log.snapshot()
+                for n in range(tail):
+                    log.append({"type": RETURN, "user_id": 100 + n % 977, "item_id": 100 + n})
+            started = perf_counter()
+            recover(directory)
+            print(f"recovery with {tail:>8} tail events  {(perf_counter() - started) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
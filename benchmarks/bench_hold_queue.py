@@ -0,0 +1,95 @@
+"""
+Description: Measures hold placement and handoff rates for one popular
+title with tens of thousands of holds, directly on HoldQueues and through
+the CheckoutEngine, against a list scanned from the front.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_hold_queue [holds]
+"""
+
+import random
+import sys
+from time import perf_counter
+from borrower_status import BorrowerStatus
+from checkout_engine import CheckoutEngine
+from genre import Genre
+from hold_queue import HoldQueues
+from library_item import LibraryItem
+from library_user import LibraryUser
+
+def main():
+    """Prints enqueue and handoff rates."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(21)
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE)
+             for n in range(count)]
+    times = [rng.uniform(0, 86_400) for _ in users]
+    item = LibraryItem(100, "Popular", "Author", 2024, Genre.FICTION, True)
+
+    # The queue on its own: every patron is willing, so each handoff is one pop.
+    holds = HoldQueues()
+    started = perf_counter()
+    for user, now in zip(users, times):
+        holds.place(user, 100, now=now)
+    elapsed = perf_counter() - started
+    print(f"enqueue           {count / elapsed:12,.0f} holds/s")
+    started = perf_counter()
+    while holds.hand_off(item, lambda user: True) is not None:
+        pass
+    elapsed = perf_counter() - started
+    print(f"handoff           {count / elapsed:12,.0f} handoffs/s")
+
+    # A tenth of the patrons turn DELINQUENT after placing holds and are passed over every time.
+    holds = HoldQueues()
+    for user, now in zip(users, times):
+        holds.place(user, 100, now=now)
+    skipped = users[::10]
+    for user in skipped:
+        user.status = BorrowerStatus.DELINQUENT
+    handed = 0
+    started = perf_counter()
+    while holds.hand_off(item, lambda user: True) is not None:
+        handed += 1
+    elapsed = perf_counter() - started
+    print(f"handoff, 10% skip {handed / elapsed:12,.0f} handoffs/s ({len(holds):,} holds passed over)")
+    for user in skipped:
+        user.status = BorrowerStatus.ACTIVE
+
+    # Through the engine: every return lends the item to the next patron in the queue.
+    engine = CheckoutEngine(holds=HoldQueues())
+    item.is_borrowed = False
+    engine.borrow(users[0], item)
+    rounds = min(count, 20_000)
+    for user, now in zip(users[1:rounds], times):
+        engine.holds.place(user, 100, now=now)
+    holder = users[0]
+    by_id = {user.user_id: user for user in users}
+    started = perf_counter()
+    for _ in range(rounds - 1):
+        engine.return_item(holder, item)
+        holder = by_id[engine.holder_of(100)]
+    elapsed = perf_counter() - started
+    print(f"engine return     {(rounds - 1) / elapsed:12,.0f} returns+handoffs/s")
+
+    # A list kept in request order, scanned from the front for the first
+    # patron who is not DELINQUENT, with the same tenth passed over.  Each
+    # handoff rescans the patrons passed over, so it is run on fewer holds.
+    for user in skipped:
+        user.status = BorrowerStatus.DELINQUENT
+    waitlist = [user for _, user in sorted(zip(times, users), key=lambda pair: pair[0])][:10_000]
+    handed = 0
+    started = perf_counter()
+    while True:
+        position = next((index for index, user in enumerate(waitlist)
+                         if user.status != BorrowerStatus.DELINQUENT), None)
+        if position is None:
+            break
+        del waitlist[position]
+        handed += 1
+    elapsed = perf_counter() - started
+    print(f"list, 10% skip    {handed / elapsed:12,.0f} handoffs/s ({len(waitlist) + handed:,} holds)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Description: Measures the import time of the project's packages with 
+python -X importtime, in a fresh interpreter for every run.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_import_time [runs]
+"""
+
+import os
+import subprocess
+import sys
+from statistics import median
+
+# The project root, where the packages live.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The import statements measured by default.
+STATEMENTS = [
+    "import library_item, library_user, genre, borrower_status",
+    "from library_item import LibraryItem",
+    "from library_user import LibraryUser",
+    "from catalog import Catalog",
+    "from ingest import load_items",
+    "from circulation_service import CirculationService",
+]
+
+def import_times(statement):
+    """
+    Runs a statement under -X importtime in a fresh interpreter.
+
+    Args:
+        statement (str): The Python code to run.
+
+    Raises:
+        RuntimeError: If the statement fails.
+
+    Returns:
+        dict: module name -> (self microseconds, cumulative microseconds), in import order.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+def project_modules(times):
+    """Returns the imported modules that belong to this project."""
+    packages = {name for name in os.listdir(ROOT) if os.path.isfile(os.path.join(ROOT, name, "__init__.py"))}
+    return [name for name in times if name.split(".")[0] in packages]
+
+def main():
+    """Prints the median project import time of each statement."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    for statement in STATEMENTS:
+        samples = []
+        for _ in range(runs):
+            times = import_times(statement)
+            samples.append(sum(times[name][0] for name in project_modules(times)))
+        modules = project_modules(times)
+        print(f"{median(samples) / 1000:7.2f} ms  {len(modules):3} modules  {statement}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Description: Measures the throughput and peak memory of streaming a 
+generated catalog CSV through the ingest loader.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_ingest [rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import tracemalloc
+from ingest import load_items, IngestStats
+from genre import Genre
+
+def write_catalog(path, rows):
+    """Writes a catalog CSV with roughly one invalid row in a hundred."""
+    genres = [genre.value for genre in Genre]
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["item_id", "title", "author", "publication_year", "genre", "is_borrowed"])
+        for n in range(rows):
+            title = "" if n % 100 == 99 else f"Title {n}"
+            writer.writerow([100 + n, title, f"Author {n % 5000}", 1900 + n % 120, genres[n % len(genres)], n % 3 == 0])
+
+def main():
+    """Loads catalogs of growing size and prints throughput and peak memory."""
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in (largest // 100, largest // 10, largest):
+            path = os.path.join(directory, f"catalog_{rows}.csv")
+            write_catalog(path, rows)
+            # Time one pass, then trace memory on a second; tracing slows the load several times over.
+            stats = IngestStats()
+            for batch in load_items(path, stats=stats):
+                pass
+            tracemalloc.start()
+            for batch in load_items(path):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{stats}  peak {peak / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Description: Measures the overhead of the instrumentation on the model
+hot paths, disabled and enabled at several sampling rates.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_instrumentation [operations]
+"""
+
+import sys
+from timeit import repeat
+import instrumentation
+from checkout_engine import CheckoutEngine
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+def workloads(count):
+    """Returns (name, function) pairs, each performing count operations."""
+    rows = [(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE) for n in range(count)]
+    users = [LibraryUser(*row) for row in rows]
+    items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, n % 3 == 0) for n in range(count)]
+    pairs = list(zip(users, items))
+    engine = CheckoutEngine()
+    free = [(user, item) for user, item in pairs if not item.is_borrowed]
+
+    def circulate():
+        for user, item in free:
+            engine.borrow(user, item)
+            engine.return_item(user, item)
+
+    return [
+        ("construct users", lambda: [LibraryUser(*row) for row in rows]),
+        ("can_borrow", lambda: [user.can_borrow(item) for user, item in pairs]),
+        ("engine borrow+return", circulate),
+    ]
+
+def main():
+    """Prints ns per operation and the overhead against the uninstrumented run."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    settings = [None, 64, 16, 1]
+    for name, function in workloads(count):
+        # Alternate the settings round by round, so drift in machine speed affects them all alike.
+        best = dict.fromkeys(settings, float("inf"))
+        for _ in range(9):
+            for sample_every in settings:
+                instrumentation.disable()
+                if sample_every is not None:
+                    instrumentation.enable(sample_every)
+                best[sample_every] = min(best[sample_every], min(repeat(function, number=1, repeat=1)))
+        instrumentation.disable()
+
+        base = best[None]
+        line = f"{name:<22}{base / count * 1e9:8.0f} ns/op"
+        for sample_every in settings[1:]:
+            line += f"   1/{sample_every:<3}{best[sample_every] / base - 1:+7.1%}"
+        print(line)
+
+if __name__ == "__main__":
+    main()
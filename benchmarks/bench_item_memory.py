@@ -0,0 +1,54 @@
+"""
+Description: Compares the memory used by LibraryItem, SlottedLibraryItem
+and ItemTable when holding the same catalog.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_item_memory [count]
+"""
+
+import sys
+import tracemalloc
+from library_item import LibraryItem, SlottedLibraryItem
+from item_table import ItemTable
+from genre import Genre
+
+def make_rows(count):
+    """
+    Yields raw rows as a loader would, creating fresh strings for every row
+    so that each representation pays for the strings it keeps.
+    """
+    genres = list(Genre)
+    authors = max(1, count // 20)
+    for n in range(count):
+        yield (100 + n, f"The Collected Title Number {n}", f"Author {n % authors}", 1900 + n % 120,
+               genres[n % len(genres)], n % 3 == 0)
+
+def measure(build, count):
+    """Returns the bytes still allocated after building a representation."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(make_rows(count))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+def main():
+    """Prints the memory per item for each representation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    builders = {
+        "LibraryItem": lambda rows: [LibraryItem(*row) for row in rows],
+        "SlottedLibraryItem": lambda rows: [SlottedLibraryItem(*row) for row in rows],
+        "ItemTable": lambda rows: ItemTable(SlottedLibraryItem(*row) for row in rows),
+    }
+    baseline = None
+    print(f"{count} items")
+    for name, build in builders.items():
+        used = measure(build, count)
+        baseline = baseline or used
+        print(f"{name:<20}{used / 1e6:>10.1f} MB{used / count:>10.1f} B/item{used / baseline:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
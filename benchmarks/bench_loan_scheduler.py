@@ -0,0 +1,67 @@
+"""
+Description: Drives the OverdueScheduler with a simulated clock over
+millions of open loans, and compares the cost of its sweeps with a
+nightly full scan of every loan.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_loan_scheduler [loans]
+"""
+
+import random
+import sys
+from time import perf_counter
+from loan_scheduler import OverdueScheduler, LOAN_PERIOD
+from library_user import LibraryUser
+from borrower_status import BorrowerStatus
+
+DAY = 24 * 60 * 60
+
+def main():
+    """Prints open/close/advance costs per event and the cost of a full scan."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(17)
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE)
+             for n in range(max(count // 5, 1))]
+    now = 0.0
+    scheduler = OverdueScheduler(clock=lambda: now)
+
+    # Open `count` loans borrowed over the last loan period.
+    started = perf_counter()
+    for item_id in range(count):
+        scheduler.open(rng.choice(users), item_id, now=now - rng.uniform(0, LOAN_PERIOD))
+    elapsed = perf_counter() - started
+    print(f"open      {count:>10,} loans  {elapsed / count * 1e9:8.0f} ns/loan")
+
+    # Simulate 30 days in one-minute ticks.  Every tick some loans are
+    # returned and as many new ones are opened, so the open count is steady.
+    ticks, per_tick = 30 * 24 * 60, max(count // (21 * 24 * 60), 1)
+    next_item = count
+    sweep = churn = 0.0
+    overdue = 0
+    for tick in range(ticks):
+        now = tick * 60.0
+        started = perf_counter()
+        for _ in range(per_tick):
+            scheduler.close(rng.randrange(next_item))
+            scheduler.open(rng.choice(users), next_item)
+            next_item += 1
+        churn += perf_counter() - started
+
+        started = perf_counter()
+        overdue += len(scheduler.advance())
+        sweep += perf_counter() - started
+    events = ticks * per_tick
+    print(f"churn     {events:>10,} close+open  {churn / events * 1e9:8.0f} ns/pair")
+    print(f"advance   {ticks:>10,} ticks  {sweep / ticks * 1e6:8.1f} us/tick, {overdue:,} users made delinquent")
+
+    # The alternative: scan every open loan once a night.
+    started = perf_counter()
+    due = [scheduler.loan_of(item_id) for item_id in range(next_item)]
+    late = sum(1 for loan in due if loan is not None and loan.due_at <= now)
+    elapsed = perf_counter() - started
+    print(f"full scan {len(scheduler):>10,} open loans  {elapsed * 1000:8.0f} ms/scan ({late:,} overdue)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Description: Measures patron deduplication on synthetic users, a fifth of
+whom are re-registrations of another user with a changed case, spacing,
+word order, Gmail dots or plus-tag, or a typo, and reports how many of
+them are found.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_patron_dedup [users]
+"""
+
+import random
+import sys
+from time import perf_counter
+from borrower_status import BorrowerStatus
+from library_user import LibraryUser
+from patron_dedup import PatronDeduplicator
+
+FIRST = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+         "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Chris", "Karen",
+         "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Betty", "Mark", "Sandra", "Paul", "Ashley", "José",
+         "Zoë", "Ann", "Mohammed", "Wei", "Priya", "Olga", "Kenji", "Fatima", "Lars"]
+LAST = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+        "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+        "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+        "Brontë", "Nguyen", "Kim", "Patel", "Chen", "Müller", "Ivanova", "Tanaka", "Khan", "Larsen"]
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "example.org"]
+
+def typo(text, rng):
+    """Drops or swaps one letter of text."""
+    position = rng.randrange(1, len(text) - 1)
+    if rng.random() < 0.5:
+        return text[:position] + text[position + 1:]
+    return text[:position - 1] + text[position] + text[position - 1] + text[position + 1:]
+
+def variant(name, email, rng):
+    """Re-registers a patron with one or two of the changes people make."""
+    local, domain = email.split("@")
+    padding = ""
+    # Changes are applied in order, so names are reordered before a typo can
+    # remove their space, and typos are made before a plus-tag is added.
+    for change in sorted(rng.sample(range(6), rng.choice((1, 2)))):
+        if change == 0:
+            local, domain = local.upper() if rng.random() < 0.5 else local.title(), domain.upper()
+        elif change == 1:
+            if domain.lower() == "gmail.com":
+                local = local.replace(".", "") if "." in local else local[:3] + "." + local[3:]
+            else:
+                padding = " "
+        elif change == 2:
+            first, last = name.split(" ", 1)
+            name = rng.choice((f"{last}, {first}", f"  {first.upper()}  {last} ", f"{first.lower()} {last.lower()}"))
+        elif change == 3:
+            name = typo(name.strip(), rng)
+        elif change == 4:
+            # A typo in both, so only fuzzy matching can find it.  The typo is
+            # kept out of the email's number, which the deduplicator must match.
+            letters = local.rstrip("0123456789")
+            name, local = typo(name.strip(), rng), typo(letters, rng) + local[len(letters):]
+        else:
+            local = f"{local}+library{rng.randrange(10)}"
+    return name, f"{padding}{local}@{domain}{padding}"
+
+def generate(count, rng):
+    """Returns count users and the index of the original each one copies."""
+    originals = count - count // 5
+    records, origin = [], []
+    for n in range(originals):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        email = f"{first.lower()}.{last.lower()}{rng.randrange(1_000_000)}@{rng.choice(DOMAINS)}"
+        # Half the patrons give a middle initial, which makes names less often shared.
+        name = f"{first} {chr(rng.randrange(65, 91))}. {last}" if rng.random() < 0.5 else f"{first} {last}"
+        records.append((100 + n, name, email.replace("ë", "e").replace("é", "e").replace("ü", "u")))
+        origin.append(n)
+    for n in range(originals, count):
+        source = rng.randrange(originals)
+        _, name, email = records[source]
+        records.append((100 + n, *variant(name, email, rng)))
+        origin.append(source)
+    users, _ = LibraryUser.from_records([(*record, BorrowerStatus.ACTIVE) for record in records])
+    return users, origin
+
+def main():
+    """Prints indexing and clustering times, and how many duplicates were found."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    users, origin = generate(count, random.Random(24))
+    deduplicator = PatronDeduplicator()
+    started = perf_counter()
+    deduplicator.add_all(users)
+    indexed = perf_counter() - started
+    started = perf_counter()
+    clusters = deduplicator.clusters()
+    clustered = perf_counter() - started
+    print(f"index     {indexed:7.2f} s ({count / indexed:,.0f} users/s)")
+    print(f"cluster   {clustered:7.2f} s ({deduplicator.comparisons:,} pairs scored, "
+          f"{count * (count - 1) // 2:,} pairs in all)")
+
+    # A duplicate is found when it is in the same cluster as its original; a
+    # merge is correct when the duplicate copies the same original as the survivor.
+    position = {user.user_id: index for index, user in enumerate(users)}
+    duplicates = sum(1 for index, source in enumerate(origin) if index != source)
+    merges = correct = 0
+    for cluster in clusters:
+        sources = [origin[position[user_id]] for user_id in (cluster.survivor, *cluster.duplicates)]
+        merges += len(cluster.duplicates)
+        correct += len(sources) - len(set(sources))
+    print(f"found     {correct:,} of {duplicates:,} duplicates ({correct / duplicates:.1%} recall), "
+          f"{correct:,} of {merges:,} merges correct ({correct / max(merges, 1):.1%} precision), "
+          f"{len(clusters):,} clusters")
+    print(f"total     {indexed + clustered:7.2f} s, about {(indexed + clustered) / count * 1e6:.0f} s per million users")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Description: Measures SQLite persistence of library items: rows/sec for
+bulk saves and loads against one transaction per row, and circulation
+transitions/sec written one at a time and through the WriteCoalescer.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_persistence [items] [transitions] [threads]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+from time import perf_counter
+from borrower_status import STATUSES_BY_CODE
+from genre import GENRES_BY_CODE
+from library_item import LibraryItem
+from library_user import LibraryUser
+from repository import SQLiteRepository
+from write_coalescer import WriteCoalescer
+
+def circulate(write, transitions, threads, item_ids, user_ids):
+    """Runs transitions random flips over threads, returning the elapsed seconds."""
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(transitions // threads):
+            if rng.random() < 0.9:
+                write("item", rng.choice(item_ids), rng.random() < 0.5)
+            else:
+                write("user", rng.choice(user_ids), rng.choice(STATUSES_BY_CODE))
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    started = perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return perf_counter() - started
+
+def main():
+    """Prints rows/sec for loads and transitions/sec for circulation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    transitions = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    items = [LibraryItem(100 + n, f"Title {n}", f"Author {n % 997}", 1900 + n % 120,
+                         GENRES_BY_CODE[n % len(GENRES_BY_CODE)]) for n in range(count)]
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", STATUSES_BY_CODE[n % 4])
+             for n in range(max(count // 10, 1))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteRepository(os.path.join(directory, "rowwise.db")) as repository:
+            sample = items[:max(count // 20, 1)]
+            started = perf_counter()
+            for item in sample:
+                repository.save_items([item])
+            elapsed = perf_counter() - started
+            print(f"save, one row per transaction  {len(sample) / elapsed:12,.0f} rows/s ({len(sample):,} rows)")
+
+        with SQLiteRepository(os.path.join(directory, "library.db"), pool_size=threads) as repository:
+            started = perf_counter()
+            repository.save_items(items)
+            repository.save_users(users)
+            elapsed = perf_counter() - started
+            rows = len(items) + len(users)
+            print(f"save, bulk executemany upsert  {rows / elapsed:12,.0f} rows/s ({rows:,} rows)")
+
+            started = perf_counter()
+            loaded = len(repository.load_items()) + len(repository.load_users())
+            elapsed = perf_counter() - started
+            print(f"load, full scan into objects   {loaded / elapsed:12,.0f} rows/s")
+
+            item_ids = [item.item_id for item in items]
+            user_ids = [user.user_id for user in users]
+            direct = {"item": repository.set_borrowed, "user": repository.set_status}
+            sample = max(transitions // 10, threads)
+            elapsed = circulate(lambda kind, key, value: direct[kind](key, value), sample, threads,
+                                item_ids, user_ids)
+            print(f"circulate, one row per commit  {sample / elapsed:12,.0f} transitions/s "
+                  f"({sample:,} on {threads} threads)")
+
+            with WriteCoalescer(repository) as coalescer:
+                queued = {"item": coalescer.set_borrowed, "user": coalescer.set_status}
+                started = perf_counter()
+                circulate(lambda kind, key, value: queued[kind](key, value), transitions, threads,
+                          item_ids, user_ids)
+                coalescer.flush()
+                elapsed = perf_counter() - started
+                print(f"circulate, write coalescer     {coalescer.queued / elapsed:12,.0f} transitions/s "
+                      f"({coalescer.queued:,} in {coalescer.batches:,} batches of {coalescer.rows:,} rows)")
+
+if __name__ == "__main__":
+    main()
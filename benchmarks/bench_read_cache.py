@@ -0,0 +1,76 @@
+"""
+Description: Replays Zipf-distributed item lookups against a SQLite
+repository, with no cache, a plain LRU cache and a TinyLFU-admission
+cache, and prints the hit rate and per-lookup latency of each.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute
+the following command:
+    python -m benchmarks.bench_read_cache [items] [lookups] [capacity]
+"""
+
+import bisect
+import itertools
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+from genre import GENRES_BY_CODE
+from instrumentation import LatencyHistogram
+from library_item import LibraryItem
+from read_cache import CachedRepository
+from repository import SQLiteRepository
+
+def zipf_keys(count, lookups, skew, rng):
+    """Returns lookups item ids drawn from a Zipf distribution over count ids."""
+    weights = itertools.accumulate(1 / rank ** skew for rank in range(1, count + 1))
+    cumulative = list(weights)
+    ids = list(range(100, 100 + count))
+    rng.shuffle(ids)
+    total = cumulative[-1]
+    return [ids[bisect.bisect(cumulative, rng.random() * total)] for _ in range(lookups)]
+
+def replay(get, keys):
+    """Looks every key up, returning the elapsed seconds and a histogram of lookup latencies."""
+    histogram = LatencyHistogram()
+    started = perf_counter()
+    for key in keys:
+        begun = perf_counter()
+        get(key)
+        histogram.record(int((perf_counter() - begun) * 1e9))
+    return perf_counter() - started, histogram
+
+def main():
+    """Prints hit rate, throughput and latency percentiles for each configuration."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    rng = random.Random(19)
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLiteRepository(os.path.join(directory, "library.db"))
+        backend.save_items(LibraryItem(100 + n, f"Title {n}", f"Author {n % 997}", 1900 + n % 120,
+                                       GENRES_BY_CODE[n % len(GENRES_BY_CODE)]) for n in range(count))
+        # Mostly Zipf traffic, with a one-off scan of cold ids in the middle.
+        keys = zipf_keys(count, lookups, 0.9, rng)
+        middle = len(keys) // 2
+        keys[middle:middle] = range(100, 100 + count // 10)
+
+        capacity = int(sys.argv[3]) if len(sys.argv) > 3 else max(count // 20, 1)
+        print(f"{count:,} items, {len(keys):,} lookups, cache capacity {capacity:,}")
+        print(f"{'configuration':<14} {'hit rate':>8} {'lookups/s':>11} {'p50 us':>8} {'p99 us':>8}")
+        configurations = [("uncached", None), ("lru", False), ("tinylfu", True)]
+        for name, admission in configurations:
+            if admission is None:
+                get, cache = backend.get_item, None
+            else:
+                cache = CachedRepository(backend, capacity=capacity, admission=admission)
+                get = cache.get_item
+            elapsed, histogram = replay(get, keys)
+            hit_rate = cache.items.stats().hit_rate if cache is not None else 0.0
+            print(f"{name:<14} {hit_rate:8.1%} {len(keys) / elapsed:11,.0f} "
+                  f"{histogram.percentile(0.5) / 1e3:8.1f} {histogram.percentile(0.99) / 1e3:8.1f}")
+        backend.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Description: Compares startup and lookup time of a memory-mapped item file
+against rebuilding every LibraryItem from a CSV dump.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_record_file [items]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+from record_file import ItemFile, write_items
+from ingest import iter_items
+from library_item import SlottedLibraryItem
+from benchmarks.bench_ingest import write_catalog
+from genre import Genre
+
+def main():
+    """Prints the time to become ready and to serve 10,000 lookups for each approach."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    genres = list(Genre)
+    rng = random.Random(3)
+    lookups = [100 + rng.randrange(count) for _ in range(10_000)]
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "items.csv")
+        bin_path = os.path.join(directory, "items.bin")
+        write_catalog(csv_path, count)
+        write_items(bin_path, (SlottedLibraryItem(100 + n, f"Title {n}", f"Author {n % 5000}", 1900 + n % 120,
+                                                  genres[n % len(genres)]) for n in range(count)))
+
+        started = perf_counter()
+        items = {item.item_id: item for item in iter_items(csv_path)}
+        loaded = perf_counter()
+        titles = [items[item_id].title for item_id in lookups if item_id in items]
+        finished = perf_counter()
+        print(f"CSV reload   ready {loaded - started:8.3f} s   10k lookups {(finished - loaded) * 1000:8.1f} ms")
+
+        started = perf_counter()
+        with ItemFile(bin_path, writable=True) as records:
+            ready = perf_counter()
+            titles = [records.get(item_id).title for item_id in lookups]
+            finished = perf_counter()
+            for item_id in lookups[:1000]:
+                records.set_borrowed(item_id, True)
+            flipped = perf_counter()
+        print(f"mmap file    ready {ready - started:8.3f} s   10k lookups {(finished - ready) * 1000:8.1f} ms"
+              f"   1k flips {(flipped - finished) * 1000:6.1f} ms")
+
+if __name__ == "__main__":
+    main()
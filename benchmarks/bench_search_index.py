@@ -0,0 +1,67 @@
+"""
+Description: Measures SearchIndex build time and query latency over a 
+synthetic catalog with a Zipf-like word distribution.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_search_index [items]
+"""
+
+import random
+import sys
+from itertools import accumulate
+from time import perf_counter
+from search_index import SearchIndex
+from library_item import SlottedLibraryItem
+from genre import Genre
+
+def make_words(count, rng):
+    """Returns count distinct pseudo-words."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(4, 9))))
+    return sorted(words)
+
+def main():
+    """Prints build time and p50/p99 latency for several kinds of query."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(11)
+    words = make_words(50_000, rng)
+    surnames = make_words(20_000, rng)
+
+    # Word ranks follow a Zipf-like distribution, as in real titles.
+    cumulative = list(accumulate(1 / (rank + 1) for rank in range(len(words))))
+    genres = list(Genre)
+    started = perf_counter()
+    index = SearchIndex()
+    for n in range(count):
+        title = " ".join(rng.choices(words, cum_weights=cumulative, k=rng.randint(2, 5)))
+        author = f"{rng.choice(surnames).title()} {rng.choice(surnames).title()}"
+        index.add(SlottedLibraryItem(100 + n, title, author, 1900 + n % 120, genres[n % len(genres)], n % 4 == 0))
+    print(f"indexed {count:,} items in {perf_counter() - started:.1f} s")
+
+    queries = {
+        "rare word": [rng.choice(words[5000:]) for _ in range(500)],
+        "common word": [rng.choice(words[:20]) for _ in range(100)],
+        "prefix": [rng.choice(words[1000:])[:4] for _ in range(500)],
+        "two words": [f"{rng.choice(words[100:])} {rng.choice(words[100:])[:3]}" for _ in range(500)],
+        "author": [rng.choice(surnames) for _ in range(500)],
+        "filtered": [rng.choice(words[1000:])[:3] for _ in range(500)],
+    }
+    for name, texts in queries.items():
+        latencies = []
+        for text in texts:
+            started = perf_counter()
+            if name == "filtered":
+                index.search(text, genre=Genre.FICTION, available_only=True)
+            else:
+                index.search(text)
+            latencies.append(perf_counter() - started)
+        latencies.sort()
+        print(f"{name:<10}  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms"
+              f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Description: Measures ShardedEngine throughput from one shard up to one
+shard per CPU, next to a single-process CheckoutEngine.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_sharded_engine [operations] [max shards]
+"""
+
+import os
+import random
+import sys
+from time import perf_counter
+from sharded_engine import ShardedEngine
+from checkout_engine import CheckoutEngine
+from library_item import SlottedLibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+BATCH = 10_000
+
+def main():
+    """Prints borrow+return operations per second for each shard count."""
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    most = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    rng = random.Random(23)
+    items = [SlottedLibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, False) for n in range(200_000)]
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE) for n in range(50_000)]
+    batches = [[(rng.randrange(100, 50_100), rng.randrange(100, 200_100)) for _ in range(BATCH)]
+               for _ in range(operations // BATCH // 2)]
+    print(f"{os.cpu_count()} CPUs, {len(batches) * BATCH * 2:,} operations in batches of {BATCH:,}")
+
+    # The single-process baseline, one call per operation.
+    engine = CheckoutEngine()
+    by_id = {item.item_id: item for item in items}
+    people = {user.user_id: user for user in users}
+    started = perf_counter()
+    for batch in batches:
+        lent = []
+        for user_id, item_id in batch:
+            try:
+                engine.borrow(people[user_id], by_id[item_id])
+                lent.append((user_id, item_id))
+            except Exception:
+                pass
+        for user_id, item_id in lent:
+            engine.return_item(people[user_id], by_id[item_id])
+    baseline = len(batches) * BATCH * 2 / (perf_counter() - started)
+    print(f"CheckoutEngine   {baseline:>12,.0f} ops/s")
+
+    shards = 1
+    while shards <= most:
+        with ShardedEngine(items, users, shards=shards) as sharded:
+            started = perf_counter()
+            for batch in batches:
+                results = sharded.borrow_many(batch)
+                sharded.return_many([pair for pair, ok in zip(batch, results) if ok])
+            rate = len(batches) * BATCH * 2 / (perf_counter() - started)
+        print(f"{shards:>3} shard(s)      {rate:>12,.0f} ops/s  {rate / baseline:5.2f}x")
+        shards *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Description: Compares the inline email check LibraryUser used to make
+against the validation module's precompiled check, its cache and its 
+batch mode.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the benchmark in the terminal execute 
+the following command:
+    python -m benchmarks.bench_validation [emails]
+"""
+
+import random
+import re
+import sys
+from timeit import repeat
+from validation import is_valid_email, is_valid_email_cached, valid_emails, clear_email_cache
+
+def inline(emails):
+    """The check LibraryUser.__init__ made before the validation module."""
+    for email in emails:
+        if not email.strip() or not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+            pass
+
+def precompiled(emails):
+    """The single-address check the constructor makes now."""
+    for email in emails:
+        if not is_valid_email(email):
+            pass
+
+def cached(emails):
+    """The single-address check with the LRU cache in front of it."""
+    for email in emails:
+        if not is_valid_email_cached(email):
+            pass
+
+def main():
+    """Prints ns per address for unique and repeated addresses."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(5)
+    domains = ["example.com", "hotmail.com", "library.org", "mail.co.uk"]
+    unique = [f"patron.{n}@{rng.choice(domains)}" for n in range(count)]
+    unique[::10] = [f"patron{n}-at-example.com" for n in range(0, count, 10)]
+
+    # Returning patrons: a few thousand addresses seen over and over.
+    repeated = [unique[rng.randrange(2_000)] for _ in range(count)]
+
+    for label, emails in [("unique", unique), ("repeated", repeated)]:
+        for name, check in [("inline re.match", inline), ("is_valid_email", precompiled),
+                            ("..._cached", cached), ("valid_emails", valid_emails)]:
+            best = min(repeat(lambda: check(emails), setup=clear_email_cache, number=1, repeat=5))
+            print(f"{label:<9}{name:<17}{best / count * 1e9:8.1f} ns/email")
+
+if __name__ == "__main__":
+    main()
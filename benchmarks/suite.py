@@ -0,0 +1,195 @@
+"""
+Description: A microbenchmark and regression suite for the model
+construction and circulation hot paths.  Each case is timed at several
+input sizes, results can be saved as a JSON baseline, and later runs fail
+when a case is slower than the baseline by more than a threshold.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To run the suite in the terminal execute one of the following 
+commands:
+    python -m benchmarks.suite                  # print the results
+    python -m benchmarks.suite --save           # write benchmarks/baseline.json
+    python -m benchmarks.suite --compare        # exit with status 1 on a regression
+"""
+
+import argparse
+import json
+import os
+import sys
+from timeit import Timer
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+# The default baseline file, next to this module.
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# The input sizes each case is timed at.
+SIZES = (1_000, 10_000, 100_000)
+
+# The slowdown, as a fraction of the baseline, that counts as a regression.
+THRESHOLD = 0.25
+
+# name -> function(size) returning a callable that performs `size` operations.
+CASES = {}
+
+def case(name):
+    """Registers a benchmark case under a name."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+def item_rows(size):
+    genres = list(Genre)
+    return [(100 + n, f"Title {n}", f"Author {n % 97}", 1900 + n % 120, genres[n % 8], False) for n in range(size)]
+
+def user_rows(size):
+    statuses = list(BorrowerStatus)
+    return [(100 + n, f"User {n}", f"user{n}@example.com", statuses[n % 4]) for n in range(size)]
+
+@case("construct_item")
+def construct_item(size):
+    rows = item_rows(size)
+    return lambda: [LibraryItem(*row) for row in rows]
+
+@case("construct_user")
+def construct_user(size):
+    rows = user_rows(size)
+    return lambda: [LibraryUser(*row) for row in rows]
+
+@case("property_access")
+def property_access(size):
+    items = [LibraryItem(*row) for row in item_rows(size)]
+    return lambda: [(item.item_id, item.title, item.author, item.genre, item.is_borrowed) for item in items]
+
+@case("can_borrow")
+def can_borrow(size):
+    users = [LibraryUser(*row) for row in user_rows(size)]
+    items = [LibraryItem(*row) for row in item_rows(size)]
+    pairs = list(zip(users, items))
+    return lambda: [user.can_borrow(item) for user, item in pairs]
+
+@case("borrow_return")
+def borrow_return(size):
+    users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE) for n in range(size)]
+    items = [LibraryItem(*row) for row in item_rows(size)]
+    pairs = list(zip(users, items))
+
+    def run():
+        for user, item in pairs:
+            user.borrow_item(item)
+            user.return_item(item)
+    return run
+
+@case("email_validation")
+def email_validation(size):
+    # One email in ten is invalid, so the rejection path is timed too.
+    rows = [(100 + n, f"User {n}", f"user{n}@example.com" if n % 10 else f"user{n}-at-example", BorrowerStatus.ACTIVE)
+            for n in range(size)]
+
+    def run():
+        for row in rows:
+            try:
+                LibraryUser(*row)
+            except ValueError:
+                pass
+    return run
+
+@case("enum_membership")
+def enum_membership(size):
+    # The genre check every LibraryItem makes, and the status check of the LibraryUser status setter.
+    rows = [(item_id, title, author, genre, is_borrowed)
+            for item_id, title, author, _, genre, is_borrowed in item_rows(size)]
+    statuses = [list(BorrowerStatus)[n % 4] for n in range(size)]
+    user = LibraryUser(100, "User", "user@example.com", BorrowerStatus.ACTIVE)
+
+    def run():
+        validate = LibraryItem.validate
+        for row, status in zip(rows, statuses):
+            validate(*row)
+            user.status = status
+    return run
+
+def run(names=None, sizes=SIZES, repeat=5):
+    """
+    Times each case at each size.
+
+    Args:
+        names (list of str, optional): The cases to run. Defaults to every case.
+        sizes (tuple of int, optional): The input sizes. Defaults to SIZES.
+        repeat (int, optional): The number of timings per case; the fastest is kept. Defaults to 5.
+
+    Returns:
+        dict: "case[size]" -> nanoseconds per operation.
+    """
+    results = {}
+    for name in names or CASES:
+        for size in sizes:
+            work = CASES[name](size)
+            best = min(Timer(work).repeat(repeat=repeat, number=1))
+            results[f"{name}[{size}]"] = best / size * 1e9
+    return results
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Finds the cases that are slower than the baseline by more than a threshold.
+
+    Cases missing from either side are ignored.
+
+    Args:
+        results (dict): "case[size]" -> nanoseconds per operation for this run.
+        baseline (dict): "case[size]" -> nanoseconds per operation for the baseline.
+        threshold (float, optional): The allowed slowdown as a fraction. Defaults to THRESHOLD.
+
+    Returns:
+        list of tuple: (key, baseline ns, current ns) for every regression.
+    """
+    return [(key, baseline[key], current) for key, current in results.items()
+            if key in baseline and current > baseline[key] * (1 + threshold)]
+
+def load_baseline(path=BASELINE):
+    """Reads a baseline file written by save_baseline."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+def save_baseline(results, path=BASELINE):
+    """Writes results as a baseline file, with the interpreter they were measured on."""
+    with open(path, "w", encoding="utf-8") as file:
+        rounded = {key: round(nanoseconds, 1) for key, nanoseconds in results.items()}
+        json.dump({"python": sys.version.split()[0], "results": rounded}, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def main(argv=None):
+    """Runs the suite from the command line and returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cases", nargs="*", help="the cases to run (default: all)")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="fail if a case regressed against the baseline")
+    parser.add_argument("--baseline", default=BASELINE, help="the baseline file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="the allowed slowdown (default: 0.25)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="the input sizes")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results = run(args.cases, tuple(args.sizes))
+    baseline = load_baseline(args.baseline) if args.compare else {}
+    for key, nanoseconds in results.items():
+        change = f"{nanoseconds / baseline[key] - 1:+7.1%}" if baseline.get(key) else ""
+        print(f"{key:<32}{nanoseconds:>12.1f} ns/op  {change}")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before:.1f} -> {after:.1f} ns/op")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""
+Description: The borrower_status package.  It re-exports the public names of
+borrower_status/borrower_status.py.
+"""
+
+from .borrower_status import BorrowerStatus, STATUSES_BY_CODE
+
+# The names this package exports.
+__all__ = ["BorrowerStatus", "STATUSES_BY_CODE"]
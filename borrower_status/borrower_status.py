@@ -22,7 +22,19 @@ class BorrowerStatus(Enum):
     - INACTIVE: A borrower in good standing that has not borrowed materials in the last year.
     - DELINQUENT: A borrower with overdue items.
     - MINOR: A borrower below the age of 18.
+
+    Each status also has a stable one-byte integer code, status.code, equal
+    to its value, for storage and index layers that keep one byte per record.
+    Record files already store these values; never reuse or renumber them.
     """
+
+    def __new__(cls, value):
+        # The code is a plain attribute, rather than a property, so that
+        # storage layers read it as fast as the value.
+        status = object.__new__(cls)
+        status._value_ = value
+        status.code = value
+        return status
     
     # ACTIVE status is assigned a value of 0.
     # This indicates the borrower has borrowed materials within the last year and is in good standing.
@@ -38,4 +50,45 @@ class BorrowerStatus(Enum):
 
     # MINOR status is assigned a value of 3.
     # A MINOR borrower is below the age of 18 and might have borrowing restrictions based on the library’s policies.
-    MINOR = 3
\ No newline at end of file
+    MINOR = 3
+
+    @classmethod
+    def from_code(cls, code):
+        """
+        Returns the status with the given integer code.
+
+        Raises:
+            ValueError: If code is not a status code.
+        """
+        status = _STATUS_BY_CODE.get(code) if type(code) is int else None
+        if status is None:
+            raise ValueError("Invalid Borrower Status.")
+        return status
+
+    @classmethod
+    def parse(cls, value):
+        """
+        Returns the status named by value, for ingest paths.
+
+        Accepts a BorrowerStatus, its name in any case and with surrounding
+        spaces (e.g. "minor"), or its code as an integer or text (e.g. "3").
+
+        Raises:
+            ValueError: If value does not name a status.
+        """
+        if isinstance(value, str):
+            status = _STATUS_BY_TEXT.get(value) or _STATUS_BY_TEXT.get(value.strip().lower())
+        elif isinstance(value, cls):
+            status = value
+        else:
+            status = _STATUS_BY_CODE.get(value) if type(value) is int else None
+        if status is None:
+            raise ValueError("Invalid Borrower Status.")
+        return status
+
+# Lookup tables, built once: code -> status as a tuple for direct indexing
+# by storage layers, and the text accepted by parse.
+STATUSES_BY_CODE = tuple(sorted(BorrowerStatus, key=lambda status: status.code))
+_STATUS_BY_CODE = dict(enumerate(STATUSES_BY_CODE))
+_STATUS_BY_TEXT = {text: status for status in BorrowerStatus
+                   for text in (status.name, status.name.lower(), str(status.code))}
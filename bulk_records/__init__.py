@@ -0,0 +1,9 @@
+"""
+Description: The bulk_records package.  It re-exports the public names of
+bulk_records/bulk_records.py.
+"""
+
+from .bulk_records import RecordError, record_columns, apply_rules, gather, instance_of, greater_than, non_blank
+
+# The names this package exports.
+__all__ = ["RecordError", "record_columns", "apply_rules", "gather", "instance_of", "greater_than", "non_blank"]
@@ -0,0 +1,120 @@
+"""
+Description: Helpers shared by the bulk record APIs: splitting records into
+columns, validating whole columns at once and reporting the rows that fail.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# namedtuple: Gives each error a small, immutable and readable record.
+# compress, repeat: Let each rule filter a whole column without a Python loop per row.
+from collections import namedtuple
+from itertools import compress, repeat
+
+class RecordError(namedtuple("RecordError", ["row", "message"])):
+    """
+    A record that failed validation during a bulk load.
+
+    Attributes:
+        row (int): The position of the record in the input.
+        message (str): The validation message, identical to the ValueError the constructor would raise.
+    """
+
+    __slots__ = ()
+
+def record_columns(records, fields, defaults):
+    """
+    Splits records into one list of values per field.
+
+    Each record is either a mapping keyed by field name or a sequence in
+    field order.  Fields missing from a record take the value in defaults,
+    or None when there is no default.
+
+    Args:
+        records (iterable): The records to split.
+        fields (tuple of str): The field names, in constructor order.
+        defaults (dict): Default values for optional fields.
+
+    Returns:
+        dict: A sequence of values for each field name.
+    """
+    records = records if isinstance(records, list) else list(records)
+
+    # Complete tuples and lists can be transposed in a single pass.
+    if all(map(isinstance, records, repeat((tuple, list)))) and set(map(len, records)) == {len(fields)}:
+        return dict(zip(fields, zip(*records))) if records else {field: () for field in fields}
+
+    columns = {field: [] for field in fields}
+    appends = [(position, columns[field].append, field, defaults.get(field)) for position, field in enumerate(fields)]
+    for record in records:
+        if hasattr(record, "keys"):
+            for position, append, field, default in appends:
+                append(record.get(field, default))
+        else:
+            size = len(record)
+            for position, append, field, default in appends:
+                append(record[position] if position < size else default)
+    return columns
+
+def apply_rules(columns, rules):
+    """
+    Applies validation rules to whole columns, in order.
+
+    Each rule only sees the rows that passed the rules before it, so every
+    rejected row is reported once, with the message of the first rule it failed.
+
+    Args:
+        columns (dict): A sequence of values for each field name.
+        rules (list of tuple): (field, test, message) triples, where test maps a list of values to booleans.
+
+    Returns:
+        tuple: The list of rows that passed every rule and a list of RecordError sorted by row.
+    """
+    count = len(next(iter(columns.values()), ()))
+    rows = list(range(count))
+    errors = []
+    for field, test, message in rules:
+        column = columns[field]
+
+        # Gather the surviving values only once a rule has rejected something.
+        values = column if len(rows) == count else list(map(column.__getitem__, rows))
+        mask = list(test(values))
+        if all(mask):
+            continue
+        errors.extend(RecordError(row, message) for row, passed in zip(rows, mask) if not passed)
+        rows = list(compress(rows, mask))
+    errors.sort()
+    return rows, errors
+
+def gather(columns, fields, rows):
+    """
+    Returns the values of the given rows, one sequence per field.
+
+    Args:
+        columns (dict): A sequence of values for each field name.
+        fields (tuple of str): The fields to gather, in order.
+        rows (list of int): The rows to gather.
+
+    Returns:
+        list: One sequence of values per field.
+    """
+    count = len(next(iter(columns.values()), ()))
+    if len(rows) == count:
+        return [columns[field] for field in fields]
+    return [list(map(columns[field].__getitem__, rows)) for field in fields]
+
+def instance_of(kind):
+    """Returns a rule test that passes values of the given type."""
+    return lambda values: map(isinstance, values, repeat(kind))
+
+def greater_than(limit):
+    """Returns a rule test that passes integers greater than limit."""
+    def test(values):
+        # A single C-level min() settles the common case where every value passes.
+        if values and min(values) > limit:
+            return repeat(True, len(values))
+        return map(limit.__lt__, values)
+    return test
+
+def non_blank(values):
+    """A rule test that passes strings that are not blank once stripped."""
+    return map(bool, map(str.strip, values))
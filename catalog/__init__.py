@@ -0,0 +1,9 @@
+"""
+Description: The catalog package.  It re-exports the public names of
+catalog/catalog.py.
+"""
+
+from .catalog import Catalog
+
+# The names this package exports.
+__all__ = ["Catalog"]
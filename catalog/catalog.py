@@ -0,0 +1,246 @@
+"""
+Description: An in-memory store of LibraryItem objects with a primary 
+index on item_id and secondary indexes on author, genre and publication
+year.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# bisect: Used to keep the distinct publication years sorted for range queries.
+# LibraryItem, SlottedLibraryItem: The objects held by the catalog.
+import bisect
+from library_item import LibraryItem, SlottedLibraryItem
+
+class Catalog:
+    """
+    A class to store and look up library items.
+
+    Every index maps a key to a dictionary of item_id -> LibraryItem, so
+    inserting, removing or re-indexing an item is O(1) and lookups by key
+    never scan the whole catalog.  Publication years are additionally kept
+    in a sorted list so that year ranges can be found in O(log n).
+
+    Borrowed status is not indexed: an item can be borrowed or returned
+    through LibraryUser or CheckoutEngine without the catalog being told,
+    so available and borrowed read each item's is_borrowed when called,
+    and always agree with the items.
+
+    Attributes:
+        size (int): The number of items currently held by the catalog.
+    """
+
+    def __init__(self, items=()):
+        """
+        Initializes the Catalog, optionally loading it with items.
+
+        Args:
+            items (iterable of LibraryItem, optional): Items to add to the catalog.
+
+        Raises:
+            ValueError: If an item is not a LibraryItem or an item_id is duplicated.
+        """
+        # Primary index: item_id -> LibraryItem.
+        self.__items = {}
+
+        # Secondary indexes: key -> {item_id: LibraryItem}.
+        self.__by_author = {}
+        self.__by_genre = {}
+        self.__by_year = {}
+
+        # Distinct publication years in ascending order.
+        self.__years = []
+
+        for item in items:
+            self.add(item)
+
+    # Property to access the number of items in the catalog.
+    @property
+    def size(self):
+        return len(self.__items)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, item_id):
+        return item_id in self.__items
+
+    def __iter__(self):
+        return iter(self.__items.values())
+
+    def add(self, item):
+        """
+        Adds an item to the catalog and all of its indexes.
+
+        Args:
+            item (LibraryItem): The item to add.
+
+        Raises:
+            ValueError: If item is not a LibraryItem or its item_id is already in the catalog.
+        """
+        # Only LibraryItem objects (or their slotted variant) can be catalogued.
+        if not isinstance(item, (LibraryItem, SlottedLibraryItem)):
+            raise ValueError("Item must be a LibraryItem.")
+
+        # Reject duplicate ids before touching any index.
+        if item.item_id in self.__items:
+            raise ValueError("Item Id already exists in the catalog.")
+
+        self.__items[item.item_id] = item
+        self.__index(self.__by_author, item.author, item)
+        self.__index(self.__by_genre, item.genre, item)
+        self.__index_year(item)
+
+    def remove(self, item_id):
+        """
+        Removes an item from the catalog and all of its indexes.
+
+        Args:
+            item_id (int): The unique identifier of the item to remove.
+
+        Raises:
+            ValueError: If the item_id is not in the catalog.
+
+        Returns:
+            LibraryItem: The removed item.
+        """
+        item = self.__items.pop(item_id, None)
+        if item is None:
+            raise ValueError("Item Id not found in the catalog.")
+
+        self.__unindex(self.__by_author, item.author, item_id)
+        self.__unindex(self.__by_genre, item.genre, item_id)
+
+        # Drop the year from the sorted list once no item uses it.
+        if not self.__unindex(self.__by_year, item.publication_year, item_id):
+            index = bisect.bisect_left(self.__years, item.publication_year)
+            del self.__years[index]
+        return item
+
+    def get(self, item_id, default=None):
+        """
+        Looks up an item by its item_id.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+            default (optional): The value returned when the item is not found. Defaults to None.
+
+        Returns:
+            LibraryItem: The matching item, or default if not found.
+        """
+        return self.__items.get(item_id, default)
+
+    def set_borrowed(self, item_id, is_borrowed):
+        """
+        Changes the borrowed status of an item in the catalog.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+            is_borrowed (bool): The new borrowed status.
+
+        Raises:
+            ValueError: If the item_id is not in the catalog or is_borrowed is not a boolean.
+        """
+        item = self.__items.get(item_id)
+        if item is None:
+            raise ValueError("Item Id not found in the catalog.")
+
+        # The item validates the new value.
+        item.is_borrowed = is_borrowed
+
+    def by_author(self, author):
+        """
+        Returns the items written by an author.
+
+        Args:
+            author (str): The author of the items.
+
+        Returns:
+            list: The matching LibraryItem objects.
+        """
+        return list(self.__by_author.get(author, {}).values())
+
+    def by_genre(self, genre):
+        """
+        Returns the items of a genre.
+
+        Args:
+            genre (Genre): The genre of the items.
+
+        Returns:
+            list: The matching LibraryItem objects.
+        """
+        return list(self.__by_genre.get(genre, {}).values())
+
+    def by_year(self, publication_year):
+        """
+        Returns the items published in a year.
+
+        Args:
+            publication_year (int): The year the items were published.
+
+        Returns:
+            list: The matching LibraryItem objects.
+        """
+        return list(self.__by_year.get(publication_year, {}).values())
+
+    def by_year_range(self, start, end):
+        """
+        Returns the items published between two years, inclusive.
+
+        Args:
+            start (int): The first publication year to include.
+            end (int): The last publication year to include.
+
+        Returns:
+            list: The matching LibraryItem objects ordered by publication year.
+        """
+        low = bisect.bisect_left(self.__years, start)
+        high = bisect.bisect_right(self.__years, end)
+        items = []
+        for year in self.__years[low:high]:
+            items.extend(self.__by_year[year].values())
+        return items
+
+    def available(self):
+        """
+        Returns the items that are not borrowed, in the order they were added.
+
+        Returns:
+            list: The available LibraryItem objects.
+        """
+        return [item for item in self.__items.values() if not item.is_borrowed]
+
+    def borrowed(self):
+        """
+        Returns the items that are borrowed, in the order they were added.
+
+        Returns:
+            list: The borrowed LibraryItem objects.
+        """
+        return [item for item in self.__items.values() if item.is_borrowed]
+
+    @staticmethod
+    def __index(index, key, item):
+        # Add the item under key, creating the bucket on first use.
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = {}
+        bucket[item.item_id] = item
+
+    @staticmethod
+    def __unindex(index, key, item_id):
+        # Remove the item from key's bucket, dropping empty buckets.
+        # Returns True if the bucket still holds other items.
+        bucket = index[key]
+        del bucket[item_id]
+        if not bucket:
+            del index[key]
+            return False
+        return True
+
+    def __index_year(self, item):
+        # Record a new distinct year in the sorted list before indexing the item.
+        year = item.publication_year
+        if year not in self.__by_year:
+            bisect.insort(self.__years, year)
+        self.__index(self.__by_year, year, item)
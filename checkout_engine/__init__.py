@@ -0,0 +1,9 @@
+"""
+Description: The checkout_engine package.  It re-exports the public names of
+checkout_engine/checkout_engine.py.
+"""
+
+from .checkout_engine import CheckoutEngine
+
+# The names this package exports.
+__all__ = ["CheckoutEngine"]
@@ -0,0 +1,294 @@
+"""
+Description: A thread-safe checkout engine that makes borrowing and 
+returning an item a single atomic step.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# threading: Provides the striped locks guarding each item's and user's state.
+# LoanLedger: Records which user holds which items.
+import threading
+from loan_ledger import LoanLedger
+
+class CheckoutEngine:
+    """
+    A class to borrow and return library items safely from many threads.
+
+    LibraryUser.borrow_item checks can_borrow and then marks the item as
+    borrowed, so two threads can both pass the check for the same item.
+    The engine runs each check-then-act under a lock chosen by the item's
+    id from a fixed set of stripes: operations on the same item are 
+    serialized, while operations on different items rarely contend and 
+    no global lock is ever taken.  A second set of stripes, always taken
+    after the item's, serializes operations on the same user, so two
+    borrows cannot both pass the user's quota check.
+
+    Attributes:
+        stripes (int): The number of locks the items are spread over.
+    """
+
+    def __init__(self, stripes=64, catalog=None, event_log=None, scheduler=None, holds=None):
+        """
+        Initializes the CheckoutEngine.
+
+        Args:
+            stripes (int, optional): The number of locks to spread items over. Defaults to 64.
+            catalog (Catalog, optional): A catalog whose borrowed indexes are kept up to date.
+            event_log (EventLog, optional): A log that records every borrow, return and status change before it is made.
+            scheduler (OverdueScheduler, optional): A scheduler that opens a loan with a due date for every borrow.
+            holds (HoldQueues, optional): Hold queues; a returned item goes straight to the next patron waiting for it.
+
+        Raises:
+            ValueError: If stripes is not a positive integer.
+        """
+        if not isinstance(stripes, int) or stripes <= 0:
+            raise ValueError("Stripes must be a positive integer.")
+
+        self.__locks = [threading.Lock() for _ in range(stripes)]
+        self.__user_locks = [threading.Lock() for _ in range(stripes)]
+        self.__catalog = catalog
+        self.__event_log = event_log
+        self.__scheduler = scheduler
+        self.__holds = holds
+
+        # Who holds which items, resumed from the log if there is one.
+        self.__ledger = LoanLedger(event_log.state.holders if event_log is not None else None)
+
+    # Property to access the number of lock stripes.
+    @property
+    def stripes(self):
+        return len(self.__locks)
+
+    # Property to access the ledger of items on loan.
+    @property
+    def ledger(self):
+        return self.__ledger
+
+    # Property to access the hold queues, or None if holds are not enabled.
+    @property
+    def holds(self):
+        return self.__holds
+
+    def borrow(self, user, item):
+        """
+        Atomically checks that the user can borrow the item and lends it.
+
+        Args:
+            user (LibraryUser): The user borrowing the item.
+            item (LibraryItem): The item to be borrowed.
+
+        Raises:
+            Exception: If the user cannot borrow the item due to a delinquent status or if the item is already borrowed.
+
+        Returns:
+            str: A message indicating the borrowing status.
+        """
+        with self.__lock_for(item.item_id), self.__user_lock_for(user.user_id):
+            return self.__lend(user, item)
+
+    def place_hold(self, user, item):
+        """
+        Puts a user in the queue for an item that is on loan.
+
+        Args:
+            user (LibraryUser): The user waiting for the item.
+            item (LibraryItem): The item on loan.
+
+        Raises:
+            ValueError: If the engine has no hold queues, the item is not on loan, the user already
+                has the item or a hold on it, or the user's status cannot place holds.
+
+        Returns:
+            Hold: The new hold.
+        """
+        if self.__holds is None:
+            raise ValueError("Holds are not enabled.")
+        with self.__lock_for(item.item_id):
+            # Checked under the item's lock, so the item cannot be returned
+            # between the check and the hold being queued.
+            if not item.is_borrowed:
+                raise ValueError("Item is available to borrow.")
+            if self.__ledger.holder_of(item.item_id) == user.user_id or item.item_id in user.loans:
+                raise ValueError("User already has the item.")
+            return self.__holds.place(user, item.item_id)
+
+    def return_item(self, user, item):
+        """
+        Atomically takes an item back from the user holding it.
+
+        Items that were already borrowed when they were created have no
+        recorded holder, and can only be returned by a user whose loans
+        list them.  An item the engine lent to a user whose loans do not
+        list it, for example because the user was not restored, is freed
+        without changing the user's status.  If the engine
+        has hold queues, the item is lent to the first patron waiting for
+        it who can borrow it before any other thread can take it.
+
+        Args:
+            user (LibraryUser): The user returning the item.
+            item (LibraryItem): The item being returned.
+
+        Raises:
+            Exception: If the item is not borrowed or is held by another user.
+
+        Returns:
+            str: A message indicating the return status and whether the user's status has changed.
+        """
+        with self.__lock_for(item.item_id):
+            with self.__user_lock_for(user.user_id):
+                message = self.__take_back(user, item)
+            # The returning user's lock is released first, so only one user
+            # lock is ever held at a time and handoffs cannot deadlock.
+            if self.__holds is not None:
+                # A user no longer DELINQUENT gets back the places of any parked holds.
+                self.__holds.reinstate(user)
+                self.__holds.hand_off(item, lambda patron: self.__lend_held(patron, item))
+            return message
+
+    def advance(self, now=None):
+        """
+        Marks the users of every loan that has fallen due DELINQUENT.
+
+        Each change is made under the user's lock, the same lock a return
+        takes, so a loan returned at the moment it falls due never leaves
+        its user DELINQUENT.
+
+        Args:
+            now (float, optional): The current time. Defaults to the scheduler's clock.
+
+        Raises:
+            ValueError: If the engine has no overdue scheduler.
+
+        Returns:
+            list of LibraryUser: The users who became DELINQUENT.
+        """
+        if self.__scheduler is None:
+            raise ValueError("Overdue loans are not scheduled.")
+        delinquent = []
+        for loan, user in self.__scheduler.fall_due(now):
+            with self.__user_lock_for(user.user_id):
+                # Skip a loan returned after it fell due but before its user's lock was free.
+                if self.__scheduler.loan_of(loan.item_id) != loan:
+                    continue
+                if self.__event_log is not None:
+                    self.__event_log.record_overdue(user, loan.item_id)
+                if user.mark_overdue(loan.item_id):
+                    delinquent.append(user)
+        return delinquent
+
+    def restore(self, users):
+        """
+        Rebuilds the users' loans from the engine's ledger.
+
+        An engine resumed from an event log knows who holds which items,
+        but the LibraryUser objects loaded alongside it start with no
+        loans; without this, can_borrow would let them exceed their quota.
+        Loans the event log records as overdue are marked so, leaving
+        their users DELINQUENT until those loans are returned.  If the
+        engine has a scheduler, the users' loans are reopened in it with
+        the due dates in the log, so they still fall due.
+
+        Args:
+            users (iterable of LibraryUser): The users to restore.
+        """
+        users = list(users)
+        overdue = self.__event_log.state.overdue if self.__event_log is not None else ()
+        for user in users:
+            with self.__user_lock_for(user.user_id):
+                held = sorted(self.__ledger.items_of(user.user_id))
+                user.restore_loans(held)
+                for item_id in held:
+                    if item_id in overdue:
+                        user.mark_overdue(item_id)
+        if self.__scheduler is not None and self.__event_log is not None:
+            state = self.__event_log.state
+            self.__scheduler.restore(state.loans(), users, state.overdue)
+
+    def holder_of(self, item_id):
+        """
+        Returns the id of the user holding an item.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            int: The user_id of the holder, or None if the item is not lent through the engine.
+        """
+        return self.__ledger.holder_of(item_id)
+
+    def items_of(self, user_id):
+        """
+        Returns the ids of the items a user holds.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            frozenset: The ids of the items lent to the user through the engine.
+        """
+        return self.__ledger.items_of(user_id)
+
+    def __lend(self, user, item):
+        # Lend an item; the caller holds the item's and the user's locks.
+        borrowed_at = due_at = None
+        if self.__scheduler is not None:
+            borrowed_at, due_at = self.__scheduler.loan_dates()
+        if self.__event_log is not None:
+            # Write-ahead: the borrow and its due date are on disk before any state changes.
+            if not user.can_borrow(item):
+                raise Exception(f"{user.name} cannot borrow the item.")
+            self.__event_log.record_borrow(user, item, borrowed_at, due_at)
+        message = user.borrow_item(item)
+        self.__ledger.lend(user.user_id, item.item_id)
+        if self.__scheduler is not None:
+            self.__scheduler.open(user, item.item_id, due_at, borrowed_at)
+        if self.__catalog is not None:
+            self.__catalog.set_borrowed(item.item_id, True)
+        return message
+
+    def __lend_held(self, user, item):
+        # Lend a returned item to a patron with a hold, if they can borrow it; the caller holds the item's lock.
+        with self.__user_lock_for(user.user_id):
+            if not user.can_borrow(item):
+                return False
+            self.__lend(user, item)
+            return True
+
+    def __take_back(self, user, item):
+        # Return an item; the caller holds the item's and the user's locks.
+        holder = self.__ledger.holder_of(item.item_id)
+        listed = item.item_id in user.loans
+        # An item with no recorded holder can only be returned by a user who lists it.
+        held = holder == user.user_id if holder is not None else listed
+        if not item.is_borrowed or not held:
+            raise Exception(f"{user.name} has not borrowed the item.")
+
+        # An item the ledger lends to the user but the user object does not list,
+        # such as one lent before the user was loaded, is freed by the engine
+        # itself; the user's status is left alone, since their loans are unknown.
+        returned = item if listed else None
+        if self.__event_log is not None:
+            # Write-ahead: the return, and any change of status it causes, are on disk first.
+            status = user.status_after_return(returned) if listed else user.status
+            self.__event_log.record_return(user, item)
+            if status != user.status:
+                self.__event_log.record_status(user, status)
+
+        self.__ledger.release(item.item_id)
+        if self.__catalog is not None:
+            self.__catalog.set_borrowed(item.item_id, False)
+        if self.__scheduler is not None:
+            self.__scheduler.close(item.item_id)
+
+        if returned is None:
+            item.is_borrowed = False
+            return "Item successfully returned."
+        # The user stays DELINQUENT while any of their other loans is overdue.
+        return user.return_item(returned)
+
+    def __lock_for(self, item_id):
+        # Items always map to the same stripe, so one item is never guarded by two locks.
+        return self.__locks[hash(item_id) % len(self.__locks)]
+
+    def __user_lock_for(self, user_id):
+        return self.__user_locks[hash(user_id) % len(self.__user_locks)]
@@ -0,0 +1,9 @@
+"""
+Description: The circulation_service package.  It re-exports the public names of
+circulation_service/circulation_service.py.
+"""
+
+from .circulation_service import CirculationService
+
+# The names this package exports.
+__all__ = ["CirculationService"]
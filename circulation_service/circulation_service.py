@@ -0,0 +1,185 @@
+"""
+Description: An asyncio facade over the circulation operations, for 
+callers running inside an event loop.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# asyncio: Provides the futures, scheduling and semaphore used by the service.
+# CheckoutEngine: Performs the atomic borrow and return transitions.
+import asyncio
+from checkout_engine import CheckoutEngine
+
+class CirculationService:
+    """
+    A class to borrow, return and check items from asyncio code.
+
+    The engine's operations can block: an engine with an EventLog waits
+    for each event to reach the disk unless the log has a max_delay.  So
+    rather than running them on the event loop, the service queues
+    requests and hands them to an executor thread in batches.  Every
+    request that arrives while the previous batch runs joins the next
+    one, so a slow engine makes for fewer, larger batches instead of a
+    stalled loop.  Each batch is processed grouped by item in arrival
+    order, and only one batch runs at a time, so requests for an item are
+    served in the order they arrived.  A semaphore bounds the number of
+    queued requests, so callers wait once the queue is full.
+
+    Attributes:
+        pending (int): The number of requests waiting to be processed.
+    """
+
+    def __init__(self, users, catalog, engine=None, max_pending=10_000, executor=None):
+        """
+        Initializes the CirculationService.
+
+        Args:
+            users (iterable of LibraryUser): The users known to the service.
+            catalog (Catalog): The items known to the service.
+            engine (CheckoutEngine, optional): The engine to run transitions on. Defaults to a new engine over catalog.
+            max_pending (int, optional): The number of queued requests before callers wait. Defaults to 10,000.
+            executor (concurrent.futures.Executor, optional): Runs the batches. Defaults to the event loop's default executor.
+
+        Raises:
+            ValueError: If max_pending is not a positive integer.
+        """
+        if not isinstance(max_pending, int) or max_pending <= 0:
+            raise ValueError("Max pending must be a positive integer.")
+
+        self.__users = {user.user_id: user for user in users}
+        self.__catalog = catalog
+        self.__engine = engine if engine is not None else CheckoutEngine(catalog=catalog)
+        self.__slots = asyncio.Semaphore(max_pending)
+        self.__executor = executor
+
+        # item_id -> [(operation, user, item, future)] waiting for the next pass.
+        self.__queue = {}
+        self.__pending = 0
+        # True while a batch is scheduled or running.
+        self.__scheduled = False
+
+    # Property to access the number of queued requests.
+    @property
+    def pending(self):
+        return self.__pending
+
+    async def borrow(self, user_id, item_id):
+        """
+        Borrows an item for a user.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the user or item is unknown.
+            Exception: If the user cannot borrow the item.
+
+        Returns:
+            str: A message indicating the borrowing status.
+        """
+        return await self.__submit(self.__engine.borrow, user_id, item_id)
+
+    async def return_(self, user_id, item_id):
+        """
+        Returns an item borrowed by a user.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the user or item is unknown.
+            Exception: If the item is not borrowed by the user.
+
+        Returns:
+            str: A message indicating the return status and whether the user's status has changed.
+        """
+        return await self.__submit(self.__engine.return_item, user_id, item_id)
+
+    async def can_borrow(self, user_id, item_id):
+        """
+        Checks if a user can borrow an item.
+
+        This is a read, so it is answered straight away without queueing.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the user or item is unknown.
+
+        Returns:
+            bool: True if the user can borrow the item, False otherwise.
+        """
+        user, item = self.__resolve(user_id, item_id)
+        return user.can_borrow(item)
+
+    async def __submit(self, operation, user_id, item_id):
+        # Queue a request for the next pass and wait for its result.
+        user, item = self.__resolve(user_id, item_id)
+        async with self.__slots:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            requests = self.__queue.get(item_id)
+            if requests is None:
+                requests = self.__queue[item_id] = []
+            requests.append((operation, user, item, future))
+            self.__pending += 1
+
+            # One batch is scheduled for everything queued before it starts.
+            if not self.__scheduled:
+                self.__scheduled = True
+                loop.call_soon(self.__process)
+            return await future
+
+    def __process(self):
+        # Hand every queued request to the executor as one batch, or stop if there are none.
+        queue, self.__queue = self.__queue, {}
+        batch = []
+        for requests in queue.values():
+            for request in requests:
+                self.__pending -= 1
+                if not request[3].cancelled():
+                    batch.append(request)
+        if not batch:
+            self.__scheduled = False
+            return
+        running = asyncio.get_running_loop().run_in_executor(self.__executor, _run, batch)
+        running.add_done_callback(lambda running: self.__finish(batch, running))
+
+    def __finish(self, batch, running):
+        # Resolve a finished batch's futures on the loop, then start the next batch.
+        if running.exception() is not None:
+            outcomes = [(None, running.exception())] * len(batch)
+        else:
+            outcomes = running.result()
+        for (_, _, _, future), (result, error) in zip(batch, outcomes):
+            if future.cancelled():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        self.__process()
+
+    def __resolve(self, user_id, item_id):
+        # Look up the user and item behind the ids.
+        user = self.__users.get(user_id)
+        if user is None:
+            raise ValueError("User Id not found.")
+        item = self.__catalog.get(item_id)
+        if item is None:
+            raise ValueError("Item Id not found in the catalog.")
+        return user, item
+
+def _run(batch):
+    # Run a batch of requests in an executor thread, returning (result, error) for each.
+    outcomes = []
+    for operation, user, item, _ in batch:
+        try:
+            outcomes.append((operation(user, item), None))
+        except Exception as error:
+            outcomes.append((None, error))
+    return outcomes
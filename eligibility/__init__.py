@@ -0,0 +1,9 @@
+"""
+Description: The eligibility package.  It re-exports the public names of
+eligibility/eligibility.py.
+"""
+
+from .eligibility import eligibility_matrix, eligibility_from_flags, eligible_pairs, eligible_items
+
+# The names this package exports.
+__all__ = ["eligibility_matrix", "eligibility_from_flags", "eligible_pairs", "eligible_items"]
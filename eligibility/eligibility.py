@@ -0,0 +1,88 @@
+"""
+Description: Batch evaluation of LibraryUser.can_borrow over many 
+(user, item) pairs at once.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# compress, product: Build the eligible pairs without a Python loop per pair.
+from itertools import compress, product
+
+def eligibility_matrix(users, items):
+    """
+    Returns whether each user can borrow each item.
+
+    Follows the same rules as LibraryUser.can_borrow: DELINQUENT users, 
+    users at their quota and borrowed items are never eligible.  can_borrow
+    does not depend on the pair, only on the user and the item separately,
+    so each user and each item is checked once and every row is one of two
+    shared byte strings.
+
+    Args:
+        users (sequence of LibraryUser): The users, one per row.
+        items (sequence of LibraryItem): The items, one per column.
+
+    Returns:
+        list of bytes: For each user, one byte per item, 1 if eligible and 0 otherwise.
+    """
+    blocked = [not user.can_borrow_more for user in users]
+    borrowed = [item.is_borrowed for item in items]
+    return eligibility_from_flags(blocked, borrowed)
+
+def eligibility_from_flags(blocked=None, borrowed=None, delinquent=None):
+    """
+    Returns the eligibility matrix from per-user and per-item flags.
+
+    Args:
+        blocked (sequence of bool): For each user, True if the user cannot borrow at all, e.g. because they are DELINQUENT.
+        borrowed (sequence of bool): For each item, True if the item is borrowed.
+        delinquent (sequence of bool, optional): The former name of blocked, still accepted.
+
+    Raises:
+        TypeError: If both or neither of blocked and delinquent are given, or borrowed is missing.
+
+    Returns:
+        list of bytes: For each user, one byte per item, 1 if eligible and 0 otherwise.
+    """
+    if delinquent is not None:
+        if blocked is not None:
+            raise TypeError("Pass either blocked or delinquent, not both.")
+        blocked = delinquent
+    if blocked is None or borrowed is None:
+        raise TypeError("eligibility_from_flags needs blocked and borrowed flags.")
+
+    # bytes.translate turns the borrowed flags into the available row in C.
+    available = bytes(map(bool, borrowed)).translate(_INVERT)
+    none = bytes(len(available))
+    return [none if flag else available for flag in blocked]
+
+def eligible_pairs(users, items):
+    """
+    Returns every (user, item) pair where the user can borrow the item.
+
+    Args:
+        users (sequence of LibraryUser): The users to check.
+        items (sequence of LibraryItem): The items to check.
+
+    Returns:
+        list of tuple: The eligible (user_id, item_id) pairs, ordered by user and then item.
+    """
+    user_ids = [user.user_id for user in users if user.can_borrow_more]
+    item_ids = [item.item_id for item in items if not item.is_borrowed]
+    return list(product(user_ids, item_ids))
+
+def eligible_items(row, items):
+    """
+    Returns the items marked eligible in one row of an eligibility matrix.
+
+    Args:
+        row (bytes): A row returned by eligibility_matrix.
+        items (sequence): The items the row's columns refer to.
+
+    Returns:
+        list: The eligible items.
+    """
+    return list(compress(items, row))
+
+# Translation table mapping a borrowed flag (0 or 1) to an available flag (1 or 0).
+_INVERT = bytes([1, 0]) + bytes(254)
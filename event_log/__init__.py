@@ -0,0 +1,9 @@
+"""
+Description: The event_log package.  It re-exports the public names of
+event_log/event_log.py.
+"""
+
+from .event_log import CirculationState, EventLog, recover, BORROW, RETURN, OVERDUE, STATUS
+
+# The names this package exports.
+__all__ = ["CirculationState", "EventLog", "recover", "BORROW", "RETURN", "OVERDUE", "STATUS"]
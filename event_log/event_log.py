@@ -0,0 +1,452 @@
+"""
+Description: An append-only log of circulation events (borrow, return,
+overdue and status change) with group commit, compacted snapshots and
+crash recovery.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# json: Each event and snapshot is stored as JSON.
+# os: Provides fsync and the atomic rename used for snapshots.
+# threading: Serializes appends from concurrent circulation workers.
+# Loan: The recovered loans are rebuilt as Loan records for the overdue scheduler.
+import json
+import os
+import threading
+from borrower_status import BorrowerStatus
+from loan_scheduler import Loan
+
+# The event types recorded in the log.
+BORROW = "borrow"
+RETURN = "return"
+OVERDUE = "overdue"
+STATUS = "status"
+
+_LOG_NAME = "events.log"
+_SNAPSHOT_NAME = "snapshot.json"
+
+class CirculationState:
+    """
+    A class to hold the circulation state rebuilt from the event log.
+
+    Attributes:
+        holders (dict): item_id -> user_id for every borrowed item.
+        statuses (dict): user_id -> BorrowerStatus for every user with a recorded status.
+        dates (dict): item_id -> (borrowed_at, due_at) for every borrowed item with a due date.
+        overdue (set): The ids of the borrowed items that are overdue.
+        sequence (int): The sequence number of the last event applied.
+    """
+
+    def __init__(self, holders=None, statuses=None, sequence=0, dates=None, overdue=()):
+        """
+        Initializes the CirculationState.
+
+        Args:
+            holders (dict, optional): item_id -> user_id for every borrowed item.
+            statuses (dict, optional): user_id -> BorrowerStatus.
+            sequence (int, optional): The sequence number of the last event applied. Defaults to 0.
+            dates (dict, optional): item_id -> (borrowed_at, due_at) for borrowed items with a due date.
+            overdue (iterable of int, optional): The ids of the borrowed items that are overdue.
+        """
+        self.holders = dict(holders or {})
+        self.statuses = dict(statuses or {})
+        self.dates = dict(dates or {})
+        self.overdue = set(overdue)
+        self.sequence = sequence
+
+    def apply(self, event):
+        """
+        Applies one event to the state.
+
+        Args:
+            event (dict): An event read from or written to the log.
+        """
+        kind = event["type"]
+        if kind == BORROW:
+            item_id = event["item_id"]
+            self.holders[item_id] = event["user_id"]
+            self.overdue.discard(item_id)
+            if "due_at" in event:
+                self.dates[item_id] = (event["borrowed_at"], event["due_at"])
+            else:
+                self.dates.pop(item_id, None)
+        elif kind == RETURN:
+            item_id = event["item_id"]
+            self.holders.pop(item_id, None)
+            self.dates.pop(item_id, None)
+            self.overdue.discard(item_id)
+        elif kind == OVERDUE:
+            # An overdue loan makes its user DELINQUENT.
+            if self.holders.get(event["item_id"]) == event["user_id"]:
+                self.overdue.add(event["item_id"])
+            self.statuses[event["user_id"]] = BorrowerStatus.DELINQUENT
+        elif kind == STATUS:
+            self.statuses[event["user_id"]] = BorrowerStatus[event["status"]]
+        self.sequence = event["seq"]
+
+    def loans(self):
+        """
+        Returns the recovered loans that have a due date.
+
+        Returns:
+            list of Loan: The loans, in item_id order.
+        """
+        return [Loan(self.holders[item_id], item_id, borrowed_at, due_at)
+                for item_id, (borrowed_at, due_at) in sorted(self.dates.items())]
+
+    def restore(self, items=(), users=(), scheduler=None):
+        """
+        Brings items and users loaded from elsewhere into line with the state.
+
+        Each item is marked borrowed exactly when it has a holder, each
+        user's loans are set to the items they hold, with those overdue
+        marked so, and users with a recorded status are given it.  A scheduler is given the users'
+        loans with their due dates, so they fall due as if there had been
+        no restart.
+
+        Args:
+            items (iterable of LibraryItem, optional): The items to restore.
+            users (iterable of LibraryUser, optional): The users to restore.
+            scheduler (OverdueScheduler, optional): A new scheduler to reopen the users' loans in.
+        """
+        users = list(users)
+        holders = self.holders
+        for item in items:
+            item.is_borrowed = item.item_id in holders
+        loans = {}
+        for item_id, user_id in holders.items():
+            loans.setdefault(user_id, []).append(item_id)
+        for user in users:
+            held = sorted(loans.get(user.user_id, ()))
+            user.restore_loans(held, [item_id for item_id in held if item_id in self.overdue])
+            status = self.statuses.get(user.user_id)
+            if status is not None:
+                user.status = status
+        if scheduler is not None:
+            scheduler.restore(self.loans(), users, self.overdue)
+
+    def to_dict(self):
+        """Returns the state as a JSON-compatible dictionary."""
+        return {
+            "sequence": self.sequence,
+            "holders": [[item_id, user_id] for item_id, user_id in self.holders.items()],
+            "statuses": [[user_id, status.name] for user_id, status in self.statuses.items()],
+            "dates": [[item_id, borrowed_at, due_at] for item_id, (borrowed_at, due_at) in self.dates.items()],
+            "overdue": sorted(self.overdue),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a state from the dictionary produced by to_dict."""
+        # Snapshots written before due dates were logged have no dates or overdue items.
+        return cls({item_id: user_id for item_id, user_id in data["holders"]},
+                   {user_id: BorrowerStatus[name] for user_id, name in data["statuses"]},
+                   data["sequence"],
+                   {item_id: (borrowed_at, due_at) for item_id, borrowed_at, due_at in data.get("dates", ())},
+                   data.get("overdue", ()))
+
+class EventLog:
+    """
+    A class to durably record circulation events.
+
+    By default append returns only once its event is on disk, so a caller
+    that records an event before changing any state (write-ahead) never
+    shows a change that a crash could lose.  Appends from many threads
+    share the disk's time (group commit): while one thread writes and
+    fsyncs a group, the events appended meanwhile gather in a buffer and
+    the next thread to need the disk writes them all with one write and
+    one fsync.
+
+    With max_delay set, append returns at once instead, and buffered
+    events are written once group_size of them have gathered or max_delay
+    seconds after the first of them, whichever comes first.  A crash can
+    then lose up to max_delay seconds of events, including ones whose
+    changes callers have already seen.
+
+    Every snapshot_every events the current state is written to a
+    snapshot and the log is truncated, so recovery only replays the
+    events since the last snapshot.
+
+    Attributes:
+        state (CirculationState): The state after every appended event.
+        sequence (int): The sequence number of the last appended event.
+        durable_sequence (int): The sequence number of the last event on disk.
+    """
+
+    def __init__(self, directory, group_size=256, snapshot_every=100_000, fsync=True, max_delay=None):
+        """
+        Opens the log in a directory, recovering any existing state.
+
+        Args:
+            directory (str): The directory holding the log and snapshot files.
+            group_size (int, optional): The most events written per commit. Defaults to 256.
+            snapshot_every (int, optional): The number of events between snapshots. Defaults to 100,000.
+            fsync (bool, optional): Whether commits wait for the data to reach the disk. Defaults to True.
+            max_delay (float, optional): If given, appends do not wait, and events are written within this many seconds.
+
+        Raises:
+            ValueError: If group_size or snapshot_every is not a positive integer, or max_delay is not a positive number.
+        """
+        if not isinstance(group_size, int) or group_size <= 0:
+            raise ValueError("Group size must be a positive integer.")
+        if not isinstance(snapshot_every, int) or snapshot_every <= 0:
+            raise ValueError("Snapshot interval must be a positive integer.")
+        if max_delay is not None and (not isinstance(max_delay, (int, float)) or isinstance(max_delay, bool)
+                                      or max_delay <= 0):
+            raise ValueError("Maximum delay must be a positive number.")
+
+        os.makedirs(directory, exist_ok=True)
+        self.__log_path = os.path.join(directory, _LOG_NAME)
+        self.__snapshot_path = os.path.join(directory, _SNAPSHOT_NAME)
+        self.__group_size = group_size
+        self.__snapshot_every = snapshot_every
+        self.__fsync = fsync
+        self.__max_delay = max_delay
+        self.__lock = threading.Lock()
+        # Signalled whenever a group has been written, waking the appenders waiting for it.
+        self.__written = threading.Condition(self.__lock)
+        self.__writing = False
+        self.__timer = None
+        self.__buffer = []
+
+        # Drop any torn write left by a crash so new events follow the last complete one.
+        self.__state, valid = _replay(directory)
+        self.__durable = self.__state.sequence
+        self.__since_snapshot = 0
+        self.__file = open(self.__log_path, "a", encoding="utf-8")
+        self.__file.truncate(valid)
+
+    # Property to access the current state.
+    @property
+    def state(self):
+        return self.__state
+
+    # Property to access the sequence number of the last appended event.
+    @property
+    def sequence(self):
+        return self.__state.sequence
+
+    # Property to access the sequence number of the last event written to disk.
+    @property
+    def durable_sequence(self):
+        return self.__durable
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_borrow(self, user, item, borrowed_at=None, due_at=None):
+        """
+        Records that a user borrowed an item.
+
+        Args:
+            user (LibraryUser): The user borrowing the item.
+            item (LibraryItem): The item borrowed.
+            borrowed_at (float, optional): When the item was borrowed, recorded with due_at.
+            due_at (float, optional): When the item is due back, so the loan can fall due after a restart.
+
+        Returns:
+            int: The sequence number of the event.
+        """
+        event = {"type": BORROW, "user_id": user.user_id, "item_id": item.item_id}
+        if due_at is not None:
+            event["borrowed_at"] = borrowed_at
+            event["due_at"] = due_at
+        return self.append(event)
+
+    def record_return(self, user, item):
+        """
+        Records that a user returned an item.
+
+        Args:
+            user (LibraryUser): The user returning the item.
+            item (LibraryItem): The item returned.
+
+        Returns:
+            int: The sequence number of the event.
+        """
+        return self.append({"type": RETURN, "user_id": user.user_id, "item_id": item.item_id})
+
+    def record_overdue(self, user, item_id):
+        """
+        Records that one of a user's loans is overdue, which makes the user DELINQUENT.
+
+        Args:
+            user (LibraryUser): The user holding the item.
+            item_id (int): The unique identifier of the overdue item.
+
+        Returns:
+            int: The sequence number of the event.
+        """
+        return self.append({"type": OVERDUE, "user_id": user.user_id, "item_id": item_id})
+
+    def record_status(self, user, status=None):
+        """
+        Records a user's status.
+
+        Args:
+            user (LibraryUser): The user whose status changes.
+            status (BorrowerStatus, optional): The new status, for recording it before it is set. Defaults to the user's current status.
+
+        Returns:
+            int: The sequence number of the event.
+        """
+        status = user.status if status is None else status
+        return self.append({"type": STATUS, "user_id": user.user_id, "status": status.name})
+
+    def append(self, event):
+        """
+        Appends an event and, unless max_delay is set, waits until it is on disk.
+
+        Args:
+            event (dict): The event, with at least a "type" key.
+
+        Returns:
+            int: The sequence number given to the event.
+        """
+        with self.__lock:
+            sequence = event["seq"] = self.__state.sequence + 1
+            self.__state.apply(event)
+            self.__buffer.append(json.dumps(event, separators=(",", ":")))
+            self.__since_snapshot += 1
+            if self.__since_snapshot >= self.__snapshot_every:
+                self.__snapshot()
+            elif self.__max_delay is None:
+                self.__write_through(sequence)
+            elif len(self.__buffer) >= self.__group_size:
+                self.__write_through(self.__state.sequence)
+            elif self.__timer is None:
+                self.__timer = threading.Timer(self.__max_delay, self.commit)
+                self.__timer.daemon = True
+                self.__timer.start()
+            return sequence
+
+    def commit(self):
+        """
+        Writes every buffered event to the log and waits for the disk.
+        """
+        with self.__lock:
+            self.__write_through(self.__state.sequence)
+
+    def snapshot(self):
+        """
+        Writes a snapshot of the current state and truncates the log.
+        """
+        with self.__lock:
+            self.__snapshot()
+
+    def close(self):
+        """
+        Commits any buffered events and closes the log.
+        """
+        with self.__lock:
+            if not self.__file.closed:
+                self.__write_through(self.__state.sequence)
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+                self.__file.close()
+
+    def __write_through(self, sequence):
+        # Return once every event up to sequence is on disk; the caller holds the lock.
+        # Whoever finds the disk idle writes everything buffered so far, while
+        # the others wait for that group and, if their events missed it, the next.
+        while self.__durable < sequence:
+            if self.__writing:
+                self.__written.wait()
+            else:
+                self.__write_group()
+
+    def __write_group(self):
+        # Write up to group_size buffered events at once, then flush and optionally
+        # fsync.  The lock is released meanwhile, so other threads keep appending.
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        lines = self.__buffer[:self.__group_size]
+        del self.__buffer[:self.__group_size]
+        last = self.__durable + len(lines)
+        self.__writing = True
+        self.__lock.release()
+        try:
+            self.__file.write("\n".join(lines) + "\n")
+            self.__file.flush()
+            if self.__fsync:
+                os.fsync(self.__file.fileno())
+        except BaseException:
+            # Put the group back, so the next commit retries it in order.
+            self.__lock.acquire()
+            self.__buffer[:0] = lines
+            raise
+        else:
+            self.__lock.acquire()
+            self.__durable = last
+        finally:
+            self.__writing = False
+            self.__written.notify_all()
+
+    def __snapshot(self):
+        # The snapshot is written to a temporary file and renamed over the old
+        # one, so a crash leaves either the old or the new snapshot intact.
+        # The snapshot covers the buffered events too, so they are dropped
+        # rather than written; only a group already being written is awaited.
+        while self.__writing:
+            self.__written.wait()
+        temporary = self.__snapshot_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.__state.to_dict(), file)
+            file.flush()
+            if self.__fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary, self.__snapshot_path)
+
+        # Every logged event is now covered by the snapshot.
+        self.__file.close()
+        self.__file = open(self.__log_path, "w", encoding="utf-8")
+        self.__since_snapshot = 0
+        self.__buffer.clear()
+        self.__durable = self.__state.sequence
+        self.__written.notify_all()
+
+def recover(directory):
+    """
+    Rebuilds the circulation state from a log directory.
+
+    Loads the latest snapshot, if any, and replays the logged events that
+    came after it.  Replay stops at the first incomplete line, which is 
+    what a crash in the middle of a write leaves behind.
+
+    Args:
+        directory (str): The directory holding the log and snapshot files.
+
+    Returns:
+        CirculationState: The recovered state.
+    """
+    return _replay(directory)[0]
+
+def _replay(directory):
+    # Recover the state and the length of the log up to its last complete event.
+    state = CirculationState()
+    snapshot_path = os.path.join(directory, _SNAPSHOT_NAME)
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, encoding="utf-8") as file:
+            state = CirculationState.from_dict(json.load(file))
+
+    valid = 0
+    log_path = os.path.join(directory, _LOG_NAME)
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                # Events already in the snapshot are skipped.
+                if event["seq"] > state.sequence:
+                    state.apply(event)
+                valid += len(line)
+    return state, valid
@@ -0,0 +1,9 @@
+"""
+Description: The genre package.  It re-exports the public names of
+genre/genre.py.
+"""
+
+from .genre import Genre, GENRE_CODES, GENRES_BY_CODE, GENRE_BY_VALUE
+
+# The names this package exports.
+__all__ = ["Genre", "GENRE_CODES", "GENRES_BY_CODE", "GENRE_BY_VALUE"]
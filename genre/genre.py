@@ -7,9 +7,6 @@ Date: 2024
 # Importing the Enum class to create the Genre enumeration.
 from enum import Enum
 
-# Importing the LibraryItem class to associate the genres with items (though not directly used here).
-from library_item import LibraryItem
-
 # Defining the Genre enumeration which contains valid genres for library items.
 class Genre(Enum):
     """
@@ -27,36 +24,94 @@ class Genre(Enum):
     - BIOGRAPHY: Items about the life of a person, typically non-fictional.
     - HISTORY: Items focused on historical events, figures, and facts.
     - CHILDREN: Items aimed at or suitable for a children's audience.
+
+    Each genre also has a stable one-byte integer code, genre.code, for
+    storage and index layers that keep one byte per record instead of the
+    member or its display string.  Codes are stored in record files, so
+    they must never be reused or renumbered; give a new genre the next code.
     """
 
-    # FICTION genre is assigned a string value of "Fiction".
+    def __new__(cls, value, code):
+        # Each member is declared as (display value, code); the display value
+        # stays the member's value, so Genre("Fiction") still finds it.
+        genre = object.__new__(cls)
+        genre._value_ = value
+        genre.code = code
+        return genre
+
+    # FICTION genre is assigned a string value of "Fiction" and the code 0.
     # Fiction includes literary works with imaginative storytelling.
-    FICTION = "Fiction"
+    FICTION = "Fiction", 0
 
-    # NONFICTION genre is assigned a string value of "Non-Fiction".
+    # NONFICTION genre is assigned a string value of "Non-Fiction" and the code 1.
     # Non-fiction encompasses works based on facts and reality.
-    NONFICTION = "Non-Fiction"
+    NONFICTION = "Non-Fiction", 1
 
-    # MYSTERY genre is assigned a string value of "Mystery".
+    # MYSTERY genre is assigned a string value of "Mystery" and the code 2.
     # Mystery works focus on suspense, crime, or solving puzzles.
-    MYSTERY = "Mystery"
+    MYSTERY = "Mystery", 2
 
-    # SCIFI genre is assigned a string value of "Science Fiction".
+    # SCIFI genre is assigned a string value of "Science Fiction" and the code 3.
     # Science fiction often involves futuristic technology or space themes.
-    SCIFI = "Science Fiction"
+    SCIFI = "Science Fiction", 3
 
-    # FANTASY genre is assigned a string value of "Fantasy".
+    # FANTASY genre is assigned a string value of "Fantasy" and the code 4.
     # Fantasy works contain magical or other supernatural elements.
-    FANTASY = "Fantasy"
+    FANTASY = "Fantasy", 4
 
-    # BIOGRAPHY genre is assigned a string value of "Biography".
+    # BIOGRAPHY genre is assigned a string value of "Biography" and the code 5.
     # Biography items tell the true story of a person's life.
-    BIOGRAPHY = "Biography"
+    BIOGRAPHY = "Biography", 5
 
-    # HISTORY genre is assigned a string value of "History".
+    # HISTORY genre is assigned a string value of "History" and the code 6.
     # History works focus on significant historical events and people.
-    HISTORY = "History"
+    HISTORY = "History", 6
 
-    # CHILDREN genre is assigned a string value of "Children".
+    # CHILDREN genre is assigned a string value of "Children" and the code 7.
     # Children's literature is tailored for younger readers.
-    CHILDREN = "Children"
+    CHILDREN = "Children", 7
+
+    @classmethod
+    def from_code(cls, code):
+        """
+        Returns the genre with the given integer code.
+
+        Raises:
+            ValueError: If code is not a genre code.
+        """
+        genre = _GENRE_BY_CODE.get(code) if type(code) is int else None
+        if genre is None:
+            raise ValueError("Invalid Genre.")
+        return genre
+
+    @classmethod
+    def parse(cls, value):
+        """
+        Returns the genre named by value, for ingest paths.
+
+        Accepts a Genre, its name or display value in any case and with 
+        surrounding spaces (e.g. "scifi" or "Science Fiction"), or its code.
+
+        Raises:
+            ValueError: If value does not name a genre.
+        """
+        if isinstance(value, str):
+            genre = _GENRE_BY_TEXT.get(value) or _GENRE_BY_TEXT.get(value.strip().lower())
+        elif isinstance(value, cls):
+            genre = value
+        else:
+            genre = _GENRE_BY_CODE.get(value) if type(value) is int else None
+        if genre is None:
+            raise ValueError("Invalid Genre.")
+        return genre
+
+# The stable integer code of each genre.
+GENRE_CODES = {genre: genre.code for genre in Genre}
+
+# Lookup tables, built once: code -> genre as a tuple for direct indexing by
+# storage layers, display value -> genre, and the text accepted by parse.
+GENRES_BY_CODE = tuple(sorted(GENRE_CODES, key=GENRE_CODES.get))
+GENRE_BY_VALUE = {genre.value: genre for genre in Genre}
+_GENRE_BY_CODE = dict(enumerate(GENRES_BY_CODE))
+_GENRE_BY_TEXT = {text: genre for genre in Genre
+                  for text in (genre.name, genre.value, genre.name.lower(), genre.value.lower())}
@@ -0,0 +1,9 @@
+"""
+Description: The hold_queue package.  It re-exports the public names of
+hold_queue/hold_queue.py.
+"""
+
+from .hold_queue import HoldQueues, Hold, DEFAULT_PRIORITIES
+
+# The names this package exports.
+__all__ = ["HoldQueues", "Hold", "DEFAULT_PRIORITIES"]
@@ -0,0 +1,359 @@
+"""
+Description: Per-item hold queues, so a patron who finds an item on loan
+can wait for it and receive it as soon as it is returned.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# heapq: Orders each item's holds by priority and request time.
+# threading: Guards the queues, which the checkout engine updates from many threads.
+# time: Supplies the default clock.
+# itertools: Numbers the holds, so equal request times are served in placement order.
+# namedtuple: Gives each hold a small, immutable and readable record.
+# BorrowerStatus: Priorities are given per status.
+import heapq
+import threading
+import time
+import itertools
+from collections import namedtuple
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+
+# The default priority of each status: lower is served first, and None
+# means patrons of that status are passed over.
+DEFAULT_PRIORITIES = {
+    BorrowerStatus.ACTIVE: 0,
+    BorrowerStatus.INACTIVE: 0,
+    BorrowerStatus.MINOR: 0,
+    BorrowerStatus.DELINQUENT: None,
+}
+
+# Cancelled holds leave stale heap entries behind; a queue is rebuilt once
+# it has more stale entries than live holds, and at least this many.
+_MIN_COMPACTION = 64
+
+class Hold(namedtuple("Hold", ["user_id", "item_id", "requested_at", "priority"])):
+    """
+    A patron's request to borrow an item once it is returned.
+
+    Attributes:
+        user_id (int): The user waiting for the item.
+        item_id (int): The item requested.
+        requested_at (float): When the hold was placed, in clock seconds.
+        priority (int): The priority of the user's status when the hold was placed; lower is served first.
+    """
+
+    __slots__ = ()
+
+class _Queue:
+    """
+    The holds on one item: a heap of [priority, requested_at, sequence,
+    version, user, hold] entries, where a cancelled, served or parked entry
+    has its user set to None, plus the entries of patrons parked because of
+    their status.  A parked hold keeps its sequence, and so its place, but
+    gets a new version, so it never ties with the stale entry it leaves in
+    the heap.  The lock serializes changes to this item's holds.
+    """
+
+    __slots__ = ("heap", "stale", "parked", "lock")
+
+    def __init__(self):
+        self.heap = []
+        self.stale = 0
+        # user_id -> entry, for holds set aside until their patron is reinstated.
+        self.parked = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.heap) - self.stale + len(self.parked)
+
+class HoldQueues:
+    """
+    A class to keep a queue of holds for every item.
+
+    Each item's holds are served in order of the priority of the patron's
+    status when they placed the hold, then of request time.  Placing a hold
+    costs O(log n) in the number of holds on the item; cancelling costs
+    O(1), since the heap entry is left in place and skipped when it is
+    reached.  Handing an item off reads the heap in order without removing
+    the patrons it passes over, so passing over k patrons costs O(k log k)
+    whatever the length of the queue.
+
+    Every item's queue has its own lock.  hand_off holds only that lock
+    while lend runs, so a slow lend (one that waits for an event log, say)
+    delays other changes to that item's holds but not to any other item's.
+
+    When handing an item off, a patron whose status now has no priority
+    (DELINQUENT by default) is parked: their holds are set aside, keeping
+    their place, until reinstate is called for them, so they are not looked
+    at again on every handoff.  A patron who cannot borrow for another
+    reason, for example because they are at their quota, is passed over
+    but stays in the queue.
+
+    Attributes:
+        priorities (tuple): The priority of each status, indexed by status code.
+    """
+
+    def __init__(self, priorities=None, clock=time.time):
+        """
+        Initializes empty HoldQueues.
+
+        Args:
+            priorities (dict, optional): BorrowerStatus -> priority (int, lower first) or None to pass over.
+                Statuses not given keep their default.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.time.
+
+        Raises:
+            ValueError: If a key is not a BorrowerStatus or a priority is neither an integer nor None.
+        """
+        table = dict(DEFAULT_PRIORITIES)
+        for status, priority in (priorities or {}).items():
+            if not isinstance(status, BorrowerStatus):
+                raise ValueError("Invalid Borrower Status.")
+            if priority is not None and (not isinstance(priority, int) or isinstance(priority, bool)):
+                raise ValueError("Priority must be an integer or None.")
+            table[status] = priority
+        self.priorities = tuple(table[status] for status in STATUSES_BY_CODE)
+        self.__clock = clock
+        # Guards the three dictionaries below.  It is only ever taken briefly,
+        # and after an item's queue lock when both are needed.
+        self.__lock = threading.Lock()
+        self.__sequence = itertools.count()
+
+        # item_id -> _Queue for every item with holds.
+        self.__queues = {}
+        # (user_id, item_id) -> the heap or parked entry of every live hold.
+        self.__entries = {}
+        # user_id -> the ids of the items on which the user's holds are parked.
+        self.__parked = {}
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def place(self, user, item_id, now=None):
+        """
+        Places a hold on an item for a user.
+
+        Args:
+            user (LibraryUser): The user waiting for the item.
+            item_id (int): The unique identifier of the item.
+            now (float, optional): When the hold is placed. Defaults to the clock's time.
+
+        Raises:
+            ValueError: If the user already has a hold on the item, or their status has no priority.
+
+        Returns:
+            Hold: The new hold.
+        """
+        priority = self.priorities[user.status.code]
+        if priority is None:
+            raise ValueError("User cannot place holds.")
+        hold = Hold(user.user_id, item_id, self.__clock() if now is None else now, priority)
+        key = (user.user_id, item_id)
+        while True:
+            with self.__lock:
+                queue = self.__queues.get(item_id)
+                if queue is None:
+                    queue = self.__queues[item_id] = _Queue()
+            with queue.lock, self.__lock:
+                # Retry if the queue emptied and was dropped while this thread waited for it.
+                if self.__queues.get(item_id) is not queue:
+                    continue
+                if key in self.__entries:
+                    raise ValueError("Hold already placed.")
+                sequence = next(self.__sequence)
+                entry = [priority, hold.requested_at, sequence, sequence, user, hold]
+                self.__entries[key] = entry
+                heapq.heappush(queue.heap, entry)
+                return hold
+
+    def cancel(self, user_id, item_id):
+        """
+        Cancels a user's hold on an item.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            Hold: The cancelled hold, or None if there was none.
+        """
+        queue = self.__queue_of(item_id)
+        if queue is None:
+            return None
+        with queue.lock, self.__lock:
+            entry = self.__entries.pop((user_id, item_id), None)
+            if entry is None:
+                return None
+            if queue.parked.pop(user_id, None) is not None:
+                self.__unpark(user_id, item_id)
+            else:
+                entry[4] = None
+                queue.stale += 1
+            self.__tidy(item_id, queue)
+            return entry[5]
+
+    def reinstate(self, user):
+        """
+        Puts a parked patron's holds back in their places, if their status now has a priority.
+
+        Call this when a user's status changes, for example when a
+        DELINQUENT user returns their overdue items.
+
+        Args:
+            user (LibraryUser): The user.
+
+        Returns:
+            int: The number of holds put back.
+        """
+        if self.priorities[user.status.code] is None:
+            return 0
+        with self.__lock:
+            item_ids = list(self.__parked.get(user.user_id, ()))
+        restored = 0
+        for item_id in item_ids:
+            queue = self.__queue_of(item_id)
+            if queue is None:
+                continue
+            with queue.lock, self.__lock:
+                # The hold may have been cancelled since the ids were read.
+                entry = queue.parked.pop(user.user_id, None)
+                if entry is not None:
+                    self.__unpark(user.user_id, item_id)
+                    heapq.heappush(queue.heap, entry)
+                    restored += 1
+        return restored
+
+    def hand_off(self, item, lend=None):
+        """
+        Gives a returned item to the first patron in its queue who can take it.
+
+        Patrons are tried in queue order.  The first one for whom lend
+        returns True gets the item and their hold is removed.  Patrons whose
+        status has no priority are parked; others passed over keep their
+        place in the queue.
+
+        Args:
+            item (LibraryItem): The returned item.
+            lend (callable, optional): Called with a LibraryUser; lends them the item and returns True,
+                or returns False if they cannot borrow it.  Defaults to LibraryUser.borrow_item when can_borrow allows.
+
+        Returns:
+            LibraryUser: The patron who received the item, or None if no one in the queue could take it.
+        """
+        if lend is None:
+            lend = lambda user: _borrow(user, item)
+        item_id = item.item_id
+        queue = self.__queue_of(item_id)
+        if queue is None:
+            return None
+        with queue.lock:
+            heap = queue.heap
+            winner = None
+            try:
+                # Visit the heap in order by walking it as a tree: the next entry
+                # is always the smallest child of an entry already visited.
+                frontier = [(heap[0], 0)] if heap else []
+                while frontier:
+                    entry, position = heapq.heappop(frontier)
+                    for child in (2 * position + 1, 2 * position + 2):
+                        if child < len(heap):
+                            heapq.heappush(frontier, (heap[child], child))
+                    user = entry[4]
+                    if user is None:
+                        continue
+                    if self.priorities[user.status.code] is None:
+                        self.__park(item_id, queue, entry)
+                        continue
+                    # An error from lend leaves the hold in place.
+                    if lend(user):
+                        with self.__lock:
+                            del self.__entries[(user.user_id, item_id)]
+                        entry[4] = None
+                        queue.stale += 1
+                        winner = user
+                        break
+            finally:
+                with self.__lock:
+                    self.__tidy(item_id, queue)
+            return winner
+
+    def holds_for(self, item_id):
+        """
+        Returns the holds on an item, in the order they would be served.
+
+        Parked holds are included, in the places they keep.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            list of Hold: The live holds on the item.
+        """
+        queue = self.__queue_of(item_id)
+        if queue is None:
+            return []
+        with queue.lock:
+            entries = [entry for entry in queue.heap if entry[4] is not None] + list(queue.parked.values())
+        return [entry[5] for entry in sorted(entries)]
+
+    def count(self, item_id):
+        """
+        Returns the number of holds on an item, parked ones included.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            int: The number of live holds.
+        """
+        queue = self.__queue_of(item_id)
+        if queue is None:
+            return 0
+        with queue.lock:
+            return len(queue)
+
+    def __queue_of(self, item_id):
+        with self.__lock:
+            return self.__queues.get(item_id)
+
+    def __park(self, item_id, queue, entry):
+        # Set a hold aside in its place; the caller holds the queue's lock.  A copy
+        # is parked and the heap entry left behind as stale, so the heap is not changed.
+        user = entry[4]
+        parked = queue.parked[user.user_id] = [*entry[:3], next(self.__sequence), user, entry[5]]
+        entry[4] = None
+        queue.stale += 1
+        with self.__lock:
+            self.__entries[(user.user_id, item_id)] = parked
+            self.__parked.setdefault(user.user_id, set()).add(item_id)
+
+    def __tidy(self, item_id, queue):
+        # Drop stale entries from the top of the heap, rebuild it when mostly stale,
+        # and forget the queue once it is empty; the caller holds both locks.
+        heap = queue.heap
+        while heap and heap[0][4] is None:
+            heapq.heappop(heap)
+            queue.stale -= 1
+        if not len(queue):
+            del self.__queues[item_id]
+        elif queue.stale > max(len(queue), _MIN_COMPACTION):
+            queue.heap = [entry for entry in heap if entry[4] is not None]
+            heapq.heapify(queue.heap)
+            queue.stale = 0
+
+    def __unpark(self, user_id, item_id):
+        # Forget that a user's hold on an item is parked; the caller holds the shared lock.
+        item_ids = self.__parked[user_id]
+        item_ids.discard(item_id)
+        if not item_ids:
+            del self.__parked[user_id]
+
+def _borrow(user, item):
+    # The default way to lend a held item: as LibraryUser.borrow_item, if can_borrow allows.
+    if not user.can_borrow(item):
+        return False
+    user.borrow_item(item)
+    return True
@@ -0,0 +1,9 @@
+"""
+Description: The ingest package.  It re-exports the public names of
+ingest/ingest.py.
+"""
+
+from .ingest import IngestStats, read_chunks, load_items, load_users, iter_items, iter_users
+
+# The names this package exports.
+__all__ = ["IngestStats", "read_chunks", "load_items", "load_users", "iter_items", "iter_users"]
@@ -0,0 +1,235 @@
+"""
+Description: Streaming loaders that read catalog and patron dumps from 
+CSV or JSON Lines files in fixed-size chunks and yield validated 
+LibraryItem and LibraryUser objects.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# csv, json: Parse the two supported file formats one line at a time.
+# islice: Cuts the lazily parsed rows into fixed-size chunks.
+# perf_counter: Times the load for the throughput report.
+import csv
+import json
+from itertools import islice
+from time import perf_counter
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+from bulk_records import RecordError
+
+# Text values accepted for booleans, matched case-insensitively.  Genres and
+# statuses are parsed by their enumerations' own lookup tables.
+_BOOLEANS = {"true": True, "false": False, "1": True, "0": False, "yes": True, "no": False, "": False}
+
+class IngestStats:
+    """
+    A class to report the progress and throughput of a load.
+
+    Attributes:
+        rows (int): The number of rows read.
+        accepted (int): The number of rows that passed validation.
+        rejected (int): The number of rows sent to the reject sink.
+        elapsed (float): The seconds spent loading so far.
+        rows_per_second (float): The read throughput.
+    """
+
+    def __init__(self):
+        """
+        Initializes the IngestStats with zero counts.
+        """
+        self.rows = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"{self.rows} rows ({self.accepted} accepted, {self.rejected} rejected) "
+                f"in {self.elapsed:.2f}s, {self.rows_per_second:,.0f} rows/s")
+
+def read_chunks(source, file_format=None, chunk_size=10_000):
+    """
+    Lazily reads a CSV or JSON Lines source in chunks of raw records.
+
+    Only one chunk is held in memory at a time.  JSON Lines records that
+    cannot be parsed are yielded as None so their row numbers are kept.
+
+    Args:
+        source (str or file): A path or an open text file.
+        file_format (str, optional): "csv" or "jsonl".  Defaults to the path's extension.
+        chunk_size (int, optional): The number of records per chunk. Defaults to 10,000.
+
+    Raises:
+        ValueError: If the format cannot be determined or chunk_size is not positive.
+
+    Yields:
+        list: The records of the next chunk, as dictionaries.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    file_format = file_format or _format_of(source)
+
+    # Open paths here, and leave files opened by the caller open.
+    file = open(source, newline="", encoding="utf-8") if isinstance(source, str) else source
+    try:
+        if file_format == "csv":
+            records = csv.DictReader(file)
+        else:
+            records = (_parse_json(line) for line in file if line.strip())
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        if file is not source:
+            file.close()
+
+def load_items(source, file_format=None, batch_size=10_000, rejects=None, stats=None):
+    """
+    Streams validated LibraryItem objects from a CSV or JSON Lines source.
+
+    Args:
+        source (str or file): A path or an open text file.
+        file_format (str, optional): "csv" or "jsonl".  Defaults to the path's extension.
+        batch_size (int, optional): The number of rows validated and yielded at a time. Defaults to 10,000.
+        rejects (callable, optional): Called with a RecordError and the raw record for each rejected row.
+        stats (IngestStats, optional): Updated with the counts and throughput of the load.
+
+    Yields:
+        list: The next batch of valid LibraryItem objects.
+    """
+    return _load(source, file_format, batch_size, rejects, stats, _item_record, LibraryItem.from_records)
+
+def load_users(source, file_format=None, batch_size=10_000, rejects=None, stats=None):
+    """
+    Streams validated LibraryUser objects from a CSV or JSON Lines source.
+
+    Args:
+        source (str or file): A path or an open text file.
+        file_format (str, optional): "csv" or "jsonl".  Defaults to the path's extension.
+        batch_size (int, optional): The number of rows validated and yielded at a time. Defaults to 10,000.
+        rejects (callable, optional): Called with a RecordError and the raw record for each rejected row.
+        stats (IngestStats, optional): Updated with the counts and throughput of the load.
+
+    Yields:
+        list: The next batch of valid LibraryUser objects.
+    """
+    return _load(source, file_format, batch_size, rejects, stats, _user_record, LibraryUser.from_records)
+
+def iter_items(source, **options):
+    """
+    Streams validated LibraryItem objects one at a time.
+
+    Args:
+        source (str or file): A path or an open text file.
+        **options: Passed on to load_items.
+
+    Yields:
+        LibraryItem: The next valid item.
+    """
+    for batch in load_items(source, **options):
+        yield from batch
+
+def iter_users(source, **options):
+    """
+    Streams validated LibraryUser objects one at a time.
+
+    Args:
+        source (str or file): A path or an open text file.
+        **options: Passed on to load_users.
+
+    Yields:
+        LibraryUser: The next valid user.
+    """
+    for batch in load_users(source, **options):
+        yield from batch
+
+def _load(source, file_format, batch_size, rejects, stats, convert, from_records):
+    # Shared pipeline: read a chunk, convert text fields, validate the batch, report rejects.
+    stats = stats if stats is not None else IngestStats()
+    started = perf_counter()
+    offset = 0
+    for chunk in read_chunks(source, file_format, batch_size):
+        records = [convert(record) if record is not None else {} for record in chunk]
+        valid, errors = from_records(records)
+
+        for error in errors:
+            # Unparseable lines are reported as such rather than as their first failing field.
+            message = "Invalid record." if chunk[error.row] is None else error.message
+            if rejects is not None:
+                rejects(RecordError(offset + error.row, message), chunk[error.row])
+
+        offset += len(chunk)
+        stats.rows += len(chunk)
+        stats.accepted += len(valid)
+        stats.rejected += len(errors)
+        stats.elapsed = perf_counter() - started
+        if valid:
+            yield valid
+
+def _item_record(record):
+    # Convert the text fields of a raw item record to their Python types.
+    return {
+        "item_id": _to_int(record.get("item_id")),
+        "title": record.get("title"),
+        "author": record.get("author"),
+        "publication_year": _to_int(record.get("publication_year")),
+        "genre": _parse(record.get("genre"), Genre.parse),
+        "is_borrowed": _to_enum(record.get("is_borrowed", False), _BOOLEANS),
+    }
+
+def _user_record(record):
+    # Convert the text fields of a raw user record to their Python types.
+    return {
+        "user_id": _to_int(record.get("user_id")),
+        "name": record.get("name"),
+        "email": record.get("email"),
+        "status": _parse(record.get("status"), BorrowerStatus.parse),
+    }
+
+def _to_int(value):
+    # Convert numeric text to an int; anything else is left for validation to reject.
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+def _to_enum(value, table):
+    # Look text up in a table; non-text values (e.g. JSON booleans) pass through unchanged.
+    if isinstance(value, str):
+        return table.get(value.strip().lower(), value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return table.get(str(value), value)
+    return value
+
+def _parse(value, parse):
+    # Parse a value with an enumeration's parse helper; values it rejects are left for validation to reject.
+    try:
+        return parse(value)
+    except ValueError:
+        return value
+
+def _parse_json(line):
+    # Parse one JSON Lines record; malformed lines and non-objects become None.
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+def _format_of(source):
+    # Work out the file format from the path's extension.
+    name = source if isinstance(source, str) else getattr(source, "name", "")
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise ValueError("Unknown file format.")
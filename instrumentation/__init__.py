@@ -0,0 +1,9 @@
+"""
+Description: The instrumentation package.  It re-exports the public names of
+instrumentation/instrumentation.py.
+"""
+
+from .instrumentation import LatencyHistogram, Metrics, enable, disable, is_enabled
+
+# The names this package exports.
+__all__ = ["LatencyHistogram", "Metrics", "enable", "disable", "is_enabled"]
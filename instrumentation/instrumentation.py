@@ -0,0 +1,352 @@
+"""
+Description: Optional instrumentation of the model hot paths: call counts,
+HDR-style latency histograms and rejection reasons, exported in the
+Prometheus text format.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# os, tempfile: Write the dump file atomically, so a scraper never reads half of it.
+# perf_counter_ns: Times the sampled calls.
+# BorrowerStatus: Identifies DELINQUENT users when explaining a refusal.
+import os
+import tempfile
+from time import perf_counter_ns
+from borrower_status import BorrowerStatus
+
+# Each power of two is split into 2 ** _SUB_BITS linear sub-buckets, so a
+# recorded latency is off by at most 1 / 2 ** _SUB_BITS (about 6%).
+_SUB_BITS = 4
+_SUB_COUNT = 1 << _SUB_BITS
+
+# The Prometheus bucket bounds, in nanoseconds: powers of two from 64 ns to
+# about 17 s.  They coincide with histogram bucket edges, so the exported
+# counts need no interpolation.
+_EXPORT_BOUNDS = [1 << power for power in range(6, 35)]
+_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+class LatencyHistogram:
+    """
+    A class to record latencies with bounded relative error, in the manner
+    of an HDR histogram.
+
+    Values below 2 ** (_SUB_BITS + 1) ns get one bucket each; above that,
+    every power of two is split into _SUB_COUNT equal buckets.  Recording a
+    value is a couple of integer operations and one list increment, and the
+    histogram is a fixed list of 1,024 buckets covering every 64-bit value.
+
+    Attributes:
+        count (int): The number of values recorded.
+        total (int): The sum of the values recorded, in nanoseconds.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty LatencyHistogram.
+        """
+        self.__counts = [0] * (64 * _SUB_COUNT)
+        self.count = 0
+        self.total = 0
+
+    def record(self, nanoseconds):
+        """
+        Records one latency.
+
+        Args:
+            nanoseconds (int): The latency, in nanoseconds.
+        """
+        self.__counts[_bucket(nanoseconds)] += 1
+        self.count += 1
+        self.total += nanoseconds
+
+    def percentile(self, fraction):
+        """
+        Returns the latency below which the given fraction of values fall.
+
+        Args:
+            fraction (float): Between 0 and 1, e.g. 0.99 for the 99th percentile.
+
+        Returns:
+            int: The upper edge of the bucket holding that percentile, in nanoseconds, or 0 if empty.
+        """
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.__counts):
+            seen += count
+            if count and seen >= target:
+                return _upper_edge(index)
+        return 0
+
+    def cumulative(self, bounds):
+        """
+        Returns the number of values at or below each bound.
+
+        Args:
+            bounds (list of int): Increasing bucket edges, in nanoseconds.
+
+        Returns:
+            list of int: One cumulative count per bound.
+        """
+        results = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            while index < len(self.__counts) and _upper_edge(index) <= bound:
+                seen += self.__counts[index]
+                index += 1
+            results.append(seen)
+        return results
+
+class Metrics:
+    """
+    A class to hold the counters and histograms of instrumented calls.
+
+    Attributes:
+        sample_every (int): One call in this many is timed.
+    """
+
+    def __init__(self, sample_every=1):
+        """
+        Initializes an empty Metrics registry.
+
+        Args:
+            sample_every (int, optional): One call in this many is timed. Defaults to 1.
+
+        Raises:
+            ValueError: If sample_every is not a positive integer.
+        """
+        if not isinstance(sample_every, int) or sample_every <= 0:
+            raise ValueError("Sample every must be a positive integer.")
+        self.sample_every = sample_every
+        self.histograms = {}
+        self.rejections = {}
+        self.refusals = {}
+        self.__calls = {}
+
+    def histogram(self, operation):
+        """Returns the latency histogram of an operation, creating it if needed."""
+        return self.histograms.setdefault(operation, LatencyHistogram())
+
+    def track_calls(self, operation, counter):
+        """Registers a function that returns the number of calls made to an operation."""
+        self.__calls[operation] = counter
+
+    def calls(self, operation):
+        """Returns the number of calls made to an operation."""
+        counter = self.__calls.get(operation)
+        return counter() if counter is not None else 0
+
+    def reject(self, operation, reason):
+        """Counts a call that raised ValueError, by its message."""
+        key = (operation, reason)
+        self.rejections[key] = self.rejections.get(key, 0) + 1
+
+    def refuse(self, cause):
+        """Counts a can_borrow call that returned False, by its cause."""
+        self.refusals[cause] = self.refusals.get(cause, 0) + 1
+
+    def to_prometheus(self):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = ["# HELP library_calls_total Calls made to each instrumented operation.",
+                 "# TYPE library_calls_total counter"]
+        for operation in sorted(self.__calls):
+            lines.append(f'library_calls_total{{operation="{_escape(operation)}"}} {self.calls(operation)}')
+
+        lines += [f"# HELP library_call_duration_seconds Latency of one in {self.sample_every} calls.",
+                  "# TYPE library_call_duration_seconds histogram"]
+        for operation in sorted(self.histograms):
+            histogram = self.histograms[operation]
+            label = f'operation="{_escape(operation)}"'
+            for bound, count in zip(_EXPORT_BOUNDS, histogram.cumulative(_EXPORT_BOUNDS)):
+                lines.append(f'library_call_duration_seconds_bucket{{{label},le="{bound / 1e9:.9g}"}} {count}')
+            lines.append(f'library_call_duration_seconds_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"library_call_duration_seconds_sum{{{label}}} {histogram.total / 1e9:.9g}")
+            lines.append(f"library_call_duration_seconds_count{{{label}}} {histogram.count}")
+
+        lines += ["# HELP library_call_duration_quantile_seconds Latency percentiles from the HDR histogram.",
+                  "# TYPE library_call_duration_quantile_seconds gauge"]
+        for operation in sorted(self.histograms):
+            histogram = self.histograms[operation]
+            for quantile in _QUANTILES:
+                lines.append(f'library_call_duration_quantile_seconds{{operation="{_escape(operation)}",'
+                             f'quantile="{quantile}"}} {histogram.percentile(quantile) / 1e9:.9g}')
+
+        lines += ["# HELP library_rejections_total Calls rejected with ValueError, by message.",
+                  "# TYPE library_rejections_total counter"]
+        for (operation, reason), count in sorted(self.rejections.items()):
+            lines.append(f'library_rejections_total{{operation="{_escape(operation)}",'
+                         f'reason="{_escape(reason)}"}} {count}')
+
+        lines += ["# HELP library_borrow_refusals_total can_borrow calls that returned False, by cause.",
+                  "# TYPE library_borrow_refusals_total counter"]
+        for cause, count in sorted(self.refusals.items()):
+            lines.append(f'library_borrow_refusals_total{{cause="{_escape(cause)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        Writes the metrics to a file for a local scraper, replacing it atomically.
+
+        Args:
+            path (str): The dump file, e.g. one read by node_exporter's textfile collector.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(self.to_prometheus())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+# The methods replaced by enable(), as (class, name) -> original function.
+_originals = {}
+
+def enable(sample_every=16):
+    """
+    Starts instrumenting the model hot paths.
+
+    LibraryItem and LibraryUser construction, can_borrow, borrow_item and
+    return_item are replaced by wrappers that count every call and its
+    rejections and time one call in sample_every.  While disabled, the
+    original methods are in place and cost nothing extra.  The counters
+    take no locks, so calls racing on several threads may occasionally
+    go uncounted.
+
+    Args:
+        sample_every (int, optional): One call in this many is timed. Defaults to 16.
+
+    Raises:
+        ValueError: If sample_every is not a positive integer.
+
+    Returns:
+        Metrics: The registry the wrappers record into.
+    """
+    from library_item import LibraryItem
+    from library_user import LibraryUser
+
+    disable()
+    metrics = Metrics(sample_every)
+    targets = [(LibraryItem, "__init__", "LibraryItem"), (LibraryUser, "__init__", "LibraryUser"),
+               (LibraryUser, "can_borrow", "can_borrow"), (LibraryUser, "borrow_item", "borrow_item"),
+               (LibraryUser, "return_item", "return_item")]
+    for cls, name, operation in targets:
+        original = cls.__dict__[name]
+        _originals[(cls, name)] = original
+        wrap = _wrap_can_borrow if name == "can_borrow" else _wrap
+        setattr(cls, name, wrap(original, operation, metrics, sample_every))
+    return metrics
+
+def disable():
+    """
+    Stops instrumenting, restoring the original methods.
+    """
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+def is_enabled():
+    """Returns True while the hot paths are instrumented."""
+    return bool(_originals)
+
+def _wrap(function, operation, metrics, sample_every):
+    # Count every call with a countdown and time only the call that reaches zero.
+    # The exact call count is rebuilt from the countdown when it is read.
+    histogram = metrics.histogram(operation)
+    countdown = sample_every
+    sampled = 0
+
+    def calls():
+        return sampled * sample_every + sample_every - countdown
+
+    def wrapper(*args, **kwargs):
+        nonlocal countdown, sampled
+        countdown -= 1
+        if countdown:
+            try:
+                return function(*args, **kwargs)
+            except ValueError as error:
+                metrics.reject(operation, str(error))
+                raise
+        countdown = sample_every
+        sampled += 1
+        started = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        except ValueError as error:
+            metrics.reject(operation, str(error))
+            raise
+        finally:
+            histogram.record(perf_counter_ns() - started)
+
+    metrics.track_calls(operation, calls)
+    return _named(wrapper, function)
+
+def _wrap_can_borrow(function, operation, metrics, sample_every):
+    # As _wrap, for can_borrow: it raises nothing, but each refusal is counted by cause.
+    histogram = metrics.histogram(operation)
+    countdown = sample_every
+    sampled = 0
+
+    def calls():
+        return sampled * sample_every + sample_every - countdown
+
+    def wrapper(self, item):
+        nonlocal countdown, sampled
+        countdown -= 1
+        if countdown:
+            if function(self, item):
+                return True
+        else:
+            countdown = sample_every
+            sampled += 1
+            started = perf_counter_ns()
+            result = function(self, item)
+            histogram.record(perf_counter_ns() - started)
+            if result:
+                return True
+        metrics.refuse(_refusal_cause(self, item))
+        return False
+
+    metrics.track_calls(operation, calls)
+    return _named(wrapper, function)
+
+def _named(wrapper, function):
+    # Make a wrapper look like the function it wraps.
+    wrapper.__wrapped__ = function
+    wrapper.__name__ = function.__name__
+    wrapper.__qualname__ = function.__qualname__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+def _refusal_cause(user, item):
+    # Work out why can_borrow returned False, checking in the same order it does.
+    if user.status == BorrowerStatus.DELINQUENT:
+        return "delinquent"
+    if not user.can_borrow_more:
+        return "quota"
+    return "item borrowed"
+
+def _bucket(value):
+    # The index of the histogram bucket holding a non-negative value.
+    shift = value.bit_length() - _SUB_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << _SUB_BITS) + (value >> shift)
+
+def _upper_edge(index):
+    # The smallest value above the bucket at index.
+    shift = (index >> _SUB_BITS) - 1
+    if shift <= 0:
+        return index + 1
+    return ((index & (_SUB_COUNT - 1)) + _SUB_COUNT + 1) << shift
+
+def _escape(value):
+    # Escape a label value for the Prometheus text format.
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,9 @@
+"""
+Description: The item_table package.  It re-exports the public names of
+item_table/item_table.py.
+"""
+
+from .item_table import StringPool, StringHeap, ItemView, ItemTable
+
+# The names this package exports.
+__all__ = ["StringPool", "StringHeap", "ItemView", "ItemTable"]
@@ -0,0 +1,310 @@
+"""
+Description: A columnar, array-backed table of library items for catalogs 
+too large to hold as one Python object per item.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# array: Compact typed columns for the numeric fields and string offsets.
+# LibraryItem: Supplies the validation rules shared by every item representation.
+# GENRES_BY_CODE: Genres are stored as their one-byte codes and decoded with this table.
+from array import array
+from library_item import LibraryItem
+from genre import GENRES_BY_CODE
+
+class StringPool:
+    """
+    A class to intern strings so that repeated values are stored once.
+
+    Each distinct string is given a small integer handle which the table
+    stores in place of the string itself.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty StringPool.
+        """
+        self.__strings = []
+        self.__handles = {}
+
+    def __len__(self):
+        return len(self.__strings)
+
+    def intern(self, value):
+        """
+        Returns the handle for a string, adding it to the pool if needed.
+
+        Args:
+            value (str): The string to intern.
+
+        Returns:
+            int: The handle of the string.
+        """
+        handle = self.__handles.get(value)
+        if handle is None:
+            handle = self.__handles[value] = len(self.__strings)
+            self.__strings.append(value)
+        return handle
+
+    def lookup(self, handle):
+        """
+        Returns the string for a handle.
+
+        Args:
+            handle (int): A handle returned by intern.
+
+        Returns:
+            str: The interned string.
+        """
+        return self.__strings[handle]
+
+class StringHeap:
+    """
+    A class to store many mostly distinct strings as one UTF-8 byte buffer.
+
+    Strings are appended in order and looked up by position, so the heap 
+    costs the encoded bytes plus one offset per string.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty StringHeap.
+        """
+        self.__data = bytearray()
+        self.__offsets = array("Q", [0])
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def append(self, value):
+        """
+        Appends a string to the heap.
+
+        Args:
+            value (str): The string to store.
+
+        Returns:
+            int: The position of the string.
+        """
+        self.__data += value.encode("utf-8")
+        self.__offsets.append(len(self.__data))
+        return len(self.__offsets) - 2
+
+    def lookup(self, position):
+        """
+        Returns the string stored at a position.
+
+        Args:
+            position (int): A position returned by append.
+
+        Returns:
+            str: The decoded string.
+        """
+        return self.__data[self.__offsets[position]:self.__offsets[position + 1]].decode("utf-8")
+
+class ItemView:
+    """
+    A lightweight, LibraryItem-compatible view of one row of an ItemTable.
+
+    Views hold no data of their own; every property reads the table's columns,
+    and setting is_borrowed updates the table in place.
+    """
+
+    __slots__ = ("__table", "__row")
+
+    def __init__(self, table, row):
+        """
+        Initializes the ItemView over a row of a table.
+
+        Args:
+            table (ItemTable): The table holding the item.
+            row (int): The position of the item in the table.
+        """
+        self.__table = table
+        self.__row = row
+
+    @property
+    def item_id(self):
+        return self.__table.item_id_at(self.__row)
+
+    @property
+    def title(self):
+        return self.__table.title_at(self.__row)
+
+    @property
+    def author(self):
+        return self.__table.author_at(self.__row)
+
+    @property
+    def publication_year(self):
+        return self.__table.publication_year_at(self.__row)
+
+    @property
+    def genre(self):
+        return self.__table.genre_at(self.__row)
+
+    @property
+    def is_borrowed(self):
+        return self.__table.is_borrowed_at(self.__row)
+
+    @is_borrowed.setter
+    def is_borrowed(self, value):
+        self.__table.set_borrowed_at(self.__row, value)
+
+class ItemTable:
+    """
+    A class to store library items column by column.
+
+    Ids and publication years are kept in typed arrays, the genre in a one
+    byte code column and is_borrowed in a bitset.  Titles are nearly all 
+    distinct, so they are kept in a UTF-8 string heap in row order, while 
+    authors repeat and are stored as handles into an interned string pool.  Rows are handed out as ItemView 
+    objects on demand, so no per-item Python object is kept alive.
+    """
+
+    def __init__(self, items=()):
+        """
+        Initializes the ItemTable, optionally loading it with items.
+
+        Args:
+            items (iterable, optional): LibraryItem-compatible objects to append.
+
+        Raises:
+            ValueError: If an item fails LibraryItem validation.
+        """
+        self.__ids = array("q")
+        self.__years = array("i")
+        self.__genres = array("B")
+        self.__authors = array("I")
+        self.__borrowed = bytearray()
+        self.__titles = StringHeap()
+        self.__author_pool = StringPool()
+
+        # Ids appended in ascending order allow binary search in find.
+        self.__sorted = True
+
+        for item in items:
+            self.append(item.item_id, item.title, item.author, item.publication_year, item.genre, item.is_borrowed)
+
+    def __len__(self):
+        return len(self.__ids)
+
+    def __getitem__(self, row):
+        # Support negative positions like a list.
+        if row < 0:
+            row += len(self.__ids)
+        if not 0 <= row < len(self.__ids):
+            raise IndexError("Row out of range.")
+        return ItemView(self, row)
+
+    def __iter__(self):
+        for row in range(len(self.__ids)):
+            yield ItemView(self, row)
+
+    def append(self, item_id, title, author, publication_year, genre, is_borrowed=False):
+        """
+        Validates an item and appends it as a new row.
+
+        Args:
+            item_id (int): The unique identifier for the library item.
+            title (str): The title of the library item.
+            author (str): The author of the library item.
+            publication_year (int): The year the library item was published.
+            genre (Genre): The genre of the library item.
+            is_borrowed (bool, optional): Indicates if the item is currently borrowed. Defaults to False.
+
+        Raises:
+            ValueError: If the item is invalid or publication_year is not an integer.
+
+        Returns:
+            ItemView: A view of the new row.
+        """
+        LibraryItem.validate(item_id, title, author, genre, is_borrowed)
+
+        # The year column is a typed array, so the year must be an integer.
+        if not isinstance(publication_year, int):
+            raise ValueError("Publication Year must be numeric.")
+
+        row = len(self.__ids)
+        if row and item_id <= self.__ids[-1]:
+            self.__sorted = False
+
+        self.__ids.append(item_id)
+        self.__years.append(publication_year)
+        self.__genres.append(genre.code)
+        self.__titles.append(title)
+        self.__authors.append(self.__author_pool.intern(author))
+
+        # Grow the bitset by one byte every eight rows.
+        if row % 8 == 0:
+            self.__borrowed.append(0)
+        if is_borrowed:
+            self.__borrowed[row >> 3] |= 1 << (row & 7)
+        return ItemView(self, row)
+
+    def find(self, item_id):
+        """
+        Returns a view of the item with the given item_id.
+
+        Uses binary search while ids have been appended in ascending order,
+        and a linear scan of the id column otherwise.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            ItemView: A view of the matching row, or None if not found.
+        """
+        ids = self.__ids
+        if self.__sorted:
+            low, high = 0, len(ids)
+            while low < high:
+                middle = (low + high) // 2
+                if ids[middle] < item_id:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low < len(ids) and ids[low] == item_id:
+                return ItemView(self, low)
+            return None
+        try:
+            return ItemView(self, ids.index(item_id))
+        except ValueError:
+            return None
+
+    def item_id_at(self, row):
+        return self.__ids[row]
+
+    def title_at(self, row):
+        return self.__titles.lookup(row)
+
+    def author_at(self, row):
+        return self.__author_pool.lookup(self.__authors[row])
+
+    def publication_year_at(self, row):
+        return self.__years[row]
+
+    def genre_at(self, row):
+        return GENRES_BY_CODE[self.__genres[row]]
+
+    def is_borrowed_at(self, row):
+        return bool(self.__borrowed[row >> 3] & (1 << (row & 7)))
+
+    def set_borrowed_at(self, row, value):
+        """
+        Changes the borrowed status of a row in place.
+
+        Args:
+            row (int): The position of the item in the table.
+            value (bool): The new borrowed status.
+
+        Raises:
+            ValueError: If value is not a boolean.
+        """
+        # Ensure that is_borrowed is a boolean value.
+        if not isinstance(value, bool):
+            raise ValueError("Is Borrowed must be a boolean value.")
+        if value:
+            self.__borrowed[row >> 3] |= 1 << (row & 7)
+        else:
+            self.__borrowed[row >> 3] &= ~(1 << (row & 7)) & 0xFF
@@ -0,0 +1,9 @@
+"""
+Description: The library_item package.  It re-exports the public names of
+library_item/library_item.py.
+"""
+
+from .library_item import LibraryItem, SlottedLibraryItem
+
+# The names this package exports.
+__all__ = ["LibraryItem", "SlottedLibraryItem"]
@@ -4,12 +4,27 @@ Author: Apurba Khan
 Date: 2024-09-14
 """
 
-# Import the LibraryItem class (although not needed here as we are defining it)
-from library_item import LibraryItem
-
 # Import the Genre enum to categorize the library item by genre.
 from genre import Genre
 
+# Import the helpers used by the bulk record API.
+from bulk_records import record_columns, apply_rules, gather, instance_of, greater_than, non_blank
+
+# The fields of a library item, in constructor order.
+_FIELDS = ("item_id", "title", "author", "publication_year", "genre", "is_borrowed")
+
+# The constructor's validation rules, in order, as whole-column tests for the bulk record API.
+_RULES = [
+    ("item_id", instance_of(int), "Item Id must be numeric."),
+    ("item_id", greater_than(99), "Invalid Item Id."),
+    ("title", instance_of(str), "Title cannot be blank."),
+    ("title", non_blank, "Title cannot be blank."),
+    ("author", instance_of(str), "Author cannot be blank."),
+    ("author", non_blank, "Author cannot be blank."),
+    ("genre", instance_of(Genre), "Invalid Genre."),
+    ("is_borrowed", instance_of(bool), "Is Borrowed must be a boolean value."),
+]
+
 class LibraryItem:
     """
     A class to represent a library item in a library.
@@ -35,6 +50,34 @@ class LibraryItem:
             genre (Genre): The genre of the library item.
             is_borrowed (bool, optional): Indicates if the item is currently borrowed. Defaults to False.
 
+        Raises:
+            ValueError: If item_id is not an integer, title or author is blank, genre is invalid, or is_borrowed is not a boolean.
+        """
+        # Validate every argument before any attribute is assigned.
+        LibraryItem.validate(item_id, title, author, genre, is_borrowed)
+
+        # If all validations pass, assign the values to the private attributes.
+        self.__item_id = item_id
+        self.__title = title
+        self.__author = author
+        self.__publication_year = publication_year
+        self.__genre = genre
+        self.__is_borrowed = is_borrowed
+
+    @staticmethod
+    def validate(item_id, title, author, genre, is_borrowed):
+        """
+        Validates the arguments of a library item.
+
+        Shared by every LibraryItem representation so they all enforce the same rules.
+
+        Args:
+            item_id (int): The unique identifier for the library item.
+            title (str): The title of the library item.
+            author (str): The author of the library item.
+            genre (Genre): The genre of the library item.
+            is_borrowed (bool): Indicates if the item is currently borrowed.
+
         Raises:
             ValueError: If item_id is not an integer, title or author is blank, genre is invalid, or is_borrowed is not a boolean.
         """
@@ -54,21 +97,47 @@ class LibraryItem:
         if not author.strip():
             raise ValueError("Author cannot be blank.")
 
-        # Validate that the genre is a valid Genre enum.
-        if genre not in Genre:
+        # Validate that the genre is a valid Genre enum.  An isinstance check
+        # is constant time and, unlike "in Genre", never raises for non-members.
+        if not isinstance(genre, Genre):
             raise ValueError("Invalid Genre.")
 
         # Ensure that is_borrowed is a boolean value.
         if not isinstance(is_borrowed, bool):
             raise ValueError("Is Borrowed must be a boolean value.")
-        
-        # If all validations pass, assign the values to the private attributes.
-        self.__item_id = item_id
-        self.__title = title
-        self.__author = author
-        self.__publication_year = publication_year
-        self.__genre = genre
-        self.__is_borrowed = is_borrowed
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Validates and creates many library items in one pass.
+
+        Each rule is applied to the whole batch at once, in the same order as
+        the constructor, and rows that fail a rule are reported instead of 
+        raising.  Non-string titles and authors are reported as blank.
+
+        Args:
+            records (iterable): Mappings keyed by field name, or sequences in constructor order.
+
+        Returns:
+            tuple: A list of the valid LibraryItem objects and a list of RecordError for the rejected rows.
+        """
+        columns = record_columns(records, _FIELDS, {"is_borrowed": False})
+        rows, errors = apply_rules(columns, _RULES)
+
+        # Build the items directly; their values have already been validated.
+        items = []
+        append = items.append
+        new = object.__new__
+        for item_id, title, author, publication_year, genre, is_borrowed in zip(*gather(columns, _FIELDS, rows)):
+            item = new(cls)
+            item.__item_id = item_id
+            item.__title = title
+            item.__author = author
+            item.__publication_year = publication_year
+            item.__genre = genre
+            item.__is_borrowed = is_borrowed
+            append(item)
+        return items, errors
 
     # Property to access the private item_id attribute.
     @property
@@ -99,3 +168,85 @@ class LibraryItem:
     @property
     def is_borrowed(self):
         return self.__is_borrowed
+
+    # Mutator for the is_borrowed attribute, used when an item is borrowed or returned.
+    @is_borrowed.setter
+    def is_borrowed(self, value):
+        # Ensure that is_borrowed is a boolean value.
+        if not isinstance(value, bool):
+            raise ValueError("Is Borrowed must be a boolean value.")
+        self.__is_borrowed = value
+
+
+class SlottedLibraryItem:
+    """
+    A compact variant of LibraryItem for large catalogs.
+
+    The attributes are stored in __slots__ instead of a per-object __dict__,
+    which roughly halves the memory used by each item.  It validates its 
+    arguments with the same rules and exposes the same properties as LibraryItem.
+
+    Attributes:
+        item_id (int): The unique identifier for the library item.
+        title (str): The title of the library item.
+        author (str): The author of the library item.
+        publication_year (int): The year the library item was published.
+        genre (Genre): The genre of the library item.
+        is_borrowed (bool): Identifies whether the library item is borrowed (True) or available (False).
+    """
+
+    __slots__ = ("__item_id", "__title", "__author", "__publication_year", "__genre", "__is_borrowed")
+
+    def __init__(self, item_id, title, author, publication_year, genre, is_borrowed=False):
+        """
+        Initializes the SlottedLibraryItem with item_id, title, author, publication_year, genre, and is_borrowed.
+
+        Args:
+            item_id (int): The unique identifier for the library item.
+            title (str): The title of the library item.
+            author (str): The author of the library item.
+            publication_year (int): The year the library item was published.
+            genre (Genre): The genre of the library item.
+            is_borrowed (bool, optional): Indicates if the item is currently borrowed. Defaults to False.
+
+        Raises:
+            ValueError: If item_id is not an integer, title or author is blank, genre is invalid, or is_borrowed is not a boolean.
+        """
+        LibraryItem.validate(item_id, title, author, genre, is_borrowed)
+        self.__item_id = item_id
+        self.__title = title
+        self.__author = author
+        self.__publication_year = publication_year
+        self.__genre = genre
+        self.__is_borrowed = is_borrowed
+
+    @property
+    def item_id(self):
+        return self.__item_id
+
+    @property
+    def title(self):
+        return self.__title
+
+    @property
+    def author(self):
+        return self.__author
+
+    @property
+    def publication_year(self):
+        return self.__publication_year
+
+    @property
+    def genre(self):
+        return self.__genre
+
+    @property
+    def is_borrowed(self):
+        return self.__is_borrowed
+
+    @is_borrowed.setter
+    def is_borrowed(self, value):
+        # Ensure that is_borrowed is a boolean value.
+        if not isinstance(value, bool):
+            raise ValueError("Is Borrowed must be a boolean value.")
+        self.__is_borrowed = value
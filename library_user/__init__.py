@@ -0,0 +1,9 @@
+"""
+Description: The library_user package.  It re-exports the public names of
+library_user/library_user.py.
+"""
+
+from .library_user import LibraryUser, DEFAULT_QUOTAS
+
+# The names this package exports.
+__all__ = ["LibraryUser", "DEFAULT_QUOTAS"]
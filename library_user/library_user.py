@@ -5,12 +5,35 @@ Date: 2024-09-14
 """
 
 # Importing necessary modules and enumerations.
-# re: Used for validating email addresses.
-# Genre: To define genres for items the user may borrow.
 # BorrowerStatus: To track the user's borrowing status.
-import re
-from genre import Genre
-from borrower_status import BorrowerStatus
+# validation: Precompiled checks for user ids, names and emails.
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+from validation import is_valid_user_id, is_valid_name, is_valid_email, valid_emails
+
+# Import the helpers used by the bulk record API.
+from bulk_records import record_columns, apply_rules, gather, instance_of, greater_than, non_blank
+
+# The fields of a library user, in constructor order.
+_FIELDS = ("user_id", "name", "email", "status")
+
+# The constructor's validation rules, in order, as whole-column tests for the bulk record API.
+_RULES = [
+    ("user_id", instance_of(int), "User Id must be numeric."),
+    ("user_id", greater_than(99), "Invalid User Id."),
+    ("name", instance_of(str), "Name cannot be blank."),
+    ("name", non_blank, "Name cannot be blank."),
+    ("email", instance_of(str), "Invalid email address."),
+    ("email", valid_emails, "Invalid email address."),
+    ("status", instance_of(BorrowerStatus), "Invalid Borrower Status."),
+]
+
+# The default number of items a user of each status may hold at once.
+DEFAULT_QUOTAS = {
+    BorrowerStatus.ACTIVE: 10,
+    BorrowerStatus.INACTIVE: 10,
+    BorrowerStatus.DELINQUENT: 0,
+    BorrowerStatus.MINOR: 3,
+}
 
 class LibraryUser:
     """
@@ -21,7 +44,13 @@ class LibraryUser:
         name (str): The name of the library user.
         email (str): The email of the library user.
         status (BorrowerStatus): The status of the library user (e.g., ACTIVE, DELINQUENT).
+        loans (tuple of int): The ids of the items the user holds.
+        overdue (tuple of int): The ids of the items the user holds that are overdue.
     """
+
+    # The borrowing quota of each status, indexed by status code so that
+    # can_borrow needs no enum hashing.  Change it with set_quotas.
+    _quotas = tuple(DEFAULT_QUOTAS[status] for status in STATUSES_BY_CODE)
     
     def __init__(self, user_id, name, email, status):
         """
@@ -41,19 +70,19 @@ class LibraryUser:
             raise ValueError("User Id must be numeric.")
         
         # Validate that user_id is greater than 99.
-        if user_id <= 99:
+        if not is_valid_user_id(user_id):
             raise ValueError("Invalid User Id.")
 
         # Check that the name is not empty or just spaces.
-        if not name.strip():
+        if not is_valid_name(name):
             raise ValueError("Name cannot be blank.")
         
-        # Validate the email address using a regular expression pattern.
-        if not email.strip() or not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        # Validate the email address against the precompiled pattern.
+        if not is_valid_email(email):
             raise ValueError("Invalid email address.")
 
         # Check if the status is a valid BorrowerStatus enum value.
-        if status not in BorrowerStatus:
+        if not isinstance(status, BorrowerStatus):
             raise ValueError("Invalid Borrower Status.")
         
         # Assign validated values to private attributes.
@@ -61,6 +90,41 @@ class LibraryUser:
         self.__name = name
         self.__email = email
         self.__status = status
+        self.__loans = ()
+        self.__overdue = ()
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Validates and creates many library users in one pass.
+
+        Each rule is applied to the whole batch at once, in the same order as
+        the constructor, and rows that fail a rule are reported instead of 
+        raising.  Non-string names and emails are reported as invalid.
+
+        Args:
+            records (iterable): Mappings keyed by field name, or sequences in constructor order.
+
+        Returns:
+            tuple: A list of the valid LibraryUser objects and a list of RecordError for the rejected rows.
+        """
+        columns = record_columns(records, _FIELDS, {})
+        rows, errors = apply_rules(columns, _RULES)
+
+        # Build the users directly; their values have already been validated.
+        users = []
+        append = users.append
+        new = object.__new__
+        for user_id, name, email, status in zip(*gather(columns, _FIELDS, rows)):
+            user = new(cls)
+            user.__user_id = user_id
+            user.__name = name
+            user.__email = email
+            user.__status = status
+            user.__loans = ()
+            user.__overdue = ()
+            append(user)
+        return users, errors
 
     # Property for accessing user_id.
     @property
@@ -82,6 +146,65 @@ class LibraryUser:
     def status(self):
         return self.__status
 
+    # Mutator for the status attribute, used when a loan becomes overdue.
+    @status.setter
+    def status(self, value):
+        # Ensure that status is a valid BorrowerStatus enum value.
+        if not isinstance(value, BorrowerStatus):
+            raise ValueError("Invalid Borrower Status.")
+        self.__status = value
+
+    # Property for accessing the ids of the items the user holds.
+    @property
+    def loans(self):
+        return self.__loans
+
+    # Property for accessing the ids of the user's overdue items.
+    @property
+    def overdue(self):
+        return self.__overdue
+
+    # Property to check whether the user is below the quota for their status.
+    @property
+    def can_borrow_more(self):
+        return self.__status != BorrowerStatus.DELINQUENT and len(self.__loans) < self._quotas[self.__status.code]
+
+    @classmethod
+    def set_quotas(cls, quotas):
+        """
+        Sets how many items a user of each status may hold at once.
+
+        Statuses not given keep their current quota.  DELINQUENT users can
+        never borrow, whatever their quota.
+
+        Args:
+            quotas (dict): BorrowerStatus -> the maximum number of items on loan.
+
+        Raises:
+            ValueError: If a key is not a BorrowerStatus or a quota is not a non-negative integer.
+        """
+        table = list(cls._quotas)
+        for status, quota in quotas.items():
+            if not isinstance(status, BorrowerStatus):
+                raise ValueError("Invalid Borrower Status.")
+            if not isinstance(quota, int) or isinstance(quota, bool) or quota < 0:
+                raise ValueError("Quota must be a non-negative integer.")
+            table[status.code] = quota
+        cls._quotas = tuple(table)
+
+    @classmethod
+    def quota_for(cls, status):
+        """
+        Returns how many items a user of the given status may hold at once.
+
+        Args:
+            status (BorrowerStatus): The status.
+
+        Returns:
+            int: The quota.
+        """
+        return cls._quotas[status.code]
+
     def borrow_item(self, item):
         """
         Determines if the user can borrow an item.
@@ -90,7 +213,7 @@ class LibraryUser:
             item (LibraryItem): The item to be borrowed.
 
         Raises:
-            Exception: If the user cannot borrow the item due to a delinquent status or if the item is already borrowed.
+            Exception: If the user cannot borrow the item due to a delinquent status, a full quota, or if the item is already borrowed.
         
         Returns:
             str: A message indicating the borrowing status.
@@ -99,25 +222,95 @@ class LibraryUser:
         if not self.can_borrow(item):
             raise Exception(f"{self.__name} cannot borrow the item.")
         
-        # Mark the item as borrowed.
+        # Mark the item as borrowed and record that the user holds it.
         item.is_borrowed = True
+        self.__loans += (item.item_id,)
         return f"{self.__name} is eligible to borrow the item."
 
-    def return_item(self):
+    def return_item(self, item=None):
         """
         Processes the return of an item.
 
+        A DELINQUENT user becomes ACTIVE again once none of the loans they
+        still hold is overdue.
+
+        Args:
+            item (LibraryItem, optional): The item being returned.  It is marked as available and removed from the user's loans.
+
+        Raises:
+            Exception: If the item is not one the user holds.
+
         Returns:
             str: A message indicating the return status and whether the user's status has changed.
         """
-        # If the user is delinquent, change their status to ACTIVE upon return.
-        if self.__status == BorrowerStatus.DELINQUENT:
-            self.__status = BorrowerStatus.ACTIVE
+        # Only an item the user holds can be returned, so no one can free an item lent to someone else.
+        status = self.status_after_return(item)
+        if item is not None:
+            self.__loans = tuple(item_id for item_id in self.__loans if item_id != item.item_id)
+            self.__overdue = tuple(item_id for item_id in self.__overdue if item_id != item.item_id)
+            item.is_borrowed = False
+
+        # If the user is delinquent and has no overdue loans left, change their status to ACTIVE.
+        if status != self.__status:
+            self.__status = status
             return f"Item successfully returned. {self.__name} has returned the item, status now changed to: {self.__status.value}."
         
-        # If the user was not delinquent, simply return a success message.
+        # If the user was not reinstated, simply return a success message.
         return "Item successfully returned."
 
+    def status_after_return(self, item=None):
+        """
+        Returns the status the user will have once they return an item, without returning it.
+
+        Args:
+            item (LibraryItem, optional): The item to be returned.
+
+        Raises:
+            Exception: If the item is not one the user holds.
+
+        Returns:
+            BorrowerStatus: ACTIVE if the user is DELINQUENT and no other loan is overdue, otherwise their current status.
+        """
+        if item is not None and item.item_id not in self.__loans:
+            raise Exception(f"{self.__name} has not borrowed the item.")
+        if self.__status != BorrowerStatus.DELINQUENT:
+            return self.__status
+        if any(item is None or item_id != item.item_id for item_id in self.__overdue):
+            return self.__status
+        return BorrowerStatus.ACTIVE
+
+    def mark_overdue(self, item_id):
+        """
+        Records that one of the user's loans is overdue and makes the user DELINQUENT.
+
+        Args:
+            item_id (int): The unique identifier of the overdue item.
+
+        Returns:
+            bool: True if the user was not DELINQUENT before.
+        """
+        # Only loans the user holds are remembered, so returning them clears the mark.
+        if item_id in self.__loans and item_id not in self.__overdue:
+            self.__overdue += (item_id,)
+        if self.__status == BorrowerStatus.DELINQUENT:
+            return False
+        self.status = BorrowerStatus.DELINQUENT
+        return True
+
+    def restore_loans(self, item_ids, overdue=None):
+        """
+        Replaces the user's loans, for example with those recorded by a checkout engine.
+
+        The user's status is left unchanged.
+
+        Args:
+            item_ids (iterable of int): The ids of the items the user holds.
+            overdue (iterable of int, optional): The ids of the overdue items. Defaults to those already marked overdue.
+        """
+        self.__loans = tuple(item_ids)
+        overdue = self.__overdue if overdue is None else overdue
+        self.__overdue = tuple(item_id for item_id in overdue if item_id in self.__loans)
+
     def can_borrow(self, item):
         """
         Checks if the user can borrow the given item.
@@ -128,9 +321,12 @@ class LibraryUser:
         Returns:
             bool: True if the user can borrow the item, False otherwise.
         """
-        # User cannot borrow if their status is DELINQUENT or if the item is already borrowed.
+        # User cannot borrow if their status is DELINQUENT, if they already hold
+        # as many items as their status allows, or if the item is already borrowed.
         if self.__status == BorrowerStatus.DELINQUENT:
             return False
+        if len(self.__loans) >= self._quotas[self.__status.code]:
+            return False
         if item.is_borrowed:
             return False
         
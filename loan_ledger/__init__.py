@@ -0,0 +1,9 @@
+"""
+Description: The loan_ledger package.  It re-exports the public names of
+loan_ledger/loan_ledger.py.
+"""
+
+from .loan_ledger import LoanLedger
+
+# The names this package exports.
+__all__ = ["LoanLedger"]
@@ -0,0 +1,118 @@
+"""
+Description: A ledger of the items on loan, indexed both by item and by
+the user holding them.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# threading: Guards the two indexes, which the checkout engine updates from many threads.
+import threading
+
+class LoanLedger:
+    """
+    A class to record which user holds which items.
+
+    Two dictionaries are kept in step, so "who holds item Y" and "what does
+    user X hold" are both answered with a single lookup.
+
+    Attributes:
+        holders (dict): item_id -> user_id for every item on loan.
+    """
+
+    def __init__(self, holders=None):
+        """
+        Initializes the LoanLedger.
+
+        Args:
+            holders (dict, optional): item_id -> user_id for the items already on loan.
+        """
+        self.__lock = threading.Lock()
+        self.__holders = {}
+        self.__loans = {}
+        for item_id, user_id in (holders or {}).items():
+            self.lend(user_id, item_id)
+
+    # Property to access a copy of the item -> holder index.
+    @property
+    def holders(self):
+        with self.__lock:
+            return dict(self.__holders)
+
+    def __len__(self):
+        return len(self.__holders)
+
+    def __contains__(self, item_id):
+        return item_id in self.__holders
+
+    def lend(self, user_id, item_id):
+        """
+        Records that a user holds an item.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the item is already on loan.
+        """
+        with self.__lock:
+            if item_id in self.__holders:
+                raise ValueError("Item Id is already on loan.")
+            self.__holders[item_id] = user_id
+            self.__loans.setdefault(user_id, set()).add(item_id)
+
+    def release(self, item_id):
+        """
+        Records that an item has been returned.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            int: The user_id of the user who held the item, or None if it was not on loan.
+        """
+        with self.__lock:
+            user_id = self.__holders.pop(item_id, None)
+            if user_id is not None:
+                items = self.__loans[user_id]
+                items.discard(item_id)
+                if not items:
+                    del self.__loans[user_id]
+            return user_id
+
+    def holder_of(self, item_id):
+        """
+        Returns the id of the user holding an item.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            int: The user_id of the holder, or None if the item is not on loan.
+        """
+        return self.__holders.get(item_id)
+
+    def items_of(self, user_id):
+        """
+        Returns the ids of the items a user holds.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            frozenset: The item ids, empty if the user holds nothing.
+        """
+        with self.__lock:
+            return frozenset(self.__loans.get(user_id, ()))
+
+    def count_of(self, user_id):
+        """
+        Returns the number of items a user holds.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            int: The number of items on loan to the user.
+        """
+        return len(self.__loans.get(user_id, ()))
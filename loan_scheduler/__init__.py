@@ -0,0 +1,9 @@
+"""
+Description: The loan_scheduler package.  It re-exports the public names of
+loan_scheduler/loan_scheduler.py.
+"""
+
+from .loan_scheduler import Loan, OverdueScheduler, LOAN_PERIOD
+
+# The names this package exports.
+__all__ = ["Loan", "OverdueScheduler", "LOAN_PERIOD"]
@@ -0,0 +1,299 @@
+"""
+Description: Loans with due dates, and a scheduler that marks borrowers
+DELINQUENT as soon as one of their loans becomes overdue.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# heapq: Orders the open loans by due date.
+# threading: Guards the scheduler, which the checkout engine updates from many threads.
+# time: Supplies the default clock.
+# namedtuple: Gives each loan a small, immutable and readable record.
+import heapq
+import threading
+import time
+from collections import namedtuple
+
+# The default loan period: three weeks, in seconds.
+LOAN_PERIOD = 21 * 24 * 60 * 60
+
+# Returned loans leave stale heap entries behind; the heap is rebuilt once
+# there are more stale entries than open loans, and at least this many.
+_MIN_COMPACTION = 1024
+
+class Loan(namedtuple("Loan", ["user_id", "item_id", "borrowed_at", "due_at"])):
+    """
+    An item lent to a user.
+
+    Attributes:
+        user_id (int): The user holding the item.
+        item_id (int): The item lent.
+        borrowed_at (float): When the item was borrowed, in clock seconds.
+        due_at (float): When the item is due back, in clock seconds.
+    """
+
+    __slots__ = ()
+
+class OverdueScheduler:
+    """
+    A class to track open loans and mark borrowers DELINQUENT the moment
+    one of their loans becomes overdue.
+
+    Open loans are kept in a heap ordered by due date, so advancing the
+    clock only looks at the loans that have fallen due since the last call
+    rather than scanning every open loan.  Opening a loan and each loan
+    falling due cost O(log n); returning a loan costs O(1), since its heap
+    entry is left in place and skipped when it reaches the top.
+
+    Call advance() whenever the clock moves, for example from a timer set
+    for next_due.  After a restart, restore() reopens the loans recovered
+    from an event log with their original due dates.
+
+    Attributes:
+        loan_period (float): The default time until a loan is due, in seconds.
+        next_due (float): The due date of the earliest open loan, or None.
+    """
+
+    def __init__(self, loan_period=LOAN_PERIOD, clock=time.time, event_log=None):
+        """
+        Initializes the OverdueScheduler.
+
+        Args:
+            loan_period (float, optional): The default time until a loan is due, in seconds. Defaults to three weeks.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.time.
+            event_log (EventLog, optional): A log that records every loan the scheduler finds overdue.
+
+        Raises:
+            ValueError: If loan_period is not a positive number.
+        """
+        if not isinstance(loan_period, (int, float)) or isinstance(loan_period, bool) or loan_period <= 0:
+            raise ValueError("Loan period must be a positive number.")
+
+        self.__loan_period = loan_period
+        self.__clock = clock
+        self.__event_log = event_log
+        self.__lock = threading.Lock()
+
+        # item_id -> (Loan, LibraryUser) for every open loan.
+        self.__loans = {}
+        # (due_at, item_id) for every open loan that is not yet overdue, plus stale entries.
+        self.__due = []
+        self.__stale = 0
+        # user_id -> the ids of the user's overdue items.
+        self.__overdue = {}
+
+    # Property to access the default loan period.
+    @property
+    def loan_period(self):
+        return self.__loan_period
+
+    # Property to access the due date of the earliest open loan that is not yet overdue.
+    @property
+    def next_due(self):
+        with self.__lock:
+            self.__discard_stale()
+            return self.__due[0][0] if self.__due else None
+
+    def __len__(self):
+        return len(self.__loans)
+
+    def loan_dates(self, now=None):
+        """
+        Returns the dates of a loan opened now, so they can be recorded before it is opened.
+
+        Args:
+            now (float, optional): When the item is borrowed. Defaults to the clock's time.
+
+        Returns:
+            tuple: (borrowed_at, due_at).
+        """
+        now = self.__clock() if now is None else now
+        return now, now + self.__loan_period
+
+    def open(self, user, item_id, due_at=None, now=None):
+        """
+        Records that a user has borrowed an item.
+
+        Args:
+            user (LibraryUser): The user borrowing the item.
+            item_id (int): The unique identifier of the item.
+            due_at (float, optional): When the item is due back. Defaults to loan_period from now.
+            now (float, optional): When the item was borrowed. Defaults to the clock's time.
+
+        Raises:
+            ValueError: If the item is already on loan.
+
+        Returns:
+            Loan: The new loan.
+        """
+        now = self.__clock() if now is None else now
+        loan = Loan(user.user_id, item_id, now, now + self.__loan_period if due_at is None else due_at)
+        with self.__lock:
+            if item_id in self.__loans:
+                raise ValueError("Item Id is already on loan.")
+            self.__loans[item_id] = (loan, user)
+            heapq.heappush(self.__due, (loan.due_at, item_id))
+        return loan
+
+    def restore(self, loans, users, overdue=()):
+        """
+        Reopens loans recovered after a restart.
+
+        Loans of users not given, and of items already on loan, are
+        skipped, so the users can be restored in several calls.  Loans
+        already overdue are not found overdue again.
+
+        Args:
+            loans (iterable of Loan): The recovered loans, with their due dates.
+            users (iterable of LibraryUser): The users holding the loans.
+            overdue (iterable of int, optional): The ids of the items already overdue.
+
+        Returns:
+            int: The number of loans reopened.
+        """
+        users = {user.user_id: user for user in users}
+        overdue = set(overdue)
+        reopened = 0
+        with self.__lock:
+            for loan in loans:
+                user = users.get(loan.user_id)
+                if user is None or loan.item_id in self.__loans:
+                    continue
+                self.__loans[loan.item_id] = (loan, user)
+                if loan.item_id in overdue:
+                    self.__overdue.setdefault(loan.user_id, set()).add(loan.item_id)
+                else:
+                    heapq.heappush(self.__due, (loan.due_at, loan.item_id))
+                reopened += 1
+        return reopened
+
+    def close(self, item_id):
+        """
+        Records that an item has been returned.
+
+        The user's status is left unchanged; LibraryUser.return_item
+        reinstates a user once none of their loans is overdue.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            Loan: The closed loan, or None if the item was not on loan.
+        """
+        with self.__lock:
+            entry = self.__loans.pop(item_id, None)
+            if entry is None:
+                return None
+            loan = entry[0]
+            items = self.__overdue.get(loan.user_id)
+            if items is not None and item_id in items:
+                items.discard(item_id)
+                if not items:
+                    del self.__overdue[loan.user_id]
+            else:
+                self.__stale += 1
+                if self.__stale > max(len(self.__loans), _MIN_COMPACTION):
+                    self.__compact()
+            return loan
+
+    def advance(self, now=None):
+        """
+        Marks every loan that has fallen due as overdue.
+
+        Users with a newly overdue loan are moved to DELINQUENT, and the
+        overdue loan is recorded in the event log if there is one.  A scheduler
+        used by a CheckoutEngine should be advanced through
+        CheckoutEngine.advance instead, which makes each change under the
+        user's lock so it cannot interleave with a return.
+
+        Args:
+            now (float, optional): The current time. Defaults to the clock's time.
+
+        Returns:
+            list of LibraryUser: The users who became DELINQUENT.
+        """
+        delinquent = []
+        for loan, user in self.fall_due(now):
+            if self.__event_log is not None:
+                self.__event_log.record_overdue(user, loan.item_id)
+            if user.mark_overdue(loan.item_id):
+                delinquent.append(user)
+        return delinquent
+
+    def fall_due(self, now=None):
+        """
+        Finds the loans that have fallen due since the last call, without changing any user.
+
+        Each loan is returned once; the caller marks its user overdue.
+
+        Args:
+            now (float, optional): The current time. Defaults to the clock's time.
+
+        Returns:
+            list of tuple: (Loan, LibraryUser) for every newly overdue loan, in due date order.
+        """
+        now = self.__clock() if now is None else now
+        fallen = []
+        with self.__lock:
+            due = self.__due
+            loans = self.__loans
+            while due and due[0][0] <= now:
+                due_at, item_id = heapq.heappop(due)
+                entry = loans.get(item_id)
+
+                # Skip entries left behind by returned or already overdue loans.
+                if entry is None or entry[0].due_at != due_at:
+                    self.__stale -= 1
+                    continue
+                loan, user = entry
+                items = self.__overdue.setdefault(loan.user_id, set())
+                if item_id in items:
+                    self.__stale -= 1
+                    continue
+                items.add(item_id)
+                fallen.append(entry)
+        return fallen
+
+    def loan_of(self, item_id):
+        """
+        Returns the open loan of an item.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            Loan: The loan, or None if the item is not on loan.
+        """
+        entry = self.__loans.get(item_id)
+        return None if entry is None else entry[0]
+
+    def overdue_count(self, user_id):
+        """
+        Returns the number of overdue loans a user holds.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            int: The number of the user's loans that are overdue.
+        """
+        return len(self.__overdue.get(user_id, ()))
+
+    def __discard_stale(self):
+        # Pop stale entries off the top so the earliest entry is a live loan.
+        due = self.__due
+        while due:
+            due_at, item_id = due[0]
+            entry = self.__loans.get(item_id)
+            if entry is not None and entry[0].due_at == due_at:
+                return
+            heapq.heappop(due)
+            self.__stale -= 1
+
+    def __compact(self):
+        # Rebuild the heap from the open loans that are not yet overdue.
+        overdue = self.__overdue
+        self.__due = [(loan.due_at, item_id) for item_id, (loan, _) in self.__loans.items()
+                      if item_id not in overdue.get(loan.user_id, ())]
+        heapq.heapify(self.__due)
+        self.__stale = 0
@@ -0,0 +1,9 @@
+"""
+Description: The patron_dedup package.  It re-exports the public names of
+patron_dedup/patron_dedup.py.
+"""
+
+from .patron_dedup import canonical_email, canonical_name, find_duplicates, PatronDeduplicator, MergeCluster
+
+# The names this package exports.
+__all__ = ["canonical_email", "canonical_name", "find_duplicates", "PatronDeduplicator", "MergeCluster"]
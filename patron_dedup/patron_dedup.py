@@ -0,0 +1,327 @@
+"""
+Description: Finds library users who are the same patron registered more
+than once, under emails and names that differ only by case, whitespace,
+accents, word order, Gmail-style dots and plus-tags, or small typos, and
+groups them into clusters to merge.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# bisect: Finds the next filled bin when densifying a MinHash signature.
+# random: Draws the MinHash masks from a seed, so results are repeatable.
+# re: Finds the numbers in emails.
+# Counter: Counts bucket keys in C, so singleton buckets cost almost nothing.
+# namedtuple: Gives each cluster a small, immutable and readable record.
+# array: Keeps one compact column of bucket keys per LSH band.
+# unicodedata: Strips accents from names before they are compared.
+# zlib: crc32 is a fast hash of shingles that is the same in every process.
+import bisect
+import random
+import re
+import unicodedata
+import zlib
+from array import array
+from collections import Counter, namedtuple
+from search_index import tokenize
+
+# Domains whose mailboxes ignore dots in the local part, and their canonical names.
+_DOTLESS_DOMAINS = {"gmail.com": "gmail.com", "googlemail.com": "gmail.com"}
+
+# Finds the runs of digits in an email.
+_NUMBERS = re.compile(r"\d+").findall
+
+# Larger than any crc32, marking a MinHash bin that no shingle fell into.
+_EMPTY = 1 << 32
+
+# The MinHash bins filled by each pass over a user's shingles, and the mask that picks a bin.
+_BINS = 8
+_SLOT = _BINS - 1
+
+class MergeCluster(namedtuple("MergeCluster", ["survivor", "duplicates", "score"])):
+    """
+    A group of users found to be the same patron.
+
+    Attributes:
+        survivor (int): The lowest user_id in the cluster, the record to keep.
+        duplicates (tuple of int): The other user_ids, in order, to merge into the survivor.
+        score (float): The lowest similarity of the matches that joined the cluster; 1.0 when every match was an identical canonical email.
+    """
+
+    __slots__ = ()
+
+def canonical_email(email):
+    """
+    Reduces an email to the mailbox it delivers to.
+
+    Whitespace is removed and case is folded, anything from a "+" in the
+    local part is dropped, and for Gmail addresses the dots in the local
+    part are dropped and googlemail.com becomes gmail.com.
+
+    Args:
+        email (str): The email address.
+
+    Returns:
+        str: The canonical address.
+    """
+    local, _, domain = "".join(email.split()).lower().rpartition("@")
+    local = local.partition("+")[0]
+    if domain in _DOTLESS_DOMAINS:
+        domain = _DOTLESS_DOMAINS[domain]
+        local = local.replace(".", "")
+    return f"{local}@{domain}"
+
+def canonical_name(name):
+    """
+    Reduces a name to its case-folded, unaccented words in sorted order.
+
+    "Zoë  Brontë", "bronte, zoe" and "ZOE BRONTE" all become "bronte zoe".
+
+    Args:
+        name (str): The name.
+
+    Returns:
+        str: The canonical name.
+    """
+    if not name.isascii():
+        name = "".join(char for char in unicodedata.normalize("NFKD", name) if not unicodedata.combining(char))
+    return " ".join(sorted(tokenize(name)))
+
+def find_duplicates(users, **options):
+    """
+    Finds the clusters of duplicate users in one call.
+
+    Args:
+        users (iterable): LibraryUser-compatible objects.
+        **options: Passed to PatronDeduplicator.
+
+    Returns:
+        list of MergeCluster: The clusters, ordered by survivor.
+    """
+    deduplicator = PatronDeduplicator(**options)
+    deduplicator.add_all(users)
+    return deduplicator.clusters()
+
+class PatronDeduplicator:
+    """
+    A class to index users and cluster the ones that are the same patron.
+
+    Users with the same canonical email are always the same patron.  Other
+    pairs are found with MinHash locality-sensitive hashing: each user's
+    canonical name and the mailbox part of their email are cut into 3-byte
+    shingles, a MinHash signature of bands * rows values is taken from
+    them, and each band hashes its `rows` values, together with the numbers
+    in the email, into a bucket key.  Users whose shingles overlap heavily
+    share a bucket in some band with high probability.  The signature takes
+    one pass over the shingles per 8 values (one permutation hashing)
+    rather than one per value.
+
+    Buckets are found by counting each band's keys, and each user is only
+    compared with the next `window` users in its buckets, so the work grows
+    with the number of users rather than with the number of pairs.  A pair
+    matches when its emails contain the same numbers and the Jaccard
+    similarity of the 2-character runs of both its names and its emails
+    reaches `threshold`.  Matches are joined transitively into clusters.
+
+    Attributes:
+        threshold (float): The similarity both name and email must reach for a pair to match.
+        bands (int): The number of LSH bands.
+        rows (int): The number of MinHash values hashed together in each band.
+        window (int): The most users after it in a bucket that each user is compared with.
+        size (int): The number of users added.
+        comparisons (int): The number of pairs scored by the last call to clusters.
+    """
+
+    def __init__(self, threshold=0.6, bands=10, rows=2, window=16, seed=24):
+        """
+        Initializes an empty PatronDeduplicator.
+
+        Args:
+            threshold (float, optional): The similarity both name and email must reach. Defaults to 0.6.
+            bands (int, optional): The number of LSH bands. Defaults to 10.
+            rows (int, optional): The MinHash values per band. Defaults to 2.
+            window (int, optional): The neighbours compared per user in a bucket. Defaults to 16.
+            seed (int, optional): Seeds the MinHash masks, so results are repeatable. Defaults to 24.
+
+        Raises:
+            ValueError: If threshold is not between 0 and 1, or bands, rows or window is not a positive integer.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1.")
+        for value in (bands, rows, window):
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError("Bands, rows and window must be positive integers.")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.window = window
+        self.comparisons = 0
+        rng = random.Random(seed)
+        self.__masks = [rng.getrandbits(32) for _ in range(-(-bands * rows // _BINS))]
+        self.__user_ids = []
+        self.__names = []
+        self.__emails = []
+        # One bucket key per user for the canonical email and for each band.
+        self.__email_keys = array("q")
+        self.__band_keys = [array("q") for _ in range(bands)]
+
+    # Property to access the number of users added.
+    @property
+    def size(self):
+        return len(self.__user_ids)
+
+    def __len__(self):
+        return len(self.__user_ids)
+
+    def add(self, user):
+        """
+        Adds a user to the index.
+
+        Args:
+            user (LibraryUser): A LibraryUser-compatible object.
+        """
+        name, email = canonical_name(user.name), canonical_email(user.email)
+        self.__user_ids.append(user.user_id)
+        self.__names.append(name)
+        self.__emails.append(email)
+        self.__email_keys.append(hash(email))
+
+        # The MinHash signature of the name and mailbox together.  The domain is
+        # left out: it is shared by so many users that it would crowd the buckets.
+        signature = _signature([*_shingles(name), *_shingles(email.rpartition("@")[0])], self.__masks)
+        # Only emails with the same numbers can match, so the numbers are part of
+        # every bucket key, and namesakes like ann.lee84@ and ann.lee85@ never meet.
+        numbers = zlib.crc32(" ".join(_NUMBERS(email)).encode("ascii", "replace"))
+        rows = self.rows
+        for band, keys in enumerate(self.__band_keys):
+            # Tuples of ints hash the same in every process, unlike strings.
+            keys.append(hash((numbers, *signature[band * rows:band * rows + rows])))
+
+    def add_all(self, users):
+        """
+        Adds many users to the index.
+
+        Args:
+            users (iterable): LibraryUser-compatible objects.
+        """
+        add = self.add
+        for user in users:
+            add(user)
+
+    def clusters(self):
+        """
+        Finds the users that are the same patron.
+
+        Returns:
+            list of MergeCluster: The clusters of two or more users, ordered by survivor.
+        """
+        count = len(self.__user_ids)
+        parent = list(range(count))
+        weakest = {}
+
+        def find(index):
+            # Find the root of index's cluster, halving the path as it goes.
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        def union(first, second, score):
+            first, second = find(first), find(second)
+            if first != second:
+                first, second = min(first, second), max(first, second)
+                parent[second] = first
+                weakest[first] = min(weakest.pop(second, 1.0), weakest.get(first, 1.0), score)
+
+        # Users with the same canonical email: join each to the first user with that email.
+        emails = self.__emails
+        for bucket in _runs(self.__email_keys):
+            first = {}
+            for index in bucket:
+                union(first.setdefault(emails[index], index), index, 1.0)
+
+        # Users sharing an LSH bucket: score each against its next neighbours in the bucket.
+        names, threshold, window = self.__names, self.threshold, self.window
+        comparisons = 0
+        for keys in self.__band_keys:
+            for bucket in _runs(keys):
+                for position, first in enumerate(bucket):
+                    for second in bucket[position + 1:position + 1 + window]:
+                        if find(first) != find(second):
+                            comparisons += 1
+                            score = _score(names[first], emails[first], names[second], emails[second])
+                            if score >= threshold:
+                                union(first, second, score)
+        self.comparisons = comparisons
+
+        members = {}
+        for index in range(count):
+            root = find(index)
+            if root != index:
+                members.setdefault(root, []).append(index)
+        user_ids = self.__user_ids
+        clusters = []
+        for root, others in members.items():
+            ids = sorted(user_ids[index] for index in (root, *others))
+            clusters.append(MergeCluster(ids[0], tuple(ids[1:]), round(weakest.get(root, 1.0), 4)))
+        clusters.sort()
+        return clusters
+
+def _shingles(text):
+    # The crc32 of every 3-byte run of text; text shorter than that is one shingle.
+    data = text.encode("utf-8")
+    if len(data) < 3:
+        return [zlib.crc32(data)]
+    crc32 = zlib.crc32
+    return [crc32(data[start:start + 3]) for start in range(len(data) - 2)]
+
+def _signature(shingles, masks):
+    # One permutation hashing, once per mask: every shingle, xor the mask,
+    # falls into one of _BINS bins by its low bits, and each bin keeps the
+    # smallest value that fell into it.  A few bins per pass keeps several
+    # shingles in most bins, so each value behaves like a true MinHash.
+    signature = []
+    for mask in masks:
+        values = [_EMPTY] * _BINS
+        for shingle in shingles:
+            shingle ^= mask
+            slot = shingle & _SLOT
+            if shingle < values[slot]:
+                values[slot] = shingle
+        if _EMPTY in values:
+            # Fill each empty bin from the next filled one, offset by the distance,
+            # so that similar sets still agree on most bins (densification).
+            filled = [slot for slot, value in enumerate(values) if value != _EMPTY]
+            for slot in range(_BINS):
+                if values[slot] == _EMPTY:
+                    source = filled[bisect.bisect(filled, slot) % len(filled)]
+                    values[slot] = values[source] + (source - slot) % _BINS * _EMPTY
+        signature += values
+    return signature
+
+def _score(name, email, other_name, other_email):
+    # The lower of the name and email similarities.  Emails with different
+    # numbers in them (ann.lee84@ and ann.lee85@) usually belong to different
+    # people, so they score 0 without comparing anything else.
+    if _NUMBERS(email) != _NUMBERS(other_email):
+        return 0.0
+    return min(_similarity(email, other_email), _similarity(name, other_name))
+
+def _similarity(first, second):
+    # The Jaccard similarity of two strings' sets of 2-character runs.  These are
+    # more forgiving of a typo in a short name than the 3-byte shingles that
+    # only need to be selective enough to keep buckets small.
+    if first == second:
+        return 1.0
+    first = {first[start:start + 2] for start in range(len(first) - 1)} or {first}
+    second = {second[start:start + 2] for start in range(len(second) - 1)} or {second}
+    return len(first & second) / len(first | second)
+
+def _runs(keys):
+    # Every group of two or more positions that share a key, in position order.
+    # Counting is done in C, so only positions in shared buckets are visited in Python.
+    shared = {key for key, count in Counter(keys).items() if count > 1}
+    groups = {}
+    for position in [position for position, key in enumerate(keys) if key in shared]:
+        groups.setdefault(keys[position], []).append(position)
+    return groups.values()
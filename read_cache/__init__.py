@@ -0,0 +1,9 @@
+"""
+Description: The read_cache package.  It re-exports the public names of
+read_cache/read_cache.py.
+"""
+
+from .read_cache import ReadThroughCache, CachedRepository, CacheStats
+
+# The names this package exports.
+__all__ = ["ReadThroughCache", "CachedRepository", "CacheStats"]
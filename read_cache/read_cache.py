@@ -0,0 +1,368 @@
+"""
+Description: A bounded read-through cache, and a repository that puts it
+in front of a backing store of library items and users.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# threading: Guards the cache, which is shared between threads.
+# time: Supplies the default clock for expiry and times backend reads.
+# OrderedDict: Keeps the entries in least recently used order.
+# namedtuple: Gives each statistics snapshot a small, immutable and readable record.
+# LatencyHistogram: Records the latency of backend reads.
+# Repository: The interface CachedRepository implements in front of another repository.
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from instrumentation import LatencyHistogram
+from repository import Repository
+
+# Stands in for an id the backing store does not have, so misses can be cached too.
+_MISSING = object()
+
+# An odd 256-bit multiplier.  The high bits of a key's hash times it are cut
+# into one counter index per row of the frequency sketch.
+_SEED = 0x9E3779B97F4A7C15_C2B2AE3D27D4EB4F_165667B19E3779F9_D6E8FEB86659FD93
+_MASK64 = (1 << 64) - 1
+_ROWS = 4
+
+# Halves every sketch counter in one bytes.translate call.
+_HALVE = bytes(value >> 1 for value in range(256))
+
+class _Load:
+    """
+    A backend read in progress, shared by every lookup that misses on its key.
+
+    The event the other lookups wait on is only created when one arrives,
+    so an uncontended miss costs no more than this small object.
+    """
+
+    __slots__ = ("event", "valid", "value", "error")
+
+    def __init__(self):
+        self.event = None
+        self.valid = True
+        self.value = None
+        self.error = None
+
+    def result(self):
+        # Wait for the read, then return its value or raise its exception.
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+class CacheStats(namedtuple("CacheStats", ["hits", "negative_hits", "misses", "coalesced", "expirations",
+                                           "evictions", "rejections", "size"])):
+    """
+    A snapshot of a cache's counters.
+
+    Attributes:
+        hits (int): Lookups answered with a cached value.
+        negative_hits (int): Lookups answered with a cached "not found".
+        misses (int): Lookups that read the backing store.
+        coalesced (int): Lookups that waited for another thread's read of the same key.
+        expirations (int): Entries dropped because their time to live had passed.
+        evictions (int): Entries dropped to make room for new ones.
+        rejections (int): New entries the admission policy kept out of a full cache.
+        size (int): The number of entries held.
+        hit_rate (float): The share of lookups that did not read the backing store.
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.negative_hits + self.misses + self.coalesced
+        return (lookups - self.misses) / lookups if lookups else 0.0
+
+class _FrequencySketch:
+    """
+    A count-min sketch of how often each key has been requested recently.
+
+    Four rows of saturating one-byte counters (capped at 15) estimate each
+    key's frequency as the smallest of its four counters.  After ten
+    increments per counter slot every counter is halved, so the sketch
+    follows changes in popularity.
+    """
+
+    def __init__(self, capacity):
+        self.__bits = max(capacity * 4, 64).bit_length()
+        self.__mask = (1 << self.__bits) - 1
+        self.__rows = [bytearray(1 << self.__bits) for _ in range(_ROWS)]
+        self.__additions = 0
+        self.__sample = 10 << self.__bits
+
+    def increment(self, key):
+        spread = ((hash(key) & _MASK64) * _SEED) >> 64
+        mask, bits = self.__mask, self.__bits
+        for row in self.__rows:
+            index = spread & mask
+            if row[index] < 15:
+                row[index] += 1
+            spread >>= bits
+        self.__additions += 1
+        if self.__additions >= self.__sample:
+            self.__additions //= 2
+            for row in self.__rows:
+                row[:] = row.translate(_HALVE)
+
+    def estimate(self, key):
+        spread = ((hash(key) & _MASK64) * _SEED) >> 64
+        mask, bits = self.__mask, self.__bits
+        smallest = 15
+        for row in self.__rows:
+            smallest = min(smallest, row[spread & mask])
+            spread >>= bits
+        return smallest
+
+class ReadThroughCache:
+    """
+    A class to cache the results of a slow lookup function.
+
+    Entries are evicted in least recently used order.  With admission on,
+    a new entry only displaces the least recently used one if it has been
+    requested more often recently (the TinyLFU policy), so a burst of
+    one-off lookups cannot flush the popular entries.  Each entry expires
+    after its time to live; lookups that found nothing are cached too, with
+    a shorter time to live.  When several threads miss on the same key at
+    once, one of them calls the lookup function and the rest wait for its
+    result.
+
+    Values are not copied: every lookup of a key returns the same object
+    until it is dropped, so a value changed in place is changed for every
+    thread that reads it, and in the cache.  Treat cached values as read
+    only.
+
+    Attributes:
+        capacity (int): The maximum number of entries.
+        load_latency (LatencyHistogram): The latency of calls to the lookup function, in nanoseconds.
+    """
+
+    def __init__(self, load, capacity=10_000, ttl=300.0, negative_ttl=30.0, admission=True, clock=time.monotonic):
+        """
+        Initializes the ReadThroughCache.
+
+        Args:
+            load (callable): Returns the value for a key, or None if there is none.
+            capacity (int, optional): The maximum number of entries. Defaults to 10,000.
+            ttl (float, optional): Seconds a found value stays cached. Defaults to 300.
+            negative_ttl (float, optional): Seconds a "not found" stays cached. Defaults to 30.
+            admission (bool, optional): Whether to apply the TinyLFU admission policy. Defaults to True.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If capacity is not a positive integer.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+
+        self.capacity = capacity
+        self.load_latency = LatencyHistogram()
+        self.__load = load
+        self.__ttl = ttl
+        self.__negative_ttl = negative_ttl
+        self.__clock = clock
+        self.__sketch = _FrequencySketch(capacity) if admission else None
+        self.__lock = threading.Lock()
+
+        # key -> (value, expires_at), least recently used first.
+        self.__entries = OrderedDict()
+        # key -> _Load for every key being read from the backend.
+        self.__loading = {}
+        self.__counts = dict.fromkeys(CacheStats._fields[:-1], 0)
+
+    def get(self, key):
+        """
+        Returns the value for a key, loading it on a miss.
+
+        Args:
+            key (hashable): The key to look up.
+
+        Returns:
+            object: The value, or None if the lookup function found nothing.
+        """
+        counts = self.__counts
+        leader = False
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[1] > self.__clock():
+                    self.__entries.move_to_end(key)
+                    if self.__sketch is not None:
+                        self.__sketch.increment(key)
+                    if entry[0] is _MISSING:
+                        counts["negative_hits"] += 1
+                        return None
+                    counts["hits"] += 1
+                    return entry[0]
+                del self.__entries[key]
+                counts["expirations"] += 1
+
+            if self.__sketch is not None:
+                self.__sketch.increment(key)
+            loading = self.__loading.get(key)
+            if loading is not None:
+                counts["coalesced"] += 1
+                if loading.event is None:
+                    loading.event = threading.Event()
+            else:
+                loading = self.__loading[key] = _Load()
+                counts["misses"] += 1
+                leader = True
+        if not leader:
+            return loading.result()
+
+        started = time.perf_counter_ns()
+        try:
+            value = self.__load(key)
+        except BaseException as error:
+            with self.__lock:
+                del self.__loading[key]
+                loading.error = error
+                event = loading.event
+            if event is not None:
+                event.set()
+            raise
+        self.load_latency.record(time.perf_counter_ns() - started)
+
+        with self.__lock:
+            del self.__loading[key]
+            # A key invalidated while it was loading may have been read before the change.
+            if loading.valid:
+                self.__admit(key, value)
+            loading.value = value
+            event = loading.event
+        if event is not None:
+            event.set()
+        return value
+
+    def invalidate(self, key):
+        """
+        Drops a key, so the next lookup reads the backing store again.
+
+        Args:
+            key (hashable): The key to drop.
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+            loading = self.__loading.get(key)
+            if loading is not None:
+                loading.valid = False
+
+    def clear(self):
+        """
+        Drops every entry.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            for loading in self.__loading.values():
+                loading.valid = False
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache's counters.
+
+        Returns:
+            CacheStats: The counters and current size.
+        """
+        with self.__lock:
+            return CacheStats(size=len(self.__entries), **self.__counts)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __admit(self, key, value):
+        # Insert a freshly loaded value, evicting or rejecting when the cache is full.
+        entries = self.__entries
+        if key not in entries and len(entries) >= self.capacity:
+            victim = next(iter(entries))
+            if self.__sketch is not None and self.__sketch.estimate(key) <= self.__sketch.estimate(victim):
+                self.__counts["rejections"] += 1
+                return
+            del entries[victim]
+            self.__counts["evictions"] += 1
+        if value is None:
+            entries[key] = (_MISSING, self.__clock() + self.__negative_ttl)
+        else:
+            entries[key] = (value, self.__clock() + self.__ttl)
+        entries.move_to_end(key)
+
+class CachedRepository(Repository):
+    """
+    A class to look items and users up through a cache in front of a
+    Repository.
+
+    Changes made through set_borrowed, set_status, write_changes,
+    save_items and save_users are written to the repository first and then
+    drop the cached copies, so the next lookup sees the change.  Writers
+    that batch changes, such as WriteCoalescer, should be given the
+    CachedRepository rather than the repository behind it, or the cache
+    will serve the old values until they expire.
+
+    Lookups return the cached LibraryItem and LibraryUser objects
+    themselves, shared with every other caller, not copies.  Changing one
+    in place does not reach the repository and is seen by every later
+    lookup, so make changes through the methods below instead.
+
+    Attributes:
+        items (ReadThroughCache): The item cache.
+        users (ReadThroughCache): The user cache.
+    """
+
+    def __init__(self, repository, capacity=10_000, ttl=300.0, negative_ttl=30.0, admission=True,
+                 clock=time.monotonic):
+        """
+        Initializes the CachedRepository.
+
+        Args:
+            repository (Repository): The backing store.
+            capacity (int, optional): The maximum number of items, and separately of users, to cache. Defaults to 10,000.
+            ttl (float, optional): Seconds a found item or user stays cached. Defaults to 300.
+            negative_ttl (float, optional): Seconds a missing id stays cached. Defaults to 30.
+            admission (bool, optional): Whether to apply the TinyLFU admission policy. Defaults to True.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.monotonic.
+        """
+        self.__repository = repository
+        self.items = ReadThroughCache(repository.get_item, capacity, ttl, negative_ttl, admission, clock)
+        self.users = ReadThroughCache(repository.get_user, capacity, ttl, negative_ttl, admission, clock)
+
+    def get_item(self, item_id):
+        """Returns the LibraryItem with the given id, or None."""
+        return self.items.get(item_id)
+
+    def get_user(self, user_id):
+        """Returns the LibraryUser with the given id, or None."""
+        return self.users.get(user_id)
+
+    def save_items(self, items):
+        """Writes library items to the repository and drops their cached copies."""
+        items = list(items)
+        self.__repository.save_items(items)
+        for item in items:
+            self.items.invalidate(item.item_id)
+
+    def save_users(self, users):
+        """Writes library users to the repository and drops their cached copies."""
+        users = list(users)
+        self.__repository.save_users(users)
+        for user in users:
+            self.users.invalidate(user.user_id)
+
+    def set_borrowed(self, item_id, is_borrowed):
+        """Writes an item's borrowed status through to the repository."""
+        self.__repository.set_borrowed(item_id, is_borrowed)
+        self.items.invalidate(item_id)
+
+    def set_status(self, user_id, status):
+        """Writes a user's status through to the repository."""
+        self.__repository.set_status(user_id, status)
+        self.users.invalidate(user_id)
+
+    def write_changes(self, borrowed, statuses):
+        """Writes many borrowed-status and user-status changes through to the repository."""
+        self.__repository.write_changes(borrowed, statuses)
+        for item_id in borrowed:
+            self.items.invalidate(item_id)
+        for user_id in statuses:
+            self.users.invalidate(user_id)
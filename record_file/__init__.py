@@ -0,0 +1,9 @@
+"""
+Description: The record_file package.  It re-exports the public names of
+record_file/record_file.py.
+"""
+
+from .record_file import write_items, write_users, RecordFile, ItemFile, ItemRecord, UserFile, UserRecord
+
+# The names this package exports.
+__all__ = ["write_items", "write_users", "RecordFile", "ItemFile", "ItemRecord", "UserFile", "UserRecord"]
@@ -0,0 +1,390 @@
+"""
+Description: A binary on-disk format for library items and users, read 
+through mmap so that opening a file is near-instant and records are only
+decoded when they are looked up.
+Author: Apurba Khan
+Date: 2026-10-17
+
+File layout (little-endian):
+    header   magic (4s), version (H), record size (H), record count (Q), heap offset (Q)
+    records  fixed-width records sorted by id
+    heap     the UTF-8 bytes of every string, referenced by (offset, length)
+"""
+
+# mmap: Maps the file into memory so pages are read lazily by the OS.
+# struct: Packs and unpacks the fixed-width header and records.
+import mmap
+import struct
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import GENRES_BY_CODE
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+
+_HEADER = struct.Struct("<4sHHQQ")
+_ID = struct.Struct("<q")
+_VERSION = 1
+
+# item_id, publication_year, genre, is_borrowed, padding, title (offset, length), author (offset, length).
+_ITEM = struct.Struct("<qiBBxxQIQI")
+_ITEM_MAGIC = b"LIBI"
+_BORROWED_OFFSET = 13
+
+# user_id, status, padding, name (offset, length), email (offset, length).
+_USER = struct.Struct("<qBxxxQIQI")
+_USER_MAGIC = b"LIBU"
+_STATUS_OFFSET = 8
+
+def write_items(path, items):
+    """
+    Writes library items to a record file.
+
+    Args:
+        path (str): The file to create or overwrite.
+        items (iterable): LibraryItem-compatible objects.
+
+    Raises:
+        ValueError: If an item_id is duplicated or a publication year is not an integer.
+    """
+    def pack(item, heap):
+        # Ensure the publication year fits the fixed-width year column.
+        if not isinstance(item.publication_year, int):
+            raise ValueError("Publication Year must be numeric.")
+        return _ITEM.pack(item.item_id, item.publication_year, item.genre.code, item.is_borrowed,
+                          *_store(heap, item.title), *_store(heap, item.author))
+
+    _write(path, _ITEM_MAGIC, _ITEM, sorted(items, key=lambda item: item.item_id),
+           lambda item: item.item_id, pack, "Item Id already exists in the file.")
+
+def write_users(path, users):
+    """
+    Writes library users to a record file.
+
+    Args:
+        path (str): The file to create or overwrite.
+        users (iterable): LibraryUser objects.
+
+    Raises:
+        ValueError: If a user_id is duplicated.
+    """
+    def pack(user, heap):
+        return _USER.pack(user.user_id, user.status.code, *_store(heap, user.name), *_store(heap, user.email))
+
+    _write(path, _USER_MAGIC, _USER, sorted(users, key=lambda user: user.user_id),
+           lambda user: user.user_id, pack, "User Id already exists in the file.")
+
+class RecordFile:
+    """
+    A base class for memory-mapped record files.
+
+    Records are sorted by id, so a lookup is a binary search that reads
+    one id per step straight from the mapped pages.
+
+    Attributes:
+        size (int): The number of records in the file.
+    """
+
+    def __init__(self, path, magic, layout, writable=False):
+        """
+        Opens and maps a record file.
+
+        Args:
+            path (str): The file to open.
+            magic (bytes): The magic number expected in the header.
+            layout (struct.Struct): The layout of one record.
+            writable (bool, optional): Whether flags may be changed in place. Defaults to False.
+
+        Raises:
+            ValueError: If the file is not a record file of the expected kind.
+        """
+        self.__file = open(path, "r+b" if writable else "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise ValueError("Invalid record file.")
+        if len(self.__map) < _HEADER.size:
+            self.close()
+            raise ValueError("Invalid record file.")
+        found, version, record_size, count, heap = _HEADER.unpack_from(self.__map, 0)
+        if found != magic or version != _VERSION or record_size != layout.size:
+            self.close()
+            raise ValueError("Invalid record file.")
+        self._layout = layout
+        self.__count = count
+        self.__heap = heap
+
+    # Property to access the number of records.
+    @property
+    def size(self):
+        return self.__count
+
+    def __len__(self):
+        return self.__count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        if not self.__map.closed:
+            self.__map.close()
+        self.__file.close()
+
+    def flush(self):
+        """
+        Writes in-place changes back to disk.
+        """
+        self.__map.flush()
+
+    def _find(self, record_id):
+        # Binary search the sorted ids; returns the byte offset of the record or None.
+        low, high = 0, self.__count
+        size, read, unpack = self._layout.size, self.__map, _ID.unpack_from
+        while low < high:
+            middle = (low + high) // 2
+            found = unpack(read, _HEADER.size + middle * size)[0]
+            if found < record_id:
+                low = middle + 1
+            elif found > record_id:
+                high = middle
+            else:
+                return _HEADER.size + middle * size
+        return None
+
+    def _offset(self, position):
+        # The byte offset of the record at a position.
+        return _HEADER.size + position * self._layout.size
+
+    def _unpack(self, offset):
+        return self._layout.unpack_from(self.__map, offset)
+
+    def _string(self, offset, length):
+        return str(self.__map[self.__heap + offset:self.__heap + offset + length], "utf-8")
+
+    def _write_byte(self, offset, value):
+        self.__map[offset] = value
+
+class ItemFile(RecordFile):
+    """
+    A class to read library items from a record file.
+    """
+
+    def __init__(self, path, writable=False):
+        """
+        Opens and maps an item file.
+
+        Args:
+            path (str): The file to open.
+            writable (bool, optional): Whether is_borrowed may be changed in place. Defaults to False.
+
+        Raises:
+            ValueError: If the file is not an item file.
+        """
+        super().__init__(path, _ITEM_MAGIC, _ITEM, writable)
+
+    def get(self, item_id):
+        """
+        Looks up an item without reading the rest of the file.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Returns:
+            ItemRecord: A view of the item, or None if not found.
+        """
+        offset = self._find(item_id)
+        return None if offset is None else ItemRecord(self, offset)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield ItemRecord(self, self._offset(position))
+
+    def set_borrowed(self, item_id, is_borrowed):
+        """
+        Changes the borrowed status of an item in place.
+
+        Only the one flag byte is written; the rest of the file is untouched.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+            is_borrowed (bool): The new borrowed status.
+
+        Raises:
+            ValueError: If the item is not in the file or is_borrowed is not a boolean.
+            TypeError: If the file was not opened as writable.
+        """
+        # Ensure that is_borrowed is a boolean value.
+        if not isinstance(is_borrowed, bool):
+            raise ValueError("Is Borrowed must be a boolean value.")
+        offset = self._find(item_id)
+        if offset is None:
+            raise ValueError("Item Id not found in the file.")
+        self._write_byte(offset + _BORROWED_OFFSET, is_borrowed)
+
+class ItemRecord:
+    """
+    A LibraryItem-compatible view of one record in an ItemFile.
+
+    The record is unpacked when the view is created; the strings are only
+    decoded when title or author is read.
+    """
+
+    __slots__ = ("__file", "__offset", "__fields")
+
+    def __init__(self, file, offset):
+        self.__file = file
+        self.__offset = offset
+        self.__fields = file._unpack(offset)
+
+    @property
+    def item_id(self):
+        return self.__fields[0]
+
+    @property
+    def publication_year(self):
+        return self.__fields[1]
+
+    @property
+    def genre(self):
+        return GENRES_BY_CODE[self.__fields[2]]
+
+    @property
+    def is_borrowed(self):
+        # Read the flag from the file each time so in-place changes are seen.
+        return bool(self.__file._unpack(self.__offset)[3])
+
+    @property
+    def title(self):
+        return self.__file._string(self.__fields[4], self.__fields[5])
+
+    @property
+    def author(self):
+        return self.__file._string(self.__fields[6], self.__fields[7])
+
+    def to_item(self):
+        """
+        Returns a LibraryItem holding a copy of the record.
+
+        Returns:
+            LibraryItem: The item.
+        """
+        return LibraryItem(self.item_id, self.title, self.author, self.publication_year, self.genre, self.is_borrowed)
+
+class UserFile(RecordFile):
+    """
+    A class to read library users from a record file.
+    """
+
+    def __init__(self, path, writable=False):
+        """
+        Opens and maps a user file.
+
+        Args:
+            path (str): The file to open.
+            writable (bool, optional): Whether status may be changed in place. Defaults to False.
+
+        Raises:
+            ValueError: If the file is not a user file.
+        """
+        super().__init__(path, _USER_MAGIC, _USER, writable)
+
+    def get(self, user_id):
+        """
+        Looks up a user without reading the rest of the file.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Returns:
+            UserRecord: A view of the user, or None if not found.
+        """
+        offset = self._find(user_id)
+        return None if offset is None else UserRecord(self, offset)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield UserRecord(self, self._offset(position))
+
+    def set_status(self, user_id, status):
+        """
+        Changes the status of a user in place.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            status (BorrowerStatus): The new status.
+
+        Raises:
+            ValueError: If the user is not in the file or status is invalid.
+            TypeError: If the file was not opened as writable.
+        """
+        if not isinstance(status, BorrowerStatus):
+            raise ValueError("Invalid Borrower Status.")
+        offset = self._find(user_id)
+        if offset is None:
+            raise ValueError("User Id not found in the file.")
+        self._write_byte(offset + _STATUS_OFFSET, status.code)
+
+class UserRecord:
+    """
+    A view of one record in a UserFile.
+    """
+
+    __slots__ = ("__file", "__offset", "__fields")
+
+    def __init__(self, file, offset):
+        self.__file = file
+        self.__offset = offset
+        self.__fields = file._unpack(offset)
+
+    @property
+    def user_id(self):
+        return self.__fields[0]
+
+    @property
+    def status(self):
+        # Read the status from the file each time so in-place changes are seen.
+        return STATUSES_BY_CODE[self.__file._unpack(self.__offset)[1]]
+
+    @property
+    def name(self):
+        return self.__file._string(self.__fields[2], self.__fields[3])
+
+    @property
+    def email(self):
+        return self.__file._string(self.__fields[4], self.__fields[5])
+
+    def to_user(self):
+        """
+        Returns a LibraryUser holding a copy of the record.
+
+        Returns:
+            LibraryUser: The user.
+        """
+        return LibraryUser(self.user_id, self.name, self.email, self.status)
+
+def _store(heap, value):
+    # Append a string to the heap and return its (offset, length).
+    data = value.encode("utf-8")
+    offset = len(heap)
+    heap += data
+    return offset, len(data)
+
+def _write(path, magic, layout, records, key, pack, duplicate_message):
+    # Pack the sorted records and their strings, then write header, records and heap.
+    heap = bytearray()
+    packed = []
+    previous = None
+    for record in records:
+        if key(record) == previous:
+            raise ValueError(duplicate_message)
+        previous = key(record)
+        packed.append(pack(record, heap))
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(magic, _VERSION, layout.size, len(packed), _HEADER.size + len(packed) * layout.size))
+        file.write(b"".join(packed))
+        file.write(heap)
@@ -0,0 +1,9 @@
+"""
+Description: The repository package.  It re-exports the public names of
+repository/repository.py.
+"""
+
+from .repository import Repository, SQLiteRepository, ConnectionPool
+
+# The names this package exports.
+__all__ = ["Repository", "SQLiteRepository", "ConnectionPool"]
@@ -0,0 +1,292 @@
+"""
+Description: Repositories that store library items and users in a backing
+store and look them up by id, with a SQLite implementation that writes in
+bulk through a pool of connections.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# abc: Makes Repository an abstract base class, so an incomplete subclass cannot be created.
+# sqlite3: The local backing store.
+# queue: Hands idle pooled connections to threads, blocking when none is free.
+# contextlib: Turns a connection checkout into a with statement.
+import sqlite3
+import queue
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import GENRES_BY_CODE
+from borrower_status import STATUSES_BY_CODE
+
+class Repository(ABC):
+    """
+    The interface of a store of library items and users.
+
+    Lookups return None for ids that are not stored.  Subclasses must
+    implement every method except write_changes, which by default applies
+    each change on its own; a subclass that leaves one out cannot be created.
+    """
+
+    @abstractmethod
+    def get_item(self, item_id):
+        """Returns the LibraryItem with the given id, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_user(self, user_id):
+        """Returns the LibraryUser with the given id, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_items(self, items):
+        """Inserts or updates library items."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_users(self, users):
+        """Inserts or updates library users."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_borrowed(self, item_id, is_borrowed):
+        """Changes the borrowed status of a stored item."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_status(self, user_id, status):
+        """Changes the status of a stored user."""
+        raise NotImplementedError
+
+    def write_changes(self, borrowed, statuses):
+        """
+        Applies many borrowed-status and user-status changes.
+
+        Args:
+            borrowed (dict): item_id -> is_borrowed.
+            statuses (dict): user_id -> BorrowerStatus.
+        """
+        for item_id, is_borrowed in borrowed.items():
+            self.set_borrowed(item_id, is_borrowed)
+        for user_id, status in statuses.items():
+            self.set_status(user_id, status)
+
+class ConnectionPool:
+    """
+    A class to share a fixed number of SQLite connections between threads.
+
+    A thread checks a connection out for the length of a with statement,
+    so no two threads ever use one connection at once.  File databases are
+    put in write-ahead-log mode, which lets readers carry on while another
+    connection writes.  An in-memory database belongs to a single
+    connection, so its pool always holds exactly one.
+
+    Attributes:
+        size (int): The number of connections.
+    """
+
+    def __init__(self, path=":memory:", size=4, timeout=30.0):
+        """
+        Opens the pooled connections.
+
+        Args:
+            path (str, optional): The database file. Defaults to an in-memory database.
+            size (int, optional): The number of connections for a file database. Defaults to 4.
+            timeout (float, optional): Seconds to wait for a database lock. Defaults to 30.
+
+        Raises:
+            ValueError: If size is not a positive integer.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("Pool size must be a positive integer.")
+
+        self.size = 1 if path == ":memory:" else size
+        self.__idle = queue.LifoQueue()
+        self.__connections = []
+        for _ in range(self.size):
+            connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+            if path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+                # In WAL mode, NORMAL only syncs at checkpoints and stays safe against corruption.
+                connection.execute("PRAGMA synchronous=NORMAL")
+            self.__connections.append(connection)
+            self.__idle.put(connection)
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks a connection out, waiting for one to be free.
+
+        Yields:
+            sqlite3.Connection: A connection no other thread is using.
+        """
+        connection = self.__idle.get()
+        try:
+            yield connection
+        finally:
+            self.__idle.put(connection)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Checks a connection out and commits on success, or rolls back on error.
+
+        Yields:
+            sqlite3.Connection: A connection inside an open transaction.
+        """
+        with self.connection() as connection, connection:
+            yield connection
+
+    def close(self):
+        """
+        Closes every connection.
+        """
+        for connection in self.__connections:
+            connection.close()
+        self.__connections = []
+
+class SQLiteRepository(Repository):
+    """
+    A class to store library items and users in a SQLite database.
+
+    Genres and statuses are stored as their one-byte codes.  Saves are
+    upserts sent with one executemany call per batch, so a whole batch is
+    one prepared statement and one transaction.  Connections come from a
+    ConnectionPool, so threads can read and write concurrently.
+
+    Attributes:
+        pool (ConnectionPool): The pooled connections.
+    """
+
+    def __init__(self, path=":memory:", pool_size=4):
+        """
+        Opens or creates the database.
+
+        Args:
+            path (str, optional): The database file. Defaults to an in-memory database.
+            pool_size (int, optional): The number of pooled connections. Defaults to 4.
+
+        Raises:
+            ValueError: If pool_size is not a positive integer.
+        """
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.transaction() as connection:
+            connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_item(self, item_id):
+        with self.pool.connection() as connection:
+            row = connection.execute(_SELECT_ITEMS + " WHERE item_id = ?", (item_id,)).fetchone()
+        return None if row is None else _item(row)
+
+    def get_user(self, user_id):
+        with self.pool.connection() as connection:
+            row = connection.execute(_SELECT_USERS + " WHERE user_id = ?", (user_id,)).fetchone()
+        return None if row is None else _user(row)
+
+    def load_items(self):
+        """
+        Returns every stored item, in id order.
+
+        Returns:
+            list of LibraryItem: The stored items.
+        """
+        with self.pool.connection() as connection:
+            rows = connection.execute(_SELECT_ITEMS + " ORDER BY item_id").fetchall()
+        return [_item(row) for row in rows]
+
+    def load_users(self):
+        """
+        Returns every stored user, in id order.
+
+        Returns:
+            list of LibraryUser: The stored users.
+        """
+        with self.pool.connection() as connection:
+            rows = connection.execute(_SELECT_USERS + " ORDER BY user_id").fetchall()
+        return [_user(row) for row in rows]
+
+    def save_items(self, items):
+        rows = [(item.item_id, item.title, item.author, item.publication_year, item.genre.code, item.is_borrowed)
+                for item in items]
+        with self.pool.transaction() as connection:
+            connection.executemany(_UPSERT_ITEMS, rows)
+
+    def save_users(self, users):
+        rows = [(user.user_id, user.name, user.email, user.status.code) for user in users]
+        with self.pool.transaction() as connection:
+            connection.executemany(_UPSERT_USERS, rows)
+
+    def set_borrowed(self, item_id, is_borrowed):
+        self.write_changes({item_id: is_borrowed}, {})
+
+    def set_status(self, user_id, status):
+        self.write_changes({}, {user_id: status})
+
+    def write_changes(self, borrowed, statuses):
+        """
+        Applies many borrowed-status and user-status changes in one transaction.
+
+        Args:
+            borrowed (dict): item_id -> is_borrowed.
+            statuses (dict): user_id -> BorrowerStatus.
+        """
+        with self.pool.transaction() as connection:
+            if borrowed:
+                connection.executemany("UPDATE items SET is_borrowed = ? WHERE item_id = ?",
+                                       [(is_borrowed, item_id) for item_id, is_borrowed in borrowed.items()])
+            if statuses:
+                connection.executemany("UPDATE users SET status = ? WHERE user_id = ?",
+                                       [(status.code, user_id) for user_id, status in statuses.items()])
+
+    def close(self):
+        """
+        Closes the database connections.
+        """
+        self.pool.close()
+
+def _item(row):
+    # Build a LibraryItem from an items row.
+    item_id, title, author, publication_year, genre, is_borrowed = row
+    return LibraryItem(item_id, title, author, publication_year, GENRES_BY_CODE[genre], bool(is_borrowed))
+
+def _user(row):
+    # Build a LibraryUser from a users row.
+    user_id, name, email, status = row
+    return LibraryUser(user_id, name, email, STATUSES_BY_CODE[status])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    item_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    publication_year INTEGER NOT NULL,
+    genre INTEGER NOT NULL,
+    is_borrowed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    status INTEGER NOT NULL
+);
+"""
+
+_SELECT_ITEMS = "SELECT item_id, title, author, publication_year, genre, is_borrowed FROM items"
+_SELECT_USERS = "SELECT user_id, name, email, status FROM users"
+
+# Upserts update rows in place, where INSERT OR REPLACE would delete and re-insert them.
+_UPSERT_ITEMS = """
+INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (item_id) DO UPDATE SET title = excluded.title, author = excluded.author,
+    publication_year = excluded.publication_year, genre = excluded.genre, is_borrowed = excluded.is_borrowed
+"""
+_UPSERT_USERS = """
+INSERT INTO users VALUES (?, ?, ?, ?)
+ON CONFLICT (user_id) DO UPDATE SET name = excluded.name, email = excluded.email, status = excluded.status
+"""
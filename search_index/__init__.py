@@ -0,0 +1,9 @@
+"""
+Description: The search_index package.  It re-exports the public names of
+search_index/search_index.py.
+"""
+
+from .search_index import tokenize, SearchIndex
+
+# The names this package exports.
+__all__ = ["tokenize", "SearchIndex"]
@@ -0,0 +1,231 @@
+"""
+Description: An inverted index over LibraryItem titles and authors for 
+ranked, prefix-matching search filtered by genre and availability.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# bisect: Finds the range of indexed tokens that start with a query prefix.
+# heapq: Picks the best ranked results without sorting every match.
+# re: Splits text into word tokens.
+import bisect
+import heapq
+import re
+
+# Words are runs of letters and digits; punctuation separates them.
+_WORD = re.compile(r"\w+")
+
+# How much a token found in each field contributes to an item's score.
+_TITLE_WEIGHT = 2
+_AUTHOR_WEIGHT = 1
+
+def tokenize(text):
+    """
+    Splits text into case-folded word tokens.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list of str: The tokens, in order.
+    """
+    return _WORD.findall(text.casefold())
+
+class SearchIndex:
+    """
+    A class to search library items by words of their title and author.
+
+    Every token maps to a posting dictionary of item_id -> weight, where a
+    title match weighs more than an author match.  Query words match 
+    indexed tokens exactly or as a prefix ("gats" finds "gatsby"); prefix
+    matches are found with a binary search over the sorted vocabulary and
+    score half as much as exact ones.  An item must match every query word.
+
+    A prefix matches every token it starts, unless max_expansions caps how
+    many tokens it may expand to; a search that hit the cap sets truncated,
+    since items matching only the dropped tokens are missing from it.
+
+    Attributes:
+        size (int): The number of items in the index.
+        truncated (bool): Whether the last search left out prefix matches because of max_expansions.
+    """
+
+    def __init__(self, items=(), min_prefix=2, max_expansions=None):
+        """
+        Initializes the SearchIndex, optionally loading it with items.
+
+        Args:
+            items (iterable, optional): LibraryItem-compatible objects to index.
+            min_prefix (int, optional): The shortest query word that is matched as a prefix. Defaults to 2.
+            max_expansions (int, optional): The most indexed tokens one prefix may expand to. Defaults to no limit.
+
+        Raises:
+            ValueError: If an item_id is duplicated, or max_expansions is not a positive integer.
+        """
+        if max_expansions is not None and (not isinstance(max_expansions, int) or max_expansions <= 0):
+            raise ValueError("Maximum expansions must be a positive integer.")
+        self.__items = {}
+        self.__postings = {}
+        self.__min_prefix = min_prefix
+        self.__max_expansions = max_expansions
+        self.truncated = False
+
+        # Sorted vocabulary for prefix search; new tokens wait in a list until the next query.
+        self.__vocabulary = []
+        self.__new_tokens = []
+
+        for item in items:
+            self.add(item)
+
+    # Property to access the number of indexed items.
+    @property
+    def size(self):
+        return len(self.__items)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def add(self, item):
+        """
+        Adds an item to the index.
+
+        Args:
+            item (LibraryItem): The item to index.
+
+        Raises:
+            ValueError: If the item_id is already in the index.
+        """
+        if item.item_id in self.__items:
+            raise ValueError("Item Id already exists in the index.")
+        self.__items[item.item_id] = item
+        for token, weight in self.__weights(item).items():
+            postings = self.__postings.get(token)
+            if postings is None:
+                postings = self.__postings[token] = {}
+                self.__new_tokens.append(token)
+            postings[item.item_id] = weight
+
+    def remove(self, item_id):
+        """
+        Removes an item from the index.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the item_id is not in the index.
+        """
+        item = self.__items.pop(item_id, None)
+        if item is None:
+            raise ValueError("Item Id not found in the index.")
+        for token in self.__weights(item):
+            postings = self.__postings[token]
+            del postings[item_id]
+            # Unused tokens stay in the sorted vocabulary and are skipped by searches.
+            if not postings:
+                del self.__postings[token]
+
+    def search(self, query, genre=None, available_only=False, limit=10):
+        """
+        Returns the items best matching a query.
+
+        Args:
+            query (str): Words to look for in titles and authors.
+            genre (Genre, optional): Only return items of this genre.
+            available_only (bool, optional): Only return items that are not borrowed. Defaults to False.
+            limit (int, optional): The most results to return. Defaults to 10.
+
+        Returns:
+            list: The matching LibraryItem objects, best match first.
+        """
+        self.truncated = False
+        words = tokenize(query)
+        if not words:
+            return []
+
+        # Score each word separately, then keep the items that match every word,
+        # starting from the word with the fewest matches.
+        scored = sorted((self.__match(word) for word in dict.fromkeys(words)), key=len)
+        scores = scored[0]
+        for other in scored[1:]:
+            scores = {item_id: score + other[item_id] for item_id, score in scores.items() if item_id in other}
+            if not scores:
+                return []
+
+        # Highest score first, ties broken by the lowest item_id.
+        items = self.__items
+        if genre is None and not available_only:
+            best = heapq.nsmallest(limit, zip(map(float.__neg__, map(float, scores.values())), scores))
+            return [items[item_id] for score, item_id in best]
+
+        # With filters, pop candidates in rank order from a heap until enough pass.
+        ranked = list(zip(map(float.__neg__, map(float, scores.values())), scores))
+        heapq.heapify(ranked)
+        results = []
+        while ranked:
+            score, item_id = heapq.heappop(ranked)
+            item = items[item_id]
+            if (genre is None or item.genre == genre) and not (available_only and item.is_borrowed):
+                results.append(item)
+                if len(results) == limit:
+                    break
+        return results
+
+    def __match(self, word):
+        # Return item_id -> score for every item with a token equal to or starting with word.
+        # The exact postings are returned as they are, without a copy, when nothing else matches.
+        exact = self.__postings.get(word, {})
+        tokens = self.__expand(word) if len(word) >= self.__min_prefix else []
+        if not tokens:
+            return exact
+        scores = dict(exact)
+        for token in tokens:
+            for item_id, weight in self.__postings[token].items():
+                # A prefix match scores half, and never beats the item's exact match.
+                score = weight / 2
+                if scores.get(item_id, 0) < score:
+                    scores[item_id] = score
+        return scores
+
+    def __expand(self, prefix):
+        # Return the indexed tokens, other than prefix itself, that start with prefix,
+        # noting when max_expansions leaves some of them out.
+        if self.__new_tokens:
+            self.__merge_new_tokens()
+        vocabulary = self.__vocabulary
+        limit = self.__max_expansions
+        tokens = []
+        position = bisect.bisect_right(vocabulary, prefix)
+        while position < len(vocabulary):
+            token = vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            if token in self.__postings:
+                if len(tokens) == limit:
+                    self.truncated = True
+                    break
+                tokens.append(token)
+            position += 1
+        return tokens
+
+    def __merge_new_tokens(self):
+        # A few new tokens are inserted in place; many are merged with one sort,
+        # which also drops tokens whose items have all been removed.
+        vocabulary = self.__vocabulary
+        if len(self.__new_tokens) <= 64:
+            for token in self.__new_tokens:
+                position = bisect.bisect_left(vocabulary, token)
+                if position == len(vocabulary) or vocabulary[position] != token:
+                    vocabulary.insert(position, token)
+        else:
+            vocabulary.extend(self.__new_tokens)
+            self.__vocabulary = sorted(token for token in set(vocabulary) if token in self.__postings)
+        self.__new_tokens.clear()
+
+    @staticmethod
+    def __weights(item):
+        # Return token -> weight for an item, counting each field once per token.
+        weights = dict.fromkeys(tokenize(item.author), _AUTHOR_WEIGHT)
+        for token in set(tokenize(item.title)):
+            weights[token] = weights.get(token, 0) + _TITLE_WEIGHT
+        return weights
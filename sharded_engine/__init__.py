@@ -0,0 +1,9 @@
+"""
+Description: The sharded_engine package.  It re-exports the public names of
+sharded_engine/sharded_engine.py.
+"""
+
+from .sharded_engine import ShardedEngine
+
+# The names this package exports.
+__all__ = ["ShardedEngine"]
@@ -0,0 +1,390 @@
+"""
+Description: A circulation engine whose state is sharded across worker
+processes, so borrowing and returning scale past one core.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# multiprocessing: Starts the shard workers and connects them with pipes.
+# shared_memory: Holds the item bitset and user status bytes every process can read.
+# os: Supplies the default number of shards.
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+from library_user import LibraryUser
+
+_DELINQUENT = BorrowerStatus.DELINQUENT.code
+_ACTIVE = BorrowerStatus.ACTIVE.code
+
+class _Layout:
+    """
+    Where each item's bit and each user's status byte live in shared memory.
+
+    An item belongs to shard item_id % shards and a user to shard
+    user_id % shards.  Within its shard each id is given the next free
+    slot, so the memory needed grows with the number of items and users
+    rather than with the largest id.  Each shard's items and users are
+    stored in their own contiguous region, so a shard only ever writes
+    bytes that no other shard writes, and no locking is needed between
+    processes.
+    """
+
+    def __init__(self, shards, item_ids, user_ids):
+        self.shards = shards
+        item_slots, self.item_capacity = _slots(shards, item_ids)
+        user_slots, self.user_capacity = _slots(shards, user_ids)
+        self.item_bytes = (self.item_capacity + 7) // 8
+
+        # item_id -> (byte offset, bit mask) and user_id -> byte offset, for every known id.
+        self.items = {item_id: (shard * self.item_bytes + (slot >> 3), 1 << (slot & 7))
+                      for item_id, (shard, slot) in item_slots.items()}
+        self.users = {user_id: shard * self.user_capacity + slot
+                      for user_id, (shard, slot) in user_slots.items()}
+
+    def item_bit(self, item_id):
+        # Returns (byte offset, bit mask) of the item within the bitset, or None if it is not known.
+        return self.items.get(item_id)
+
+    def user_byte(self, user_id):
+        # Returns the offset of the user's status byte, or None if it is not known.
+        return self.users.get(user_id)
+
+def _slots(shards, ids):
+    # Numbers each shard's ids in order; returns id -> (shard, slot) and the largest shard's count.
+    slots = {}
+    counts = [0] * shards
+    for id_ in ids:
+        if id_ not in slots:
+            shard = id_ % shards
+            slots[id_] = (shard, counts[shard])
+            counts[shard] += 1
+    return slots, max(max(counts), 1)
+
+class ShardedEngine:
+    """
+    A class to borrow and return items across a pool of worker processes.
+
+    Each item is owned by exactly one shard, chosen by item_id % shards, and
+    each user by user_id % shards; only the owning worker changes their
+    state.  Requests are handled in batches: a borrow first claims the item
+    on the item's shard, then charges the loan to the user's quota on the
+    user's shard, and gives the item back if the user is at their quota.
+    Every shard works through its part of each phase in parallel.
+
+    Whether an item is borrowed is kept in a shared-memory bitset, and each
+    user's status in a shared byte array, so any process can read them
+    without a round trip to the owning shard.  The workers start from the
+    users' loans, so items lent before the engine started can only be
+    returned by their holders, and a DELINQUENT user with an overdue loan
+    stays DELINQUENT until it is returned.
+
+    Attributes:
+        shards (int): The number of worker processes.
+    """
+
+    def __init__(self, items, users, shards=None):
+        """
+        Initializes the ShardedEngine and starts its workers.
+
+        Args:
+            items (iterable of LibraryItem): The items to circulate.
+            users (iterable of LibraryUser): The users who may borrow them.
+            shards (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+        Raises:
+            ValueError: If shards is not a positive integer.
+        """
+        shards = (os.cpu_count() or 1) if shards is None else shards
+        if not isinstance(shards, int) or shards <= 0:
+            raise ValueError("Shards must be a positive integer.")
+
+        items = [(item.item_id, item.is_borrowed) for item in items]
+        users = list(users)
+        self.__layout = layout = _Layout(shards, (item_id for item_id, _ in items), (user.user_id for user in users))
+
+        # The item bitset followed by the user status bytes.
+        size = shards * layout.item_bytes + shards * layout.user_capacity
+        self.__memory = shared_memory.SharedMemory(create=True, size=size)
+        self.__borrowed = self.__memory.buf[:shards * layout.item_bytes]
+        self.__statuses = self.__memory.buf[shards * layout.item_bytes:size]
+        for item_id, is_borrowed in items:
+            if is_borrowed:
+                offset, mask = layout.item_bit(item_id)
+                self.__borrowed[offset] |= mask
+
+        # Each worker starts with the holders of its items, and the loan counts and overdue items of its users.
+        seeds = [({}, {}, {}) for _ in range(shards)]
+        for user in users:
+            self.__statuses[layout.user_byte(user.user_id)] = user.status.code
+            held = [item_id for item_id in user.loans if item_id in layout.items]
+            for item_id in held:
+                offset, mask = layout.item_bit(item_id)
+                self.__borrowed[offset] |= mask
+                seeds[item_id % shards][0][item_id] = user.user_id
+            _, counts, overdue = seeds[user.user_id % shards]
+            if user.loans:
+                counts[user.user_id] = len(user.loans)
+            if user.overdue:
+                overdue[user.user_id] = set(user.overdue)
+
+        quotas = tuple(LibraryUser.quota_for(status) for status in STATUSES_BY_CODE)
+        self.__connections = []
+        self.__workers = []
+        for shard in range(shards):
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_serve, daemon=True,
+                                             args=(child, self.__memory.name, layout, quotas, *seeds[shard]))
+            worker.start()
+            child.close()
+            self.__connections.append(parent)
+            self.__workers.append(worker)
+
+    # Property to access the number of shards.
+    @property
+    def shards(self):
+        return self.__layout.shards
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def is_borrowed(self, item_id):
+        """
+        Returns whether an item is borrowed, read straight from shared memory.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+
+        Raises:
+            ValueError: If the item is not known to the engine.
+
+        Returns:
+            bool: True if the item is on loan.
+        """
+        offset, mask = self.__item_bit(item_id)
+        return bool(self.__borrowed[offset] & mask)
+
+    def status_of(self, user_id):
+        """
+        Returns a user's status, read straight from shared memory.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+
+        Raises:
+            ValueError: If the user is not known to the engine.
+
+        Returns:
+            BorrowerStatus: The user's current status.
+        """
+        return STATUSES_BY_CODE[self.__statuses[self.__user_byte(user_id)]]
+
+    def borrow_many(self, pairs):
+        """
+        Lends items to users, following the rules of LibraryUser.can_borrow.
+
+        Pairs are handled in order within each shard, so when several pairs
+        ask for the same item the first one gets it.  Every item in a batch
+        is claimed before any quota is charged, so an item refused to a user
+        at their quota is not offered to a later pair in the same batch.
+
+        Args:
+            pairs (list of tuple): (user_id, item_id) pairs.
+
+        Raises:
+            ValueError: If a user or item is not known to the engine.
+
+        Returns:
+            list of bool: For each pair, True if the item was lent to the user.
+        """
+        self.__check(pairs)
+        claimed = self.__scatter("claim", pairs, lambda pair: pair[1])
+        won = [pair for pair, ok in zip(pairs, claimed) if ok]
+        charged = iter(self.__scatter("charge", won, lambda pair: pair[0]))
+
+        # Give back the items of users who turned out to be at their quota.
+        results = [ok and next(charged) for ok in claimed]
+        refused = [pair for pair, ok, result in zip(pairs, claimed, results) if ok and not result]
+        if refused:
+            self.__scatter("unclaim", refused, lambda pair: pair[1])
+        return results
+
+    def return_many(self, pairs):
+        """
+        Takes items back from the users holding them.
+
+        Only the user holding an item can return it.  A DELINQUENT user
+        becomes ACTIVE once none of the loans they still hold is overdue,
+        as in LibraryUser.return_item.
+
+        Args:
+            pairs (list of tuple): (user_id, item_id) pairs.
+
+        Raises:
+            ValueError: If a user or item is not known to the engine.
+
+        Returns:
+            list of bool: For each pair, True if the item was returned; False if the user did not hold it.
+        """
+        self.__check(pairs)
+        released = self.__scatter("release", pairs, lambda pair: pair[1])
+        self.__scatter("discharge", [pair for pair, ok in zip(pairs, released) if ok], lambda pair: pair[0])
+        return released
+
+    def borrow(self, user_id, item_id):
+        """
+        Lends one item to one user.
+
+        Raises:
+            Exception: If the user cannot borrow the item.
+        """
+        if not self.borrow_many([(user_id, item_id)])[0]:
+            raise Exception("The user cannot borrow the item.")
+
+    def return_item(self, user_id, item_id):
+        """
+        Takes one item back from the user holding it.
+
+        Raises:
+            Exception: If the user has not borrowed the item.
+        """
+        if not self.return_many([(user_id, item_id)])[0]:
+            raise Exception("The user has not borrowed the item.")
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory.
+        """
+        if not self.__workers:
+            return
+        for connection in self.__connections:
+            connection.send(("stop", None))
+        for worker in self.__workers:
+            worker.join()
+        for connection in self.__connections:
+            connection.close()
+        self.__workers = []
+        del self.__borrowed, self.__statuses
+        self.__memory.close()
+        self.__memory.unlink()
+
+    def __check(self, pairs):
+        # Reject unknown ids up front so workers only ever see known ones.
+        for user_id, item_id in pairs:
+            self.__user_byte(user_id)
+            self.__item_bit(item_id)
+
+    def __item_bit(self, item_id):
+        location = self.__layout.item_bit(item_id) if isinstance(item_id, int) else None
+        if location is None:
+            raise ValueError("Item Id not found in the catalog.")
+        return location
+
+    def __user_byte(self, user_id):
+        offset = self.__layout.user_byte(user_id) if isinstance(user_id, int) else None
+        if offset is None:
+            raise ValueError("User Id not found.")
+        return offset
+
+    def __scatter(self, operation, pairs, key):
+        # Send each shard its pairs, in order, then gather the replies back into input order.
+        shards = self.__layout.shards
+        batches = [[] for _ in range(shards)]
+        positions = [[] for _ in range(shards)]
+        for position, pair in enumerate(pairs):
+            shard = key(pair) % shards
+            batches[shard].append(pair)
+            positions[shard].append(position)
+
+        busy = [shard for shard in range(shards) if batches[shard]]
+        for shard in busy:
+            self.__connections[shard].send((operation, batches[shard]))
+        results = [None] * len(pairs)
+        for shard in busy:
+            for position, result in zip(positions[shard], self.__connections[shard].recv()):
+                results[position] = result
+        return results
+
+def _serve(connection, name, layout, quotas, holders, counts, overdue):
+    # The worker loop: owns the holders of its items, and the loan counts and overdue items of its users.
+    memory = shared_memory.SharedMemory(name=name)
+    region = layout.shards * layout.item_bytes
+    borrowed = memory.buf[:region]
+    statuses = memory.buf[region:]
+    # Workers only ever see known ids, so the layout's tables are indexed directly.
+    item_bits = layout.items
+    user_bytes = layout.users
+
+    def claim(pairs):
+        results = []
+        for user_id, item_id in pairs:
+            offset, mask = item_bits[item_id]
+            if borrowed[offset] & mask or statuses[user_bytes[user_id]] == _DELINQUENT:
+                results.append(False)
+                continue
+            borrowed[offset] |= mask
+            holders[item_id] = user_id
+            results.append(True)
+        return results
+
+    def charge(pairs):
+        results = []
+        for user_id, _ in pairs:
+            count = counts.get(user_id, 0)
+            if count >= quotas[statuses[user_bytes[user_id]]]:
+                results.append(False)
+                continue
+            counts[user_id] = count + 1
+            results.append(True)
+        return results
+
+    def unclaim(pairs):
+        for _, item_id in pairs:
+            offset, mask = item_bits[item_id]
+            borrowed[offset] &= ~mask & 0xFF
+            del holders[item_id]
+        return [True] * len(pairs)
+
+    def release(pairs):
+        # Items borrowed before the engine started that no user listed have no holder, and cannot be returned.
+        results = []
+        for user_id, item_id in pairs:
+            if holders.get(item_id) != user_id:
+                results.append(False)
+                continue
+            offset, mask = item_bits[item_id]
+            borrowed[offset] &= ~mask & 0xFF
+            del holders[item_id]
+            results.append(True)
+        return results
+
+    def discharge(pairs):
+        for user_id, item_id in pairs:
+            if counts.get(user_id, 0) > 1:
+                counts[user_id] -= 1
+            else:
+                counts.pop(user_id, None)
+            items = overdue.get(user_id)
+            if items is not None:
+                items.discard(item_id)
+                if items:
+                    continue
+                del overdue[user_id]
+            offset = user_bytes[user_id]
+            if statuses[offset] == _DELINQUENT:
+                statuses[offset] = _ACTIVE
+        return [True] * len(pairs)
+
+    operations = {"claim": claim, "charge": charge, "unclaim": unclaim, "release": release, "discharge": discharge}
+    try:
+        while True:
+            operation, pairs = connection.recv()
+            if operation == "stop":
+                break
+            connection.send(operations[operation](pairs))
+    finally:
+        del borrowed, statuses
+        memory.close()
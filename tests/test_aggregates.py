@@ -0,0 +1,222 @@
+"""
+Description: Unit tests for the incrementally maintained aggregates,
+checked against a brute-force recount.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_aggregates.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import threading
+import unittest
+import aggregates  # Importing the aggregates module to be tested.
+import instrumentation
+from aggregates import Aggregates
+from catalog import Catalog
+from checkout_engine import CheckoutEngine
+from loan_scheduler import OverdueScheduler
+from library_item import LibraryItem, SlottedLibraryItem
+from library_user import LibraryUser
+from genre import Genre, GENRES_BY_CODE
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+from repository import SQLiteRepository
+
+def recount(items, users):
+    """Count items and users from scratch, the way a dashboard refresh would"""
+    by_genre = {genre: 0 for genre in GENRES_BY_CODE}
+    by_decade = {}
+    by_status = {status: 0 for status in STATUSES_BY_CODE}
+    borrowed = 0
+    for item in items:
+        by_genre[item.genre] += 1
+        decade = item.publication_year // 10 * 10
+        by_decade[decade] = by_decade.get(decade, 0) + 1
+        borrowed += item.is_borrowed
+    for user in users:
+        by_status[user.status] += 1
+    return (len(items), borrowed, len(items) - borrowed, by_genre, dict(sorted(by_decade.items())),
+            len(users), by_status)
+
+# Defining the test class for the aggregates, inheriting from unittest.TestCase.
+class TestAggregates(unittest.TestCase):
+
+    def setUp(self):
+        """Start tracking with no existing objects"""
+        self.aggregates = aggregates.track()
+
+    def tearDown(self):
+        aggregates.untrack()
+
+    def test_catalog_membership_is_counted(self):
+        """Test that items are counted when catalogued, and construction alone counts nothing"""
+        items = [LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI),
+                 SlottedLibraryItem(101, "Emma", "Jane Austen", 1815, Genre.FICTION, True)]
+        LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.MINOR)
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount([], []))
+        catalog = Catalog(items)
+        with self.assertRaises(ValueError):
+            catalog.add(items[0])
+        snapshot = self.aggregates.snapshot()
+        self.assertEqual(tuple(snapshot), recount(items, []))
+        self.assertEqual(snapshot.items_by_decade, {1810: 1, 1960: 1})
+        catalog.remove(100)
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount(items[1:], []))
+
+    def test_objects_rebuilt_from_storage_are_not_recounted(self):
+        """Test that saving counts by id, so loading and saving again changes nothing"""
+        items, _ = LibraryItem.from_records([(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, True),
+                                             (101, "Emma", "Jane Austen", 1815, Genre.FICTION, False)])
+        users, _ = LibraryUser.from_records([(100, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)])
+        with SQLiteRepository() as repository:
+            repository.save_items(items)
+            repository.save_users(users)
+            self.assertEqual(tuple(self.aggregates.snapshot()), recount(items, users))
+            loaded_items, loaded_users = repository.load_items(), repository.load_users()
+            repository.save_items(loaded_items)
+            repository.save_users(loaded_users)
+            Catalog(loaded_items)
+            self.assertEqual(tuple(self.aggregates.snapshot()), recount(items, users))
+            # Changes written straight to storage are counted too.
+            repository.write_changes({101: True}, {100: BorrowerStatus.DELINQUENT})
+            self.assertEqual(tuple(self.aggregates.snapshot()),
+                             recount(repository.load_items(), repository.load_users()))
+
+    def test_borrow_return_and_status_changes(self):
+        """Test that borrowing, returning and status changes move the counts"""
+        item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)
+        user = LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)
+        self.aggregates.add_item(item)
+        self.aggregates.add_user(user)
+        user.borrow_item(item)
+        self.assertEqual(self.aggregates.snapshot().borrowed, 1)
+        user.status = BorrowerStatus.DELINQUENT
+        self.assertEqual(self.aggregates.snapshot().users_by_status[BorrowerStatus.DELINQUENT], 1)
+        # Returning reinstates a DELINQUENT user without going through the status setter.
+        user.return_item(item)
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount([item], [user]))
+
+    def test_existing_objects_and_removal(self):
+        """Test seeding with objects made before tracking, and removing them"""
+        aggregates.untrack()
+        item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, True)
+        user = LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)
+        counts = aggregates.track([item], [user])
+        self.assertEqual(tuple(counts.snapshot()), recount([item], [user]))
+        counts.remove_item(item)
+        counts.remove_user(user)
+        self.assertEqual(tuple(counts.snapshot()), recount([], []))
+
+    def test_untrack_restores_methods(self):
+        """Test that untracking puts the original methods back"""
+        self.assertTrue(aggregates.is_tracking())
+        aggregates.untrack()
+        self.assertFalse(aggregates.is_tracking())
+        self.assertNotIn("__wrapped__", vars(Catalog.add))
+        Catalog([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)])
+        self.assertEqual(self.aggregates.snapshot().items, 0)
+
+    def test_works_under_instrumentation(self):
+        """Test tracking combined with instrumentation, stopped in reverse order"""
+        instrumentation.enable(sample_every=1)
+        try:
+            item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)
+            user = LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.DELINQUENT)
+            Catalog([item])
+            self.aggregates.add_user(user)
+            user.return_item()
+        finally:
+            instrumentation.disable()
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount([item], [user]))
+        self.assertTrue(aggregates.is_tracking())
+
+    def test_random_operations_match_recount(self):
+        """Test many random circulation events against a brute-force recount"""
+        rng = random.Random(22)
+        now = 0.0
+        scheduler = OverdueScheduler(loan_period=10.0, clock=lambda: now)
+        engine = CheckoutEngine(scheduler=scheduler)
+        items = [LibraryItem(100 + n, f"Title {n}", "Author", rng.randrange(1900, 2030),
+                             rng.choice(GENRES_BY_CODE), False) for n in range(60)]
+        users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", rng.choice(STATUSES_BY_CODE))
+                 for n in range(20)]
+        Catalog(items)
+        for user in users:
+            self.aggregates.add_user(user)
+        for step in range(3000):
+            now = float(step)
+            user, item = rng.choice(users), rng.choice(items)
+            action = rng.random()
+            if action < 0.4:
+                try:
+                    engine.borrow(user, item)
+                except Exception:
+                    pass
+            elif action < 0.8:
+                holder = engine.holder_of(item.item_id)
+                if holder is not None:
+                    engine.return_item(users[holder - 100], item)
+            elif action < 0.9:
+                user.status = rng.choice(STATUSES_BY_CODE)
+            else:
+                engine.advance()
+            if step % 100 == 0:
+                self.assertEqual(tuple(self.aggregates.snapshot()), recount(items, users))
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount(items, users))
+
+    def test_concurrent_updates(self):
+        """Stress test: counts stay exact while threads borrow and return"""
+        items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION) for n in range(16)]
+        Catalog(items)
+        engine = CheckoutEngine()
+
+        def worker(user_id):
+            user = LibraryUser(user_id, "User", f"user{user_id}@example.com", BorrowerStatus.ACTIVE)
+            self.aggregates.add_user(user)
+            rng = random.Random(user_id)
+            for _ in range(500):
+                item = rng.choice(items)
+                try:
+                    engine.borrow(user, item)
+                except Exception:
+                    continue
+                engine.return_item(user, item)
+
+        threads = [threading.Thread(target=worker, args=(100 + n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = self.aggregates.snapshot()
+        self.assertEqual((snapshot.items, snapshot.borrowed, snapshot.users), (16, 0, 8))
+
+    def test_racing_status_changes(self):
+        """Stress test: threads setting one user's status leave the count on the status it ends with"""
+        user = LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)
+        self.aggregates.add_user(user)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for _ in range(2000):
+                user.status = rng.choice(STATUSES_BY_CODE)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(tuple(self.aggregates.snapshot()), recount([], [user]))
+
+    def test_seeded_aggregates_match_recount(self):
+        """Test that building Aggregates from objects is the same as a recount"""
+        aggregates.untrack()
+        items = [LibraryItem(100 + n, "Title", "Author", 1950 + n, GENRES_BY_CODE[n % 8], n % 3 == 0)
+                 for n in range(50)]
+        users = [LibraryUser(100 + n, "User", f"user{n}@example.com", STATUSES_BY_CODE[n % 4]) for n in range(10)]
+        self.assertEqual(tuple(Aggregates(items, users).snapshot()), recount(items, users))
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
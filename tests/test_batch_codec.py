@@ -0,0 +1,140 @@
+"""
+Description: Unit tests for the binary batch codec.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_batch_codec.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import struct
+import unittest
+from batch_codec import decode, encode_items, encode_users, ItemBatch, UserBatch  # Importing the names to be tested.
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre, GENRES_BY_CODE
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE
+
+def item_fields(item):
+    return (item.item_id, item.title, item.author, item.publication_year, item.genre, item.is_borrowed)
+
+def user_fields(user):
+    return (user.user_id, user.name, user.email, user.status)
+
+# Defining the test class for the batch codec, inheriting from unittest.TestCase.
+class TestBatchCodec(unittest.TestCase):
+
+    def setUp(self):
+        """Create items and users with unordered ids, unicode strings and negative years"""
+        self.items = [LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, True),
+                      LibraryItem(2 ** 40, "Cien años de soledad", "Gabriel García Márquez", 1967, Genre.FICTION),
+                      LibraryItem(150, "The Odyssey", "Homer", -700, Genre.FANTASY, True),
+                      LibraryItem(101, "三体", "刘慈欣", 2008, Genre.SCIFI)]
+        self.users = [LibraryUser(500, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE),
+                      LibraryUser(100, "Zoë Brontë", "zoe@example.com", BorrowerStatus.MINOR)]
+
+    def test_items_round_trip(self):
+        """Test that every field of every item survives encoding and decoding"""
+        batch = decode(encode_items(self.items))
+        self.assertIsInstance(batch, ItemBatch)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual([item_fields(record) for record in batch], [item_fields(item) for item in self.items])
+        items, errors = batch.to_items()
+        self.assertEqual(errors, [])
+        self.assertEqual([item_fields(item) for item in items], [item_fields(item) for item in self.items])
+        self.assertEqual(item_fields(batch[1].to_item()), item_fields(self.items[1]))
+
+    def test_users_round_trip(self):
+        """Test that every field of every user survives encoding and decoding"""
+        batch = decode(encode_users(self.users))
+        self.assertIsInstance(batch, UserBatch)
+        self.assertEqual([user_fields(record) for record in batch], [user_fields(user) for user in self.users])
+        users, errors = batch.to_users()
+        self.assertEqual(errors, [])
+        self.assertEqual([user_fields(user) for user in users], [user_fields(user) for user in self.users])
+        self.assertEqual(user_fields(batch[-1].to_user()), user_fields(self.users[-1]))
+
+    def test_random_batches_round_trip(self):
+        """Test round trips of random batches of many sizes, crossing the bitmap's byte boundaries"""
+        rng = random.Random(23)
+        for count in (0, 1, 7, 8, 9, 300):
+            items = [LibraryItem(rng.randrange(100, 2 ** 62), rng.choice(["Title", "Título", "x" * 200]),
+                                 "Author", rng.randrange(-3000, 3000), rng.choice(GENRES_BY_CODE),
+                                 rng.random() < 0.5) for _ in range(count)]
+            users = [LibraryUser(rng.randrange(100, 10 ** 6), "Name", f"user{n}@example.com",
+                                 rng.choice(STATUSES_BY_CODE)) for n in range(count)]
+            self.assertEqual([item_fields(record) for record in decode(encode_items(items))],
+                             [item_fields(item) for item in items])
+            self.assertEqual([user_fields(record) for record in decode(encode_users(users))],
+                             [user_fields(user) for user in users])
+
+    def test_compact_encoding(self):
+        """Test that sequential ids, codes and flags take about a byte each"""
+        items = [LibraryItem(100 + n, "T", "A", 2000, Genre.FICTION, n % 2 == 0) for n in range(800)]
+        # One byte each for the id, year, genre and two string lengths, two for the strings, and a bit for the flag.
+        self.assertLess(len(encode_items(items)), 800 * 7 + 100 + 100)
+
+    def test_decoding_is_lazy_and_zero_copy(self):
+        """Test that decoding reads fields from the buffer only when they are used"""
+        data = bytearray(encode_items(self.items))
+        batch = decode(data)
+        # Bytes after the header can be changed without being noticed until a field is read.
+        position = data.rindex("刘慈欣".encode("utf-8"))
+        data[position:position + 3] = "王".encode("utf-8")
+        self.assertEqual(batch[3].author, "王慈欣")
+        with self.assertRaises(BufferError):
+            data.append(0)
+
+    def test_views_work_with_encode(self):
+        """Test that decoded records can be re-encoded directly"""
+        batch = decode(encode_items(self.items))
+        self.assertEqual(encode_items(batch), encode_items(self.items))
+        self.assertEqual([item_fields(record) for record in batch[1:3]], [item_fields(item) for item in self.items[1:3]])
+        with self.assertRaises(IndexError):
+            batch[4]
+
+    def test_invalid_batches(self):
+        """Test that truncated, corrupt or foreign buffers are rejected"""
+        data = encode_items(self.items)
+        for bad in (b"", b"LBAT", data[:-1], data + b"\x00", b"XXXX" + data[4:], with_version(data, 2)):
+            with self.assertRaises(ValueError) as context:
+                decode(bad)
+            self.assertEqual(str(context.exception), "Invalid batch.")
+
+    def test_out_of_range_code(self):
+        """Test that a status code outside the status table is rejected"""
+        data = bytearray(encode_users(self.users))
+        data[section_offset(data, 1)] = len(STATUSES_BY_CODE)
+        with self.assertRaises(ValueError):
+            decode(bytes(data))
+
+    def test_corrupt_strings_are_rejected_when_read(self):
+        """Test that string lengths that do not match the string bytes are caught on first use"""
+        data = bytearray(encode_users(self.users))
+        data[section_offset(data, 2)] += 1  # The length of the first name.
+        batch = decode(bytes(data))
+        with self.assertRaises(ValueError):
+            batch[0].name
+        self.assertEqual(batch[0].email, "ann@example.com")
+
+    def test_non_integer_year(self):
+        """Test that a publication year that is not an integer cannot be encoded"""
+        item = LibraryItem(100, "Dune", "Frank Herbert", "1965", Genre.SCIFI)
+        with self.assertRaises(ValueError) as context:
+            encode_items([item])
+        self.assertEqual(str(context.exception), "Publication Year must be numeric.")
+
+def with_version(data, version):
+    # A copy of data with a different format version in its header.
+    magic, _, kind, count = struct.unpack_from("<4sBBxxI", data)
+    return struct.pack("<4sBBxxI", magic, version, kind, count) + data[12:]
+
+def section_offset(data, section):
+    # The position of a section in an encoded user batch, after the header and the section table.
+    return 12 + 24 + sum(struct.unpack_from("<6I", data, 12)[:section])
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
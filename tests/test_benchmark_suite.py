@@ -0,0 +1,61 @@
+"""
+Description: Unit tests for the benchmark regression suite.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_benchmark_suite.py
+"""
+
+# Importing the necessary modules for testing.
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from benchmarks import suite  # Importing the benchmark suite to be tested.
+
+# Defining the test class for the benchmark suite, inheriting from unittest.TestCase.
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_run_times_every_case_and_size(self):
+        """Test that a small run produces a positive timing per case and size"""
+        results = suite.run(sizes=(10, 20), repeat=1)
+        self.assertEqual(len(results), len(suite.CASES) * 2)
+        self.assertIn("can_borrow[20]", results)
+        self.assertTrue(all(nanoseconds > 0 for nanoseconds in results.values()))
+
+    def test_compare_flags_only_regressions_over_threshold(self):
+        """Test the regression threshold"""
+        baseline = {"a[10]": 100.0, "b[10]": 100.0, "c[10]": 100.0}
+        results = {"a[10]": 124.0, "b[10]": 126.0, "c[10]": 50.0, "d[10]": 999.0}
+        self.assertEqual(suite.compare(results, baseline, threshold=0.25), [("b[10]", 100.0, 126.0)])
+
+    def test_baseline_round_trip_and_exit_status(self):
+        """Test saving a baseline and failing a comparison against a much faster one"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            arguments = ["can_borrow", "--sizes", "10", "--baseline", path]
+            output = io.StringIO()
+            with redirect_stdout(output):
+                self.assertEqual(suite.main(arguments + ["--save"]), 0)
+                self.assertEqual(set(suite.load_baseline(path)), {"can_borrow[10]"})
+                suite.save_baseline({"can_borrow[10]": 0.1}, path)
+                self.assertEqual(suite.main(arguments + ["--compare"]), 1)
+            self.assertIn("REGRESSION can_borrow[10]: 0.1 ->", output.getvalue())
+
+    def test_validation_cases_use_the_model_checks(self):
+        """Test that the validation cases go through LibraryUser and LibraryItem, rejecting what they reject"""
+        run = suite.CASES["email_validation"](20)
+        self.assertIsNone(run())
+        with mock.patch("library_user.library_user.is_valid_email", return_value=False) as check:
+            run()
+        self.assertEqual(check.call_count, 20)
+        with mock.patch.object(suite.LibraryItem, "validate") as validate:
+            suite.CASES["enum_membership"](20)()
+        self.assertEqual(validate.call_count, 20)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
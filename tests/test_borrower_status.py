@@ -0,0 +1,41 @@
+"""
+Description: Unit tests for the BorrowerStatus codes and lookup helpers.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_borrower_status.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from borrower_status import BorrowerStatus, STATUSES_BY_CODE  # Importing the BorrowerStatus enum and its table.
+
+# Defining the test class for BorrowerStatus, inheriting from unittest.TestCase.
+class TestBorrowerStatus(unittest.TestCase):
+
+    def test_codes_match_values(self):
+        """Test that each code is the status value and decodes back to the status"""
+        for status in BorrowerStatus:
+            self.assertEqual(status.code, status.value)
+            self.assertIs(STATUSES_BY_CODE[status.code], status)
+            self.assertIs(BorrowerStatus.from_code(status.code), status)
+
+    def test_from_code_rejects_unknown_codes(self):
+        """Test that unknown codes raise ValueError"""
+        for code in [4, -1, False, None]:
+            with self.assertRaises(ValueError) as context:
+                BorrowerStatus.from_code(code)
+            self.assertEqual(str(context.exception), "Invalid Borrower Status.")
+
+    def test_parse(self):
+        """Test parsing members, names and codes"""
+        for value in [BorrowerStatus.MINOR, "MINOR", " minor ", "3", 3]:
+            self.assertIs(BorrowerStatus.parse(value), BorrowerStatus.MINOR)
+        for value in ["Minor Patron", "", None, True]:
+            with self.assertRaises(ValueError):
+                BorrowerStatus.parse(value)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
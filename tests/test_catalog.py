@@ -0,0 +1,89 @@
+"""
+Description: Unit tests for the Catalog class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_catalog.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from catalog import Catalog  # Importing the Catalog class to be tested.
+from library_item import LibraryItem  # Importing LibraryItem to fill the catalog.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from library_user import LibraryUser
+from borrower_status import BorrowerStatus
+
+# Defining the test class for Catalog, inheriting from unittest.TestCase.
+class TestCatalog(unittest.TestCase):
+
+    def setUp(self):
+        """Create a small catalog used by each test"""
+        self.gatsby = LibraryItem(100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
+        self.paradise = LibraryItem(101, "This Side of Paradise", "F. Scott Fitzgerald", 1920, Genre.FICTION, True)
+        self.dune = LibraryItem(102, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False)
+        self.catalog = Catalog([self.gatsby, self.paradise, self.dune])
+
+    def test_get_by_item_id(self):
+        """Test lookups on the primary index"""
+        self.assertIs(self.catalog.get(101), self.paradise)
+        self.assertIsNone(self.catalog.get(999))
+        self.assertIn(102, self.catalog)
+        self.assertEqual(len(self.catalog), 3)
+
+    def test_secondary_indexes(self):
+        """Test lookups by author, genre, year and year range"""
+        self.assertEqual(self.catalog.by_author("F. Scott Fitzgerald"), [self.gatsby, self.paradise])
+        self.assertEqual(self.catalog.by_genre(Genre.SCIFI), [self.dune])
+        self.assertEqual(self.catalog.by_year(1925), [self.gatsby])
+        self.assertEqual(self.catalog.by_year_range(1920, 1930), [self.paradise, self.gatsby])
+        self.assertEqual(self.catalog.by_genre(Genre.HISTORY), [])
+
+    def test_borrowed_indexes(self):
+        """Test that available and borrowed follow status changes"""
+        self.assertEqual(self.catalog.borrowed(), [self.paradise])
+        self.catalog.set_borrowed(100, True)
+        self.assertTrue(self.gatsby.is_borrowed)
+        self.assertEqual(self.catalog.available(), [self.dune])
+        self.catalog.set_borrowed(101, False)
+        self.assertEqual(self.catalog.borrowed(), [self.gatsby])
+
+    def test_duplicate_item_id_raises_exception(self):
+        """Test that ValueError is raised for a duplicate item_id"""
+        with self.assertRaises(ValueError) as context:
+            self.catalog.add(LibraryItem(100, "Dune Messiah", "Frank Herbert", 1969, Genre.SCIFI, False))
+        self.assertEqual(str(context.exception), "Item Id already exists in the catalog.")
+        # The rejected item must not leak into any index.
+        self.assertEqual(self.catalog.by_year(1969), [])
+
+    def test_remove(self):
+        """Test that removing an item clears every index"""
+        self.assertIs(self.catalog.remove(102), self.dune)
+        self.assertNotIn(102, self.catalog)
+        self.assertEqual(self.catalog.by_author("Frank Herbert"), [])
+        self.assertEqual(self.catalog.by_year_range(1900, 2000), [self.paradise, self.gatsby])
+        with self.assertRaises(ValueError) as context:
+            self.catalog.remove(102)
+        self.assertEqual(str(context.exception), "Item Id not found in the catalog.")
+
+    def test_borrowed_follows_circulation_outside_the_catalog(self):
+        """Test that items borrowed and returned through a user move between available and borrowed"""
+        user = LibraryUser(100, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)
+        user.borrow_item(self.dune)
+        self.assertNotIn(self.dune, self.catalog.available())
+        self.assertIn(self.dune, self.catalog.borrowed())
+        user.return_item(self.dune)
+        self.assertIn(self.dune, self.catalog.available())
+        self.assertNotIn(self.dune, self.catalog.borrowed())
+
+    def test_set_borrowed_invalid_value_raises_exception(self):
+        """Test that ValueError is raised for a non-boolean status"""
+        with self.assertRaises(ValueError) as context:
+            self.catalog.set_borrowed(100, "yes")
+        self.assertEqual(str(context.exception), "Is Borrowed must be a boolean value.")
+        self.assertEqual(self.catalog.available(), [self.gatsby, self.dune])
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,292 @@
+"""
+Description: Unit and contention stress tests for the CheckoutEngine class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_checkout_engine.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import threading
+import unittest
+from checkout_engine import CheckoutEngine  # Importing the CheckoutEngine class to be tested.
+from catalog import Catalog  # Importing Catalog to check that its indexes follow the engine.
+from hold_queue import HoldQueues  # Importing HoldQueues for the waitlist handoff tests.
+from library_item import LibraryItem  # Importing LibraryItem for the items being lent.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+def make_user(user_id):
+    return LibraryUser(user_id, f"User {user_id}", f"user{user_id}@example.com", BorrowerStatus.ACTIVE)
+
+def make_item(item_id):
+    return LibraryItem(item_id, f"Title {item_id}", "Author", 2000, Genre.FICTION, False)
+
+# Defining the test class for CheckoutEngine, inheriting from unittest.TestCase.
+class TestCheckoutEngine(unittest.TestCase):
+
+    def test_borrow_and_return(self):
+        """Test a borrow followed by a return by the same user"""
+        engine = CheckoutEngine()
+        user, item = make_user(100), make_item(100)
+        self.assertEqual(engine.borrow(user, item), "User 100 is eligible to borrow the item.")
+        self.assertTrue(item.is_borrowed)
+        self.assertEqual(engine.holder_of(100), 100)
+        self.assertEqual(engine.return_item(user, item), "Item successfully returned.")
+        self.assertFalse(item.is_borrowed)
+        self.assertIsNone(engine.holder_of(100))
+
+    def test_borrowed_item_cannot_be_borrowed_again(self):
+        """Test that a second borrower is refused"""
+        engine = CheckoutEngine()
+        item = make_item(100)
+        engine.borrow(make_user(100), item)
+        with self.assertRaises(Exception) as context:
+            engine.borrow(make_user(101), item)
+        self.assertEqual(str(context.exception), "User 101 cannot borrow the item.")
+        self.assertEqual(engine.holder_of(100), 100)
+
+    def test_return_by_other_user_raises_exception(self):
+        """Test that only the holder can return an item"""
+        engine = CheckoutEngine()
+        item = make_item(100)
+        engine.borrow(make_user(100), item)
+        with self.assertRaises(Exception) as context:
+            engine.return_item(make_user(101), item)
+        self.assertEqual(str(context.exception), "User 101 has not borrowed the item.")
+        self.assertTrue(item.is_borrowed)
+
+    def test_return_without_holder_requires_the_loan(self):
+        """Test that an item with no recorded holder is only taken back from a user who holds it"""
+        engine = CheckoutEngine()
+        item = LibraryItem(100, "Title 100", "Author", 2000, Genre.FICTION, True)
+        user = LibraryUser(100, "User 100", "user100@example.com", BorrowerStatus.DELINQUENT)
+        with self.assertRaises(Exception) as context:
+            engine.return_item(user, item)
+        self.assertEqual(str(context.exception), "User 100 has not borrowed the item.")
+        self.assertEqual((item.is_borrowed, user.status), (True, BorrowerStatus.DELINQUENT))
+        user.restore_loans([100])
+        engine.return_item(user, item)
+        self.assertEqual((item.is_borrowed, user.status), (False, BorrowerStatus.ACTIVE))
+
+    def test_unrestored_holder_keeps_status(self):
+        """Test that a holder whose loans were not restored frees the item without a change of status"""
+        engine = CheckoutEngine()
+        item = make_item(100)
+        engine.borrow(make_user(100), item)
+        user = LibraryUser(100, "User 100", "user100@example.com", BorrowerStatus.DELINQUENT)
+        self.assertEqual(engine.return_item(user, item), "Item successfully returned.")
+        self.assertEqual((item.is_borrowed, engine.holder_of(100), user.status), (False, None, BorrowerStatus.DELINQUENT))
+
+    def test_restore_rebuilds_user_loans(self):
+        """Test that users loaded after the engine get their loans back, so quotas still hold"""
+        engine = CheckoutEngine()
+        items = [make_item(100 + n) for n in range(3)]
+        for item in items:
+            engine.borrow(make_user(100), item)
+        user = LibraryUser(100, "User 100", "user100@example.com", BorrowerStatus.MINOR)
+        engine.restore([user, make_user(101)])
+        self.assertEqual(user.loans, (100, 101, 102))
+        self.assertFalse(user.can_borrow(make_item(103)))
+        engine.return_item(user, items[0])
+        self.assertEqual(user.loans, (101, 102))
+
+    def test_catalog_indexes_follow_engine(self):
+        """Test that the catalog's borrowed index is kept up to date"""
+        item = make_item(100)
+        catalog = Catalog([item])
+        engine = CheckoutEngine(catalog=catalog)
+        engine.borrow(make_user(100), item)
+        self.assertEqual(catalog.borrowed(), [item])
+        engine.return_item(make_user(100), item)
+        self.assertEqual(catalog.available(), [item])
+
+    def test_invalid_stripes_raises_exception(self):
+        """Test that ValueError is raised for a non-positive stripe count"""
+        with self.assertRaises(ValueError) as context:
+            CheckoutEngine(stripes=0)
+        self.assertEqual(str(context.exception), "Stripes must be a positive integer.")
+
+    def test_contended_item_is_lent_once(self):
+        """Stress test: many threads racing for one item, exactly one succeeds"""
+        engine = CheckoutEngine()
+        item = make_item(100)
+        users = [make_user(100 + n) for n in range(32)]
+        barrier = threading.Barrier(len(users))
+        winners = []
+
+        def race(user):
+            barrier.wait()
+            try:
+                engine.borrow(user, item)
+                winners.append(user.user_id)
+            except Exception:
+                pass
+
+        threads = [threading.Thread(target=race, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(winners), 1)
+        self.assertEqual(engine.holder_of(100), winners[0])
+
+    def test_concurrent_borrows_respect_quota(self):
+        """Stress test: one MINOR user racing for many items never exceeds the quota"""
+        engine = CheckoutEngine()
+        user = LibraryUser(100, "Jane Doe", "jane.doe@example.com", BorrowerStatus.MINOR)
+        items = [make_item(100 + n) for n in range(32)]
+        barrier = threading.Barrier(len(items))
+
+        def race(item):
+            barrier.wait()
+            try:
+                engine.borrow(user, item)
+            except Exception:
+                pass
+
+        threads = [threading.Thread(target=race, args=(item,)) for item in items]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        quota = LibraryUser.quota_for(BorrowerStatus.MINOR)
+        self.assertEqual(len(user.loans), quota)
+        self.assertEqual(engine.items_of(100), set(user.loans))
+
+    def test_contention_stress_never_double_lends(self):
+        """Stress test: threads borrow and return a few hot items at random"""
+        engine = CheckoutEngine(stripes=4)
+        items = [make_item(100 + n) for n in range(8)]
+        lent = {item.item_id: 0 for item in items}
+        violations = []
+        guard = threading.Lock()
+
+        def worker(user_id):
+            user = make_user(user_id)
+            rng = random.Random(user_id)
+            for _ in range(2000):
+                item = rng.choice(items)
+                try:
+                    engine.borrow(user, item)
+                except Exception:
+                    continue
+                # Count concurrent holders of the item; it must never exceed one.
+                with guard:
+                    lent[item.item_id] += 1
+                    if lent[item.item_id] > 1:
+                        violations.append(item.item_id)
+                with guard:
+                    lent[item.item_id] -= 1
+                engine.return_item(user, item)
+
+        threads = [threading.Thread(target=worker, args=(100 + n,)) for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(violations, [])
+        self.assertTrue(all(not item.is_borrowed for item in items))
+
+    def test_return_hands_item_to_next_hold(self):
+        """Test that a returned item goes to the first eligible patron waiting for it"""
+        engine = CheckoutEngine(holds=HoldQueues())
+        holder, delinquent, waiting = make_user(100), make_user(101), make_user(102)
+        item = make_item(100)
+        engine.borrow(holder, item)
+        engine.place_hold(delinquent, item)
+        engine.place_hold(waiting, item)
+        delinquent.status = BorrowerStatus.DELINQUENT
+
+        engine.return_item(holder, item)
+        self.assertTrue(item.is_borrowed)
+        self.assertEqual(engine.holder_of(100), 102)
+        self.assertEqual(waiting.loans, (100,))
+        # The patron passed over keeps their hold.
+        self.assertEqual([hold.user_id for hold in engine.holds.holds_for(100)], [101])
+
+    def test_return_without_eligible_hold_frees_item(self):
+        """Test that an item nobody in the queue can take becomes available"""
+        engine = CheckoutEngine(holds=HoldQueues())
+        holder, waiting = make_user(100), make_user(101)
+        item = make_item(100)
+        engine.borrow(holder, item)
+        engine.place_hold(waiting, item)
+        waiting.status = BorrowerStatus.DELINQUENT
+        engine.return_item(holder, item)
+        self.assertFalse(item.is_borrowed)
+        self.assertIsNone(engine.holder_of(100))
+
+    def test_returning_overdue_items_reinstates_holds(self):
+        """Test that a DELINQUENT patron's parked hold is reinstated when they return an item"""
+        engine = CheckoutEngine(holds=HoldQueues())
+        holder, late = make_user(100), make_user(101)
+        hot, other = make_item(100), make_item(101)
+        engine.borrow(late, other)
+        engine.borrow(holder, hot)
+        engine.place_hold(late, hot)
+        late.status = BorrowerStatus.DELINQUENT
+        engine.return_item(holder, hot)
+        self.assertFalse(hot.is_borrowed)
+
+        engine.borrow(holder, hot)
+        engine.return_item(late, other)
+        self.assertEqual(late.status, BorrowerStatus.ACTIVE)
+        engine.return_item(holder, hot)
+        self.assertEqual(engine.holder_of(100), 101)
+
+    def test_place_hold_errors(self):
+        """Test that holds need hold queues and an item on loan"""
+        item = make_item(100)
+        with self.assertRaises(ValueError) as context:
+            CheckoutEngine().place_hold(make_user(100), item)
+        self.assertEqual(str(context.exception), "Holds are not enabled.")
+        with self.assertRaises(ValueError) as context:
+            CheckoutEngine(holds=HoldQueues()).place_hold(make_user(100), item)
+        self.assertEqual(str(context.exception), "Item is available to borrow.")
+
+    def test_holder_cannot_place_hold(self):
+        """Test that the user who has an item cannot queue for it"""
+        engine = CheckoutEngine(holds=HoldQueues())
+        user, item = make_user(100), make_item(100)
+        engine.borrow(user, item)
+        with self.assertRaises(ValueError) as context:
+            engine.place_hold(user, item)
+        self.assertEqual(str(context.exception), "User already has the item.")
+        self.assertEqual(engine.place_hold(make_user(101), item).user_id, 101)
+
+    def test_contended_holds_hand_off_in_order(self):
+        """Stress test: holds placed from many threads are all served, one patron at a time"""
+        engine = CheckoutEngine(holds=HoldQueues())
+        item = make_item(100)
+        first = make_user(100)
+        engine.borrow(first, item)
+        patrons = [make_user(101 + n) for n in range(40)]
+        barrier = threading.Barrier(len(patrons))
+
+        def wait_for_item(user):
+            barrier.wait()
+            engine.place_hold(user, item)
+
+        threads = [threading.Thread(target=wait_for_item, args=(user,)) for user in patrons]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        order = [hold.user_id for hold in engine.holds.holds_for(100)]
+        served = []
+        holder = first
+        for _ in patrons:
+            engine.return_item(holder, item)
+            holder = next(user for user in patrons if user.user_id == engine.holder_of(100))
+            served.append(holder.user_id)
+        self.assertEqual(served, order)
+        self.assertEqual(len(engine.holds), 0)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Description: Unit tests for the CirculationService class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_circulation_service.py
+"""
+
+# Importing the necessary modules for testing.
+import asyncio
+import threading
+import unittest
+from circulation_service import CirculationService  # Importing the CirculationService class to be tested.
+from catalog import Catalog  # Importing Catalog to hold the items.
+from checkout_engine import CheckoutEngine  # Importing CheckoutEngine to make a slow engine.
+from library_item import LibraryItem  # Importing LibraryItem for the items being lent.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for CirculationService, inheriting from unittest.IsolatedAsyncioTestCase.
+class TestCirculationService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Create a service with three users and two items"""
+        self.users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", BorrowerStatus.ACTIVE) for n in range(3)]
+        self.users.append(LibraryUser(200, "Late Larry", "larry@example.com", BorrowerStatus.DELINQUENT))
+        self.catalog = Catalog([LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, False) for n in range(2)])
+        self.service = CirculationService(self.users, self.catalog)
+
+    async def test_borrow_and_return(self):
+        """Test a borrow followed by a return"""
+        self.assertTrue(await self.service.can_borrow(100, 100))
+        self.assertEqual(await self.service.borrow(100, 100), "User 0 is eligible to borrow the item.")
+        self.assertFalse(await self.service.can_borrow(101, 100))
+        self.assertEqual(self.catalog.borrowed(), [self.catalog.get(100)])
+        self.assertEqual(await self.service.return_(100, 100), "Item successfully returned.")
+        self.assertEqual(self.service.pending, 0)
+
+    async def test_concurrent_borrows_of_one_item(self):
+        """Test that concurrent requests for one item are batched and only one wins"""
+        results = await asyncio.gather(*(self.service.borrow(user.user_id, 101) for user in self.users),
+                                       return_exceptions=True)
+        self.assertEqual(results[0], "User 0 is eligible to borrow the item.")
+        self.assertEqual([str(result) for result in results[1:]],
+                         ["User 1 cannot borrow the item.", "User 2 cannot borrow the item.",
+                          "Late Larry cannot borrow the item."])
+
+    async def test_backpressure_limits_pending(self):
+        """Test that no more than max_pending requests are queued at once"""
+        service = CirculationService(self.users, self.catalog, max_pending=2)
+        tasks = [asyncio.ensure_future(service.borrow(100, 100 + n % 2)) for n in range(6)]
+        await asyncio.sleep(0)
+        self.assertLessEqual(service.pending, 2)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertEqual(service.pending, 0)
+
+    async def test_engine_runs_off_the_loop(self):
+        """Test that a blocking engine operation does not stall the event loop"""
+        release = threading.Event()
+
+        class SlowEngine(CheckoutEngine):
+            def borrow(self, user, item):
+                release.wait(5)
+                return super().borrow(user, item)
+
+        service = CirculationService(self.users, self.catalog, engine=SlowEngine(catalog=self.catalog))
+        first = asyncio.ensure_future(service.borrow(100, 100))
+        await asyncio.sleep(0.05)
+        # The loop got here while the engine was blocked; the next request waits for the next batch.
+        self.assertFalse(first.done())
+        second = asyncio.ensure_future(service.borrow(101, 100))
+        await asyncio.sleep(0)
+        release.set()
+        self.assertEqual(await first, "User 0 is eligible to borrow the item.")
+        with self.assertRaises(Exception) as context:
+            await second
+        self.assertEqual(str(context.exception), "User 1 cannot borrow the item.")
+
+    async def test_unknown_ids_raise_exception(self):
+        """Test that ValueError is raised for unknown users and items"""
+        with self.assertRaises(ValueError) as context:
+            await self.service.borrow(999, 100)
+        self.assertEqual(str(context.exception), "User Id not found.")
+        with self.assertRaises(ValueError) as context:
+            await self.service.can_borrow(100, 999)
+        self.assertEqual(str(context.exception), "Item Id not found in the catalog.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Description: Unit tests for the batch eligibility functions.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_eligibility.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from eligibility import eligibility_matrix, eligibility_from_flags, eligible_pairs, eligible_items  # The functions to be tested.
+from library_item import LibraryItem  # Importing LibraryItem for the items checked.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers checked.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for the eligibility functions, inheriting from unittest.TestCase.
+class TestEligibility(unittest.TestCase):
+
+    def setUp(self):
+        """Create users of every status and a mix of borrowed and available items"""
+        self.users = [LibraryUser(100 + n, f"User {n}", f"user{n}@example.com", status)
+                      for n, status in enumerate(BorrowerStatus)]
+        self.items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, n % 3 == 0) for n in range(7)]
+
+    def test_matrix_matches_can_borrow(self):
+        """Test that the matrix agrees with can_borrow for every pair"""
+        matrix = eligibility_matrix(self.users, self.items)
+        expected = [bytes(user.can_borrow(item) for item in self.items) for user in self.users]
+        self.assertEqual(matrix, expected)
+
+    def test_matrix_from_flags(self):
+        """Test the matrix built directly from status and borrowed flags"""
+        self.assertEqual(eligibility_from_flags([False, True], [True, False, False]), [b"\x00\x01\x01", b"\x00\x00\x00"])
+        self.assertEqual(eligibility_from_flags([], [True]), [])
+        # The keyword used before blocked was introduced still works.
+        self.assertEqual(eligibility_from_flags(delinquent=[True], borrowed=[False]), [b"\x00"])
+
+    def test_eligible_pairs_match_can_borrow(self):
+        """Test that the pair list holds exactly the pairs can_borrow accepts"""
+        expected = [(user.user_id, item.item_id) for user in self.users for item in self.items if user.can_borrow(item)]
+        self.assertEqual(eligible_pairs(self.users, self.items), expected)
+
+    def test_eligible_items(self):
+        """Test reading the eligible items out of a matrix row"""
+        row = eligibility_matrix(self.users, self.items)[0]
+        self.assertEqual([item.item_id for item in eligible_items(row, self.items)], [101, 102, 104, 105])
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
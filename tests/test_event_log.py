@@ -0,0 +1,202 @@
+"""
+Description: Unit tests for the circulation EventLog and its recovery.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_event_log.py
+"""
+
+# Importing the necessary modules for testing.
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from event_log import EventLog, recover  # Importing the EventLog class and recovery to be tested.
+from checkout_engine import CheckoutEngine  # Importing CheckoutEngine to produce events.
+from loan_scheduler import OverdueScheduler  # Importing OverdueScheduler to check that due dates survive a restart.
+from library_item import LibraryItem  # Importing LibraryItem for the items being lent.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for EventLog, inheriting from unittest.TestCase.
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary log directory, a user and two items"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self.user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        self.items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, False) for n in range(2)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_engine_transitions_are_recovered(self):
+        """Test that borrows, returns and status changes survive a restart"""
+        delinquent = LibraryUser(101, "Late Larry", "larry@example.com", BorrowerStatus.DELINQUENT)
+        delinquent.restore_loans([200])
+        with EventLog(self.path, group_size=2) as log:
+            engine = CheckoutEngine(event_log=log)
+            engine.borrow(self.user, self.items[0])
+            engine.borrow(self.user, self.items[1])
+            engine.return_item(self.user, self.items[0])
+            engine.return_item(delinquent, LibraryItem(200, "Old", "Author", 1990, Genre.HISTORY, True))
+        state = recover(self.path)
+        self.assertEqual(state.holders, {101: 100})
+        self.assertEqual(state.statuses, {101: BorrowerStatus.ACTIVE})
+        self.assertEqual(state.sequence, 5)
+        with EventLog(self.path) as log:
+            self.assertEqual(CheckoutEngine(event_log=log).holder_of(101), 100)
+
+    def test_append_waits_for_the_disk(self):
+        """Test that an event is on disk as soon as it has been recorded"""
+        with EventLog(self.path, group_size=10) as log:
+            self.assertEqual(log.record_borrow(self.user, self.items[0]), 1)
+            self.assertEqual(log.durable_sequence, 1)
+            self.assertEqual(recover(self.path).holders, {100: 100})
+
+    def test_delayed_events_are_written_within_max_delay(self):
+        """Test that with max_delay, events are buffered until the group fills or the delay passes"""
+        log = EventLog(self.path, group_size=10, max_delay=60)
+        log.record_borrow(self.user, self.items[0])
+        self.assertEqual((recover(self.path).holders, log.durable_sequence), ({}, 0))
+        log.commit()
+        self.assertEqual(recover(self.path).holders, {100: 100})
+        log.close()
+
+        with EventLog(self.path, group_size=10, max_delay=0.01) as log:
+            log.record_return(self.user, self.items[0])
+            time.sleep(0.5)
+            self.assertEqual(log.durable_sequence, 2)
+            self.assertEqual(recover(self.path).holders, {})
+
+    def test_concurrent_appends_share_commits(self):
+        """Stress test: threads waiting on the disk are written together, and every event arrives"""
+        syncs = []
+        fsync = os.fsync
+        def slow_fsync(descriptor):
+            syncs.append(descriptor)
+            time.sleep(0.002)
+            fsync(descriptor)
+
+        with mock.patch("event_log.event_log.os.fsync", slow_fsync), EventLog(self.path) as log:
+            def worker(user_id):
+                for n in range(25):
+                    log.append({"type": "borrow", "user_id": user_id, "item_id": user_id * 100 + n})
+            threads = [threading.Thread(target=worker, args=(100 + n,)) for n in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(recover(self.path).holders), 400)
+        self.assertLess(len(syncs), 200)
+
+    def test_restore_items_and_users(self):
+        """Test that recovered loans and statuses are put back on freshly loaded objects"""
+        with EventLog(self.path) as log:
+            engine = CheckoutEngine(event_log=log)
+            engine.borrow(self.user, self.items[1])
+            log.record_status(self.user, BorrowerStatus.MINOR)
+        user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, n == 0) for n in range(2)]
+        recover(self.path).restore(items, [user])
+        self.assertEqual([item.is_borrowed for item in items], [False, True])
+        self.assertEqual((user.loans, user.status), ((101,), BorrowerStatus.MINOR))
+        with EventLog(self.path) as log:
+            CheckoutEngine(event_log=log).return_item(user, items[1])
+        self.assertEqual((user.loans, items[1].is_borrowed), ((), False))
+
+    def test_snapshot_truncates_log(self):
+        """Test that recovery replays only the events after the snapshot"""
+        with EventLog(self.path, group_size=1, snapshot_every=3) as log:
+            for _ in range(2):
+                log.record_borrow(self.user, self.items[0])
+                log.record_return(self.user, self.items[0])
+            log.record_borrow(self.user, self.items[1])
+        with open(os.path.join(self.path, "events.log")) as file:
+            self.assertEqual(len(file.readlines()), 2)
+        state = recover(self.path)
+        self.assertEqual((state.holders, state.sequence), ({101: 100}, 5))
+
+    def test_torn_write_is_discarded(self):
+        """Test that a partial last line is ignored and overwritten"""
+        with EventLog(self.path, group_size=1) as log:
+            log.record_borrow(self.user, self.items[0])
+        with open(os.path.join(self.path, "events.log"), "a") as file:
+            file.write('{"type":"borrow","user_id":100,"it')
+        self.assertEqual(recover(self.path).sequence, 1)
+        with EventLog(self.path, group_size=1) as log:
+            log.record_borrow(self.user, self.items[1])
+        state = recover(self.path)
+        self.assertEqual((state.holders, state.sequence), ({100: 100, 101: 100}, 2))
+
+    def test_scheduler_resumes_after_restart(self):
+        """Test that loans fall due at their logged due dates after a restart, and only once"""
+        with EventLog(self.path) as log:
+            engine = CheckoutEngine(event_log=log, scheduler=OverdueScheduler(loan_period=10, clock=lambda: 0))
+            engine.borrow(self.user, self.items[0])
+        for now, expected in ((5, []), (11, [100])):
+            user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+            with EventLog(self.path) as log:
+                engine = CheckoutEngine(event_log=log, scheduler=OverdueScheduler(loan_period=10, clock=lambda: 0))
+                engine.restore([user])
+                self.assertEqual([late.user_id for late in engine.advance(now)], expected)
+        self.assertEqual((user.status, user.overdue), (BorrowerStatus.DELINQUENT, (100,)))
+
+        # The overdue loan is in the log, so a further restart does not find it overdue again.
+        with EventLog(self.path) as log:
+            engine = CheckoutEngine(event_log=log, scheduler=OverdueScheduler(loan_period=10, clock=lambda: 0))
+            engine.restore([LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)])
+            self.assertEqual(engine.advance(20), [])
+
+    def test_restored_user_stays_delinquent(self):
+        """Test that after a restart, returning a loan that is not overdue leaves the user DELINQUENT"""
+        clock = [0]
+        with EventLog(self.path) as log:
+            engine = CheckoutEngine(event_log=log, scheduler=OverdueScheduler(loan_period=10, clock=lambda: clock[0]))
+            engine.borrow(self.user, self.items[0])
+            clock[0] = 5
+            engine.borrow(self.user, self.items[1])
+            engine.advance(12)
+        for name in ("state", "engine"):
+            with self.subTest(restore=name):
+                path = shutil.copytree(self.path, os.path.join(self.path, name))
+                user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+                with EventLog(path) as log:
+                    engine = CheckoutEngine(event_log=log)
+                    if name == "state":
+                        recover(path).restore(users=[user])
+                    else:
+                        engine.restore([user])
+                    self.assertEqual((user.status, user.overdue), (BorrowerStatus.DELINQUENT, (100,)))
+                    engine.return_item(user, LibraryItem(101, "Title 1", "Author", 2000, Genre.FICTION, True))
+                self.assertEqual(user.status, BorrowerStatus.DELINQUENT)
+
+    def test_snapshot_keeps_due_dates_and_overdue_loans(self):
+        """Test that due dates and overdue loans are written to snapshots"""
+        with EventLog(self.path, group_size=1, snapshot_every=3) as log:
+            engine = CheckoutEngine(event_log=log, scheduler=OverdueScheduler(loan_period=10, clock=lambda: 0))
+            engine.borrow(self.user, self.items[0])
+            engine.borrow(self.user, self.items[1])
+            engine.advance(10)
+        with open(os.path.join(self.path, "events.log")) as file:
+            self.assertEqual(len(file.readlines()), 1)
+        state = recover(self.path)
+        self.assertEqual(state.dates, {100: (0, 10), 101: (0, 10)})
+        self.assertEqual(state.overdue, {100, 101})
+        self.assertEqual(state.statuses, {100: BorrowerStatus.DELINQUENT})
+
+    def test_invalid_group_size_raises_exception(self):
+        """Test that ValueError is raised for a non-positive group size"""
+        with self.assertRaises(ValueError) as context:
+            EventLog(self.path, group_size=0)
+        self.assertEqual(str(context.exception), "Group size must be a positive integer.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
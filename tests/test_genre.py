@@ -0,0 +1,47 @@
+"""
+Description: Unit tests for the Genre codes and lookup helpers.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_genre.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from genre import Genre, GENRE_CODES, GENRES_BY_CODE, GENRE_BY_VALUE  # Importing the Genre enum and its tables.
+
+# Defining the test class for Genre, inheriting from unittest.TestCase.
+class TestGenre(unittest.TestCase):
+
+    def test_codes_are_stable_and_fit_a_byte(self):
+        """Test that the codes are unique, one byte and unchanged"""
+        self.assertEqual([genre.code for genre in Genre], list(range(8)))
+        self.assertEqual(GENRE_CODES[Genre.SCIFI], 3)
+        self.assertTrue(all(0 <= genre.code < 256 for genre in Genre))
+
+    def test_tables(self):
+        """Test the code and value lookup tables"""
+        for genre in Genre:
+            self.assertIs(GENRES_BY_CODE[genre.code], genre)
+            self.assertIs(GENRE_BY_VALUE[genre.value], genre)
+            self.assertIs(Genre.from_code(genre.code), genre)
+
+    def test_from_code_rejects_unknown_codes(self):
+        """Test that out-of-range, negative and non-integer codes raise ValueError"""
+        for code in [8, -1, True, "3", None]:
+            with self.assertRaises(ValueError) as context:
+                Genre.from_code(code)
+            self.assertEqual(str(context.exception), "Invalid Genre.")
+
+    def test_parse(self):
+        """Test parsing members, names, display values and codes"""
+        for value in [Genre.SCIFI, "SCIFI", "scifi", "Science Fiction", " science fiction ", 3]:
+            self.assertIs(Genre.parse(value), Genre.SCIFI)
+        for value in ["Poetry", "", None, True, 3.0]:
+            with self.assertRaises(ValueError):
+                Genre.parse(value)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Description: Unit tests for the HoldQueues class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_hold_queue.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import threading
+import unittest
+from hold_queue import HoldQueues, Hold  # Importing the classes to be tested.
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+def make_user(user_id, status=BorrowerStatus.ACTIVE):
+    return LibraryUser(user_id, f"User {user_id}", f"user{user_id}@example.com", status)
+
+# Defining the test class for HoldQueues, inheriting from unittest.TestCase.
+class TestHoldQueues(unittest.TestCase):
+
+    def setUp(self):
+        """Create hold queues with a fixed clock and a returned item"""
+        self.holds = HoldQueues(clock=lambda: 50.0)
+        self.item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False)
+
+    def test_first_come_first_served(self):
+        """Test that holds of equal priority are served in request order"""
+        for user_id, now in ((102, 3.0), (100, 1.0), (101, 2.0)):
+            self.holds.place(make_user(user_id), 100, now=now)
+        self.assertEqual([hold.user_id for hold in self.holds.holds_for(100)], [100, 101, 102])
+        self.assertEqual(self.holds.hand_off(self.item).user_id, 100)
+        self.assertTrue(self.item.is_borrowed)
+        self.assertEqual(self.holds.count(100), 2)
+
+    def test_equal_times_served_in_placement_order(self):
+        """Test that ties in request time are broken by placement order"""
+        for user_id in (105, 103, 104):
+            self.holds.place(make_user(user_id), 100)
+        self.assertEqual([hold.user_id for hold in self.holds.holds_for(100)], [105, 103, 104])
+
+    def test_status_priorities(self):
+        """Test that a status with a lower priority number is served first"""
+        holds = HoldQueues({BorrowerStatus.MINOR: -1})
+        holds.place(make_user(100), 100, now=1.0)
+        holds.place(make_user(101, BorrowerStatus.MINOR), 100, now=2.0)
+        self.assertEqual(holds.hand_off(self.item).user_id, 101)
+
+    def test_delinquent_patrons_are_passed_over(self):
+        """Test that a patron who became DELINQUENT keeps their place but is skipped"""
+        late, waiting = make_user(100), make_user(101)
+        self.holds.place(late, 100, now=1.0)
+        self.holds.place(waiting, 100, now=2.0)
+        late.status = BorrowerStatus.DELINQUENT
+        self.assertIs(self.holds.hand_off(self.item), waiting)
+        self.assertEqual(self.holds.holds_for(100), [Hold(100, 100, 1.0, 0)])
+        self.assertIn((100, 100), self.holds)
+
+    def test_reinstate_restores_place(self):
+        """Test that a parked patron is served in their old place once reinstated"""
+        late, waiting = make_user(100), make_user(101)
+        self.holds.place(late, 100, now=1.0)
+        self.holds.place(waiting, 100, now=2.0)
+        late.status = BorrowerStatus.DELINQUENT
+        self.holds.hand_off(self.item, lambda user: False)
+        self.assertEqual(self.holds.reinstate(late), 0)
+        late.status = BorrowerStatus.ACTIVE
+        self.assertEqual(self.holds.reinstate(late), 1)
+        self.assertIs(self.holds.hand_off(self.item), late)
+
+    def test_cancel_parked_hold(self):
+        """Test that a parked hold can be cancelled"""
+        late = make_user(100, BorrowerStatus.ACTIVE)
+        self.holds.place(late, 100)
+        late.status = BorrowerStatus.DELINQUENT
+        self.assertIsNone(self.holds.hand_off(self.item))
+        self.assertEqual(self.holds.count(100), 1)
+        self.assertEqual(self.holds.cancel(100, 100).user_id, 100)
+        self.assertEqual(self.holds.count(100), 0)
+        late.status = BorrowerStatus.ACTIVE
+        self.assertEqual(self.holds.reinstate(late), 0)
+
+    def test_patron_at_quota_is_passed_over(self):
+        """Test that a patron who cannot borrow more is skipped"""
+        full = make_user(100, BorrowerStatus.MINOR)
+        for item_id in range(200, 203):
+            full.borrow_item(LibraryItem(item_id, "Title", "Author", 2000, Genre.FICTION, False))
+        self.holds.place(full, 100, now=1.0)
+        self.assertIsNone(self.holds.hand_off(self.item))
+        self.assertFalse(self.item.is_borrowed)
+        self.assertEqual(self.holds.count(100), 1)
+
+    def test_cancel(self):
+        """Test that a cancelled hold is never served"""
+        self.holds.place(make_user(100), 100, now=1.0)
+        self.holds.place(make_user(101), 100, now=2.0)
+        self.assertEqual(self.holds.cancel(100, 100).user_id, 100)
+        self.assertIsNone(self.holds.cancel(100, 100))
+        self.assertEqual(self.holds.hand_off(self.item).user_id, 101)
+        self.assertEqual(len(self.holds), 0)
+        self.assertIsNone(self.holds.hand_off(self.item))
+
+    def test_place_errors(self):
+        """Test duplicate holds and holds by users whose status cannot place them"""
+        user = make_user(100)
+        self.holds.place(user, 100)
+        with self.assertRaises(ValueError) as context:
+            self.holds.place(user, 100)
+        self.assertEqual(str(context.exception), "Hold already placed.")
+        with self.assertRaises(ValueError) as context:
+            self.holds.place(make_user(101, BorrowerStatus.DELINQUENT), 100)
+        self.assertEqual(str(context.exception), "User cannot place holds.")
+
+    def test_invalid_priorities(self):
+        """Test that priorities must be keyed by status and be integers or None"""
+        with self.assertRaises(ValueError) as context:
+            HoldQueues({"ACTIVE": 0})
+        self.assertEqual(str(context.exception), "Invalid Borrower Status.")
+        with self.assertRaises(ValueError) as context:
+            HoldQueues({BorrowerStatus.ACTIVE: 1.5})
+        self.assertEqual(str(context.exception), "Priority must be an integer or None.")
+
+    def test_lend_error_keeps_queue(self):
+        """Test that an error while lending leaves the holds in place"""
+        self.holds.place(make_user(100), 100, now=1.0)
+
+        def lend(user):
+            raise OSError("log unavailable")
+
+        with self.assertRaises(OSError):
+            self.holds.hand_off(self.item, lend)
+        self.assertEqual(self.holds.count(100), 1)
+
+    def test_lend_does_not_block_other_items(self):
+        """Test that holds on other items can be placed while one item is being lent"""
+        self.holds.place(make_user(100), 100, now=1.0)
+        placed = []
+
+        def lend(user):
+            worker = threading.Thread(target=lambda: placed.append(self.holds.place(make_user(101), 200)))
+            worker.start()
+            worker.join(5)
+            return True
+
+        self.assertEqual(self.holds.hand_off(self.item, lend).user_id, 100)
+        self.assertEqual([hold.user_id for hold in placed], [101])
+
+    def test_matches_sorted_model(self):
+        """Test random placements, cancellations and handoffs against a sorted list"""
+        rng = random.Random(21)
+        holds = HoldQueues()
+        model = []
+        users = {}
+        for step in range(3000):
+            action = rng.random()
+            if action < 0.6:
+                user_id = rng.randrange(100, 400)
+                if any(entry[2] == user_id for entry in model):
+                    continue
+                user = users.setdefault(user_id, make_user(user_id))
+                priority = rng.choice((0, 0, 1))
+                holds.priorities = (priority,) * 4
+                holds.place(user, 100, now=float(step))
+                model.append((priority, float(step), user_id))
+            elif action < 0.8 and model:
+                entry = rng.choice(model)
+                model.remove(entry)
+                self.assertEqual(holds.cancel(entry[2], 100).user_id, entry[2])
+            else:
+                taker = holds.hand_off(self.item, lambda user: True)
+                expected = min(model) if model else None
+                if expected is not None:
+                    model.remove(expected)
+                self.assertEqual(taker.user_id if taker else None, expected and expected[2])
+            self.assertEqual(holds.count(100), len(model))
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Description: Regression tests for the package layout: no import cycles
+and a bounded import time, measured with -X importtime.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_import_time.py
+"""
+
+# Importing the necessary modules for testing.
+import itertools
+import os
+import unittest
+from benchmarks.bench_import_time import ROOT, import_times, project_modules  # Importing the importtime helpers.
+
+# The most time the project's own modules may take to import a model class, in microseconds.
+# This is several times the measured cost, to leave room for slow machines.
+IMPORT_BUDGET_US = 50_000
+
+# Defining the test class for the import layout, inheriting from unittest.TestCase.
+class TestImportTime(unittest.TestCase):
+
+    def test_every_package_imports_alone(self):
+        """Test that each package imports on its own in a fresh interpreter, so none is part of a cycle"""
+        packages = [name for name in sorted(os.listdir(ROOT)) if os.path.isfile(os.path.join(ROOT, name, name + ".py"))]
+        self.assertIn("library_item", packages)
+        for package in packages:
+            with self.subTest(package=package):
+                import_times(f"import {package}")
+
+    def test_models_import_in_any_order(self):
+        """Test that the models and enumerations import without cycles in every order"""
+        statements = ["from genre import Genre", "from borrower_status import BorrowerStatus",
+                      "from library_item import LibraryItem", "from library_user import LibraryUser"]
+        for order in itertools.permutations(statements):
+            import_times("; ".join(order))
+
+    def test_model_import_loads_only_its_dependencies(self):
+        """Test that importing LibraryUser stays small and within the time budget"""
+        times = import_times("from library_user import LibraryUser")
+        modules = project_modules(times)
+        self.assertEqual(sorted(modules), ["borrower_status", "borrower_status.borrower_status", "bulk_records",
+                                           "bulk_records.bulk_records", "library_user", "library_user.library_user",
+                                           "validation", "validation.validation"])
+        self.assertLess(sum(times[name][0] for name in modules), IMPORT_BUDGET_US)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Description: Unit tests for the streaming ingest loaders.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_ingest.py
+"""
+
+# Importing the necessary modules for testing.
+import io
+import unittest
+from ingest import load_items, load_users, iter_items, read_chunks, IngestStats  # Importing the loaders to be tested.
+from genre import Genre  # Importing the Genre enum to check parsed genres.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus to check parsed statuses.
+
+ITEMS_CSV = """item_id,title,author,publication_year,genre,is_borrowed
+100,The Great Gatsby,F. Scott Fitzgerald,1925,Fiction,false
+one,The Great Gatsby,F. Scott Fitzgerald,1925,Fiction,false
+101,Dune,Frank Herbert,1965,SCIFI,true
+102,,Frank Herbert,1969,Science Fiction,false
+103,Dune Messiah,Frank Herbert,1969,Poetry,false
+"""
+
+USERS_JSONL = """{"user_id": 100, "name": "John Doe", "email": "john.doe@example.com", "status": "ACTIVE"}
+not json
+{"user_id": 101, "name": "Jane Doe", "email": "jane.doe@example.com", "status": 2}
+
+{"user_id": 102, "name": "Jim Doe", "email": "invalid-email", "status": "Active"}
+"""
+
+# Defining the test class for the ingest loaders, inheriting from unittest.TestCase.
+class TestIngest(unittest.TestCase):
+
+    def test_load_items_from_csv(self):
+        """Test that valid CSV rows are converted and invalid rows are rejected"""
+        rejects = []
+        stats = IngestStats()
+        items = list(iter_items(io.StringIO(ITEMS_CSV), file_format="csv", batch_size=2,
+                                rejects=lambda error, record: rejects.append(error), stats=stats))
+        self.assertEqual([item.item_id for item in items], [100, 101])
+        self.assertEqual(items[0].genre, Genre.FICTION)
+        self.assertEqual(items[1].genre, Genre.SCIFI)
+        self.assertTrue(items[1].is_borrowed)
+        self.assertEqual([(error.row, error.message) for error in rejects],
+                         [(1, "Item Id must be numeric."), (3, "Title cannot be blank."), (4, "Invalid Genre.")])
+        self.assertEqual((stats.rows, stats.accepted, stats.rejected), (5, 2, 3))
+        self.assertGreater(stats.rows_per_second, 0)
+
+    def test_load_users_from_jsonl(self):
+        """Test that malformed JSON lines are rejected without stopping the load"""
+        rejects = []
+        batches = list(load_users(io.StringIO(USERS_JSONL), file_format="jsonl",
+                                  rejects=lambda error, record: rejects.append((error, record))))
+        users = [user for batch in batches for user in batch]
+        self.assertEqual([(user.user_id, user.status) for user in users],
+                         [(100, BorrowerStatus.ACTIVE), (101, BorrowerStatus.DELINQUENT)])
+        self.assertEqual([(error.row, error.message) for error, record in rejects],
+                         [(1, "Invalid record."), (3, "Invalid email address.")])
+        self.assertIsNone(rejects[0][1])
+
+    def test_read_chunks_is_bounded(self):
+        """Test that records are read in chunks of at most chunk_size"""
+        chunks = list(read_chunks(io.StringIO(ITEMS_CSV), "csv", chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+    def test_unknown_format_raises_exception(self):
+        """Test that ValueError is raised when the format cannot be determined"""
+        with self.assertRaises(ValueError) as context:
+            list(load_items("catalog.xml"))
+        self.assertEqual(str(context.exception), "Unknown file format.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Description: Unit tests for the instrumentation module.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_instrumentation.py
+"""
+
+# Importing the necessary modules for testing.
+import os
+import random
+import tempfile
+import unittest
+import instrumentation  # Importing the instrumentation module to be tested.
+from instrumentation import LatencyHistogram
+from library_item import LibraryItem  # Importing LibraryItem for instrumented construction.
+from library_user import LibraryUser  # Importing LibraryUser for instrumented construction and borrowing.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for LatencyHistogram, inheriting from unittest.TestCase.
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentiles_within_relative_error(self):
+        """Test that percentiles are within the histogram's 1/16 relative error"""
+        rng = random.Random(5)
+        values = sorted(int(rng.lognormvariate(10, 2)) for _ in range(10_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        for fraction in (0.5, 0.9, 0.99):
+            exact = values[int(fraction * len(values)) - 1]
+            self.assertLessEqual(abs(histogram.percentile(fraction) - exact), exact / 16 + 1)
+        self.assertEqual(histogram.count, len(values))
+        self.assertEqual(histogram.total, sum(values))
+
+    def test_cumulative_counts(self):
+        """Test the cumulative counts at power-of-two bounds"""
+        histogram = LatencyHistogram()
+        for value in [10, 100, 1000, 1000, 5000]:
+            histogram.record(value)
+        self.assertEqual(histogram.cumulative([64, 128, 1024, 8192]), [1, 2, 4, 5])
+        self.assertEqual(LatencyHistogram().percentile(0.5), 0)
+
+# Defining the test class for enabling instrumentation, inheriting from unittest.TestCase.
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        """Instrument the hot paths, timing one call in four"""
+        self.original = LibraryUser.can_borrow
+        self.metrics = instrumentation.enable(sample_every=4)
+        self.addCleanup(instrumentation.disable)
+
+    def test_disable_restores_original_methods(self):
+        """Test that disabling puts the original methods back"""
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(LibraryUser.can_borrow, self.original)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(LibraryUser.can_borrow, self.original)
+
+    def test_counts_rejections_and_refusals(self):
+        """Test exact call counts, ValueError reasons and refusal causes"""
+        user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        late = LibraryUser(101, "Late Larry", "larry@example.com", BorrowerStatus.DELINQUENT)
+        item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False)
+        taken = LibraryItem(101, "Emma", "Jane Austen", 1815, Genre.FICTION, True)
+        for _ in range(5):
+            user.can_borrow(item)
+            user.can_borrow(taken)
+            late.can_borrow(item)
+        with self.assertRaises(ValueError):
+            LibraryUser(102, "John Doe", "invalid-email", BorrowerStatus.ACTIVE)
+
+        self.assertEqual(self.metrics.calls("can_borrow"), 15)
+        self.assertEqual(self.metrics.calls("LibraryUser"), 3)
+        self.assertEqual(self.metrics.histograms["can_borrow"].count, 3)
+        self.assertEqual(self.metrics.rejections, {("LibraryUser", "Invalid email address."): 1})
+        self.assertEqual(self.metrics.refusals, {"item borrowed": 5, "delinquent": 5})
+
+    def test_prometheus_export(self):
+        """Test the exposition text and the atomic dump file"""
+        with self.assertRaises(ValueError):
+            LibraryItem(100, "", "Author", 2000, Genre.FICTION, False)
+        text = self.metrics.to_prometheus()
+        self.assertIn('library_calls_total{operation="LibraryItem"} 1', text)
+        self.assertIn('library_rejections_total{operation="LibraryItem",reason="Title cannot be blank."} 1', text)
+        self.assertIn("# TYPE library_call_duration_seconds histogram", text)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "library.prom")
+            self.metrics.write(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), text)
+            self.assertEqual(os.listdir(directory), ["library.prom"])
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Description: Unit tests for the ItemTable class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_item_table.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from item_table import ItemTable  # Importing the ItemTable class to be tested.
+from library_item import LibraryItem  # Importing LibraryItem to fill the table.
+from genre import Genre  # Importing the Genre enum for assigning genres.
+
+# Defining the test class for ItemTable, inheriting from unittest.TestCase.
+class TestItemTable(unittest.TestCase):
+
+    def setUp(self):
+        """Create a small table used by each test"""
+        self.items = [LibraryItem(100 + n, f"Title {n}", f"Author {n % 3}", 1900 + n, list(Genre)[n % 8], n % 2 == 0)
+                      for n in range(20)]
+        self.table = ItemTable(self.items)
+
+    def test_views_match_items(self):
+        """Test that every view returns the same values as its LibraryItem"""
+        self.assertEqual(len(self.table), 20)
+        for item, view in zip(self.items, self.table):
+            self.assertEqual(view.item_id, item.item_id)
+            self.assertEqual(view.title, item.title)
+            self.assertEqual(view.author, item.author)
+            self.assertEqual(view.publication_year, item.publication_year)
+            self.assertIs(view.genre, item.genre)
+            self.assertEqual(view.is_borrowed, item.is_borrowed)
+
+    def test_set_borrowed_through_view(self):
+        """Test that setting is_borrowed on a view only flips its own bit"""
+        view = self.table[9]
+        self.assertFalse(view.is_borrowed)
+        view.is_borrowed = True
+        self.assertTrue(self.table[9].is_borrowed)
+        self.assertFalse(self.table[11].is_borrowed)
+        self.table[8].is_borrowed = False
+        self.assertFalse(self.table[8].is_borrowed)
+        self.assertTrue(self.table[10].is_borrowed)
+
+    def test_find(self):
+        """Test lookups by item_id for sorted and unsorted tables"""
+        self.assertEqual(self.table.find(107).title, "Title 7")
+        self.assertIsNone(self.table.find(999))
+        self.table.append(50_000, "Late", "Writer", 2000, Genre.HISTORY)
+        self.table.append(150, "Out of order", "Writer", 2001, Genre.HISTORY)
+        self.assertEqual(self.table.find(150).title, "Out of order")
+        self.assertEqual(self.table.find(119).title, "Title 19")
+
+    def test_append_invalid_item_raises_exception(self):
+        """Test that ValueError is raised for an invalid row"""
+        with self.assertRaises(ValueError) as context:
+            self.table.append(200, "", "Writer", 2000, Genre.HISTORY)
+        self.assertEqual(str(context.exception), "Title cannot be blank.")
+        with self.assertRaises(ValueError) as context:
+            self.table.append(200, "Title", "Writer", "2000", Genre.HISTORY)
+        self.assertEqual(str(context.exception), "Publication Year must be numeric.")
+        self.assertEqual(len(self.table), 20)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ the following command:
 
 # Importing the necessary modules for testing.
 import unittest
-from library_item import LibraryItem  # Importing the LibraryItem class to be tested.
+from library_item import LibraryItem, SlottedLibraryItem  # Importing the LibraryItem classes to be tested.
 from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
 
 # Defining the TestLibraryItem class that inherits from unittest.TestCase.
@@ -69,6 +69,70 @@ class TestLibraryItem(unittest.TestCase):
         item = LibraryItem(1, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
         self.assertEqual(str(item), "The Great Gatsby by F. Scott Fitzgerald, 1925 (Fiction)")
 
+    def test_from_records_valid(self):
+        """Test bulk creation from sequences and mappings"""
+        items, errors = LibraryItem.from_records([
+            (100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, True),
+            {"item_id": 101, "title": "Dune", "author": "Frank Herbert", "publication_year": 1965, "genre": Genre.SCIFI},
+        ])
+        self.assertEqual(errors, [])
+        self.assertEqual([item.item_id for item in items], [100, 101])
+        self.assertEqual(items[0].title, "The Great Gatsby")
+        self.assertTrue(items[0].is_borrowed)
+        self.assertEqual(items[1].genre, Genre.SCIFI)
+        self.assertFalse(items[1].is_borrowed)
+
+    def test_from_records_reports_invalid_rows(self):
+        """Test that each invalid row is reported with the constructor's message"""
+        items, errors = LibraryItem.from_records([
+            ("one", "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False),
+            (99, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False),
+            (102, " ", "F. Scott Fitzgerald", 1925, Genre.FICTION, False),
+            (103, "The Great Gatsby", None, 1925, Genre.FICTION, False),
+            (104, "The Great Gatsby", "F. Scott Fitzgerald", 1925, "Fiction", False),
+            (105, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, "yes"),
+            (106, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False),
+        ])
+        self.assertEqual([item.item_id for item in items], [106])
+        self.assertEqual([(error.row, error.message) for error in errors], [
+            (0, "Item Id must be numeric."),
+            (1, "Invalid Item Id."),
+            (2, "Title cannot be blank."),
+            (3, "Author cannot be blank."),
+            (4, "Invalid Genre."),
+            (5, "Is Borrowed must be a boolean value."),
+        ])
+
+# Defining the TestSlottedLibraryItem class for the compact LibraryItem variant.
+class TestSlottedLibraryItem(unittest.TestCase):
+
+    def test_init_valid(self):
+        """Test valid SlottedLibraryItem creation"""
+        item = SlottedLibraryItem(100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
+        self.assertEqual(item.item_id, 100)
+        self.assertEqual(item.title, "The Great Gatsby")
+        self.assertEqual(item.author, "F. Scott Fitzgerald")
+        self.assertEqual(item.publication_year, 1925)
+        self.assertEqual(item.genre, Genre.FICTION)
+        self.assertFalse(item.is_borrowed)
+        # Slotted items carry no per-object dictionary.
+        self.assertFalse(hasattr(item, "__dict__"))
+
+    def test_init_blank_title_raises_exception(self):
+        """Test that the same validation rules as LibraryItem apply"""
+        with self.assertRaises(ValueError) as context:
+            SlottedLibraryItem(100, " ", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
+        self.assertEqual(str(context.exception), "Title cannot be blank.")
+
+    def test_set_is_borrowed(self):
+        """Test the is_borrowed mutator"""
+        item = SlottedLibraryItem(100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
+        item.is_borrowed = True
+        self.assertTrue(item.is_borrowed)
+        with self.assertRaises(ValueError) as context:
+            item.is_borrowed = "yes"
+        self.assertEqual(str(context.exception), "Is Borrowed must be a boolean value.")
+
 # The entry point for the script that runs the tests.
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -90,6 +90,99 @@ class TestLibraryUser(unittest.TestCase):
         user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
         self.assertEqual(user.return_item(), "Item successfully returned.")
 
+    def test_from_records_valid(self):
+        """Test bulk creation from sequences and mappings"""
+        users, errors = LibraryUser.from_records([
+            (100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE),
+            {"user_id": 101, "name": "Jane Doe", "email": "jane.doe@example.com", "status": BorrowerStatus.MINOR},
+        ])
+        self.assertEqual(errors, [])
+        self.assertEqual([user.user_id for user in users], [100, 101])
+        self.assertEqual(users[1].email, "jane.doe@example.com")
+        self.assertEqual(users[1].status, BorrowerStatus.MINOR)
+
+    def test_from_records_reports_invalid_rows(self):
+        """Test that each invalid row is reported with the constructor's message"""
+        users, errors = LibraryUser.from_records([
+            (100, "John Doe", "john.doe@example.com", "InvalidStatus"),
+            (101, "John Doe", "invalid-email", BorrowerStatus.ACTIVE),
+            (102, "", "john.doe@example.com", BorrowerStatus.ACTIVE),
+            (42, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE),
+            ("one", "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE),
+            (103, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE),
+        ])
+        self.assertEqual([user.user_id for user in users], [103])
+        self.assertEqual([(error.row, error.message) for error in errors], [
+            (0, "Invalid Borrower Status."),
+            (1, "Invalid email address."),
+            (2, "Name cannot be blank."),
+            (3, "Invalid User Id."),
+            (4, "User Id must be numeric."),
+        ])
+
+    def test_loans_are_tracked_per_item(self):
+        """Test that borrowing and returning items updates the user's loans"""
+        user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        items = [LibraryItem(item_id, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False) for item_id in (100, 101)]
+        for item in items:
+            user.borrow_item(item)
+        self.assertEqual(user.loans, (100, 101))
+        self.assertEqual(user.return_item(items[0]), "Item successfully returned.")
+        self.assertFalse(items[0].is_borrowed)
+        self.assertEqual(user.loans, (101,))
+
+    def test_return_of_item_not_held_raises_exception(self):
+        """Test that a user cannot return, and so free, an item lent to someone else"""
+        holder = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        other = LibraryUser(101, "Jane Doe", "jane.doe@example.com", BorrowerStatus.DELINQUENT)
+        item = LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False)
+        holder.borrow_item(item)
+        with self.assertRaises(Exception) as context:
+            other.return_item(item)
+        self.assertEqual(str(context.exception), "Jane Doe has not borrowed the item.")
+        self.assertTrue(item.is_borrowed)
+        self.assertEqual(other.status, BorrowerStatus.DELINQUENT)
+
+    def test_delinquent_until_last_overdue_return(self):
+        """Test that a DELINQUENT user is reinstated only once no overdue loan is left"""
+        user = LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        items = [LibraryItem(100 + n, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False) for n in range(3)]
+        for item in items:
+            user.borrow_item(item)
+        self.assertTrue(user.mark_overdue(100))
+        self.assertFalse(user.mark_overdue(101))
+        self.assertEqual((user.status, user.overdue), (BorrowerStatus.DELINQUENT, (100, 101)))
+        self.assertEqual(user.return_item(items[2]), "Item successfully returned.")
+        self.assertEqual(user.return_item(items[0]), "Item successfully returned.")
+        self.assertEqual(user.status, BorrowerStatus.DELINQUENT)
+        user.return_item(items[1])
+        self.assertEqual((user.status, user.overdue), (BorrowerStatus.ACTIVE, ()))
+
+    def test_minor_quota_limits_borrowing(self):
+        """Test that a MINOR user cannot hold more items than their quota"""
+        user = LibraryUser(100, "Jane Doe", "jane.doe@example.com", BorrowerStatus.MINOR)
+        quota = LibraryUser.quota_for(BorrowerStatus.MINOR)
+        items = [LibraryItem(100 + n, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False) for n in range(quota + 1)]
+        for item in items[:quota]:
+            user.borrow_item(item)
+        self.assertFalse(user.can_borrow_more)
+        self.assertFalse(user.can_borrow(items[quota]))
+        user.return_item(items[0])
+        self.assertTrue(user.can_borrow(items[quota]))
+
+    def test_set_quotas(self):
+        """Test configuring quotas on a subclass without affecting LibraryUser"""
+        class Patron(LibraryUser):
+            pass
+        Patron.set_quotas({BorrowerStatus.ACTIVE: 1})
+        user = Patron(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        user.borrow_item(LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False))
+        self.assertFalse(user.can_borrow(LibraryItem(101, "Emma", "Jane Austen", 1815, Genre.FICTION, False)))
+        self.assertEqual(LibraryUser.quota_for(BorrowerStatus.ACTIVE), 10)
+        with self.assertRaises(ValueError) as context:
+            Patron.set_quotas({BorrowerStatus.MINOR: -1})
+        self.assertEqual(str(context.exception), "Quota must be a non-negative integer.")
+
 # The entry point for running the tests when the script is executed.
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
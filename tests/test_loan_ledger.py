@@ -0,0 +1,49 @@
+"""
+Description: Unit tests for the LoanLedger class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_loan_ledger.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from loan_ledger import LoanLedger  # Importing the LoanLedger class to be tested.
+
+# Defining the test class for LoanLedger, inheriting from unittest.TestCase.
+class TestLoanLedger(unittest.TestCase):
+
+    def setUp(self):
+        """Create a ledger with one user holding two items"""
+        self.ledger = LoanLedger({200: 100, 201: 100})
+
+    def test_lookups_by_item_and_user(self):
+        """Test finding the holder of an item and the items of a user"""
+        self.ledger.lend(101, 202)
+        self.assertEqual(self.ledger.holder_of(202), 101)
+        self.assertEqual(self.ledger.items_of(100), {200, 201})
+        self.assertEqual(self.ledger.count_of(100), 2)
+        self.assertEqual(self.ledger.items_of(999), frozenset())
+        self.assertEqual(len(self.ledger), 3)
+        self.assertIn(201, self.ledger)
+
+    def test_release(self):
+        """Test that releasing an item updates both indexes"""
+        self.assertEqual(self.ledger.release(200), 100)
+        self.assertIsNone(self.ledger.release(200))
+        self.assertIsNone(self.ledger.holder_of(200))
+        self.assertEqual(self.ledger.items_of(100), {201})
+        self.ledger.release(201)
+        self.assertEqual(self.ledger.count_of(100), 0)
+        self.assertEqual(self.ledger.holders, {})
+
+    def test_lend_twice_raises_exception(self):
+        """Test that an item cannot be lent while it is on loan"""
+        with self.assertRaises(ValueError) as context:
+            self.ledger.lend(101, 200)
+        self.assertEqual(str(context.exception), "Item Id is already on loan.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
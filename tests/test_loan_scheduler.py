@@ -0,0 +1,134 @@
+"""
+Description: Unit tests for the OverdueScheduler class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_loan_scheduler.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import unittest
+from unittest import mock
+from loan_scheduler import OverdueScheduler, Loan  # Importing the OverdueScheduler class to be tested.
+from checkout_engine import CheckoutEngine  # Importing CheckoutEngine to check that it opens and closes loans.
+from library_item import LibraryItem  # Importing LibraryItem for the items being lent.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+def make_user(user_id):
+    return LibraryUser(user_id, f"User {user_id}", f"user{user_id}@example.com", BorrowerStatus.ACTIVE)
+
+# Defining the test class for OverdueScheduler, inheriting from unittest.TestCase.
+class TestOverdueScheduler(unittest.TestCase):
+
+    def setUp(self):
+        """Create a scheduler with a ten second loan period and a simulated clock"""
+        self.now = 0.0
+        self.scheduler = OverdueScheduler(loan_period=10, clock=lambda: self.now)
+
+    def test_open_sets_due_date(self):
+        """Test that a loan is due one loan period after it is opened"""
+        user = make_user(100)
+        self.assertEqual(self.scheduler.open(user, 1), Loan(100, 1, 0.0, 10.0))
+        self.assertEqual(self.scheduler.loan_of(1).due_at, 10.0)
+        self.assertEqual(self.scheduler.next_due, 10.0)
+        with self.assertRaises(ValueError) as context:
+            self.scheduler.open(user, 1)
+        self.assertEqual(str(context.exception), "Item Id is already on loan.")
+
+    def test_advance_marks_overdue_users_delinquent(self):
+        """Test that users become DELINQUENT exactly when a loan falls due"""
+        early, late = make_user(100), make_user(101)
+        self.scheduler.open(early, 1)
+        self.scheduler.open(late, 2, due_at=20)
+        self.assertEqual(self.scheduler.advance(9.9), [])
+        self.assertEqual(self.scheduler.advance(10), [early])
+        self.assertEqual(early.status, BorrowerStatus.DELINQUENT)
+        self.assertEqual(late.status, BorrowerStatus.ACTIVE)
+        self.assertEqual(self.scheduler.overdue_count(100), 1)
+        self.assertEqual(self.scheduler.next_due, 20)
+
+    def test_returned_loans_never_fall_due(self):
+        """Test that a loan returned on time does not make its user DELINQUENT"""
+        user = make_user(100)
+        self.scheduler.open(user, 1)
+        self.assertEqual(self.scheduler.close(1).item_id, 1)
+        self.assertIsNone(self.scheduler.close(1))
+        self.assertIsNone(self.scheduler.next_due)
+        self.assertEqual(self.scheduler.advance(100), [])
+        self.assertEqual(user.status, BorrowerStatus.ACTIVE)
+
+    def test_invalid_loan_period_raises_exception(self):
+        """Test that the loan period must be positive"""
+        with self.assertRaises(ValueError) as context:
+            OverdueScheduler(loan_period=0)
+        self.assertEqual(str(context.exception), "Loan period must be a positive number.")
+
+    def test_engine_keeps_user_delinquent_until_last_overdue_return(self):
+        """Test that returning one of two overdue items leaves the user DELINQUENT"""
+        engine = CheckoutEngine(scheduler=self.scheduler)
+        user = make_user(100)
+        items = [LibraryItem(item_id, f"Title {item_id}", "Author", 2000, Genre.FICTION, False) for item_id in (100, 101)]
+        for item in items:
+            engine.borrow(user, item)
+        self.now = 11
+        self.assertEqual(engine.advance(), [user])
+        self.assertEqual(engine.return_item(user, items[0]), "Item successfully returned.")
+        self.assertEqual(user.status, BorrowerStatus.DELINQUENT)
+        engine.return_item(user, items[1])
+        self.assertEqual(user.status, BorrowerStatus.ACTIVE)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_engine_advance_skips_loan_returned_meanwhile(self):
+        """Test that a loan returned after falling due, before the user's lock is taken, is not marked"""
+        engine = CheckoutEngine(scheduler=self.scheduler)
+        user, item = make_user(100), LibraryItem(100, "Title", "Author", 2000, Genre.FICTION, False)
+        engine.borrow(user, item)
+        fall_due = self.scheduler.fall_due
+
+        def fall_due_then_return(now=None):
+            fallen = fall_due(now)
+            engine.return_item(user, item)
+            return fallen
+
+        self.now = 11
+        with mock.patch.object(self.scheduler, "fall_due", fall_due_then_return):
+            self.assertEqual(engine.advance(), [])
+        self.assertEqual((user.status, user.loans), (BorrowerStatus.ACTIVE, ()))
+
+    def test_matches_full_scan_under_random_churn(self):
+        """Test the heap against a brute-force scan of every open loan, with frequent compaction"""
+        with mock.patch("loan_scheduler.loan_scheduler._MIN_COMPACTION", 0):
+            self.check_against_full_scan(random.Random(3))
+
+    def check_against_full_scan(self, rng):
+        users = [make_user(100 + n) for n in range(50)]
+        loans = {}
+        for step in range(5_000):
+            self.now = step / 10
+            item_id = rng.randrange(3_000)
+            if item_id in loans:
+                self.scheduler.close(item_id)
+                del loans[item_id]
+            else:
+                user = rng.choice(users)
+                loans[item_id] = self.scheduler.open(user, item_id, due_at=self.now + rng.uniform(1, 50))
+            self.scheduler.advance()
+            if step % 50:
+                continue
+            expected = {user.user_id: 0 for user in users}
+            for loan in loans.values():
+                expected[loan.user_id] += loan.due_at <= self.now
+            for user in users:
+                self.assertEqual(self.scheduler.overdue_count(user.user_id), expected[user.user_id])
+                if expected[user.user_id]:
+                    self.assertEqual(user.status, BorrowerStatus.DELINQUENT)
+                else:
+                    user.status = BorrowerStatus.ACTIVE
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Description: Unit tests for patron deduplication.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_patron_dedup.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from patron_dedup import canonical_email, canonical_name, find_duplicates, PatronDeduplicator, MergeCluster
+from library_user import LibraryUser
+from borrower_status import BorrowerStatus
+
+def make_user(user_id, name, email):
+    return LibraryUser(user_id, name, email, BorrowerStatus.ACTIVE)
+
+# Defining the test class for the canonical forms.
+class TestCanonicalForms(unittest.TestCase):
+
+    def test_canonical_email(self):
+        """Test that case, whitespace, plus-tags and Gmail dots are removed"""
+        self.assertEqual(canonical_email(" Ann.Lee+library@Example.com "), "ann.lee@example.com")
+        self.assertEqual(canonical_email("A.N.N.Lee+x@GMAIL.com"), "annlee@gmail.com")
+        self.assertEqual(canonical_email("ann.lee@googlemail.com"), "annlee@gmail.com")
+        # Dots only mean nothing at Gmail.
+        self.assertNotEqual(canonical_email("ann.lee@example.com"), canonical_email("annlee@example.com"))
+
+    def test_canonical_name(self):
+        """Test that case, spacing, punctuation, accents and word order are removed"""
+        self.assertEqual(canonical_name("  Zoë   Brontë "), "bronte zoe")
+        self.assertEqual(canonical_name("BRONTE, Zoe"), "bronte zoe")
+        self.assertEqual(canonical_name("José Q. García"), "garcia jose q")
+
+# Defining the test class for PatronDeduplicator, inheriting from unittest.TestCase.
+class TestPatronDeduplicator(unittest.TestCase):
+
+    def test_exact_duplicates(self):
+        """Test that users with the same canonical email are one cluster, whatever their names"""
+        users = [make_user(100, "Ann Lee", "ann.lee@gmail.com"),
+                 make_user(205, "A. Lee", "AnnLee+holds@gmail.com"),
+                 make_user(150, "Ann Lee", " ann.lee@googlemail.com"),
+                 make_user(300, "Bob Stone", "bob@example.com")]
+        self.assertEqual(find_duplicates(users), [MergeCluster(100, (150, 205), 1.0)])
+
+    def test_fuzzy_duplicates(self):
+        """Test that typos in both the name and the email are found"""
+        users = [make_user(100, "Elizabeth Rodriguez", "elizabeth.rodriguez633@example.org"),
+                 make_user(101, "Elizabeht Rodriguez", "elizabeth.rodirguez633@example.org"),
+                 make_user(102, "Rodriguez, Elisabeth", "ELISABETH.RODRIGUEZ633@example.org")]
+        clusters = find_duplicates(users)
+        self.assertEqual([(cluster.survivor, cluster.duplicates) for cluster in clusters], [(100, (101, 102))])
+        self.assertTrue(0.6 <= clusters[0].score < 1.0)
+
+    def test_namesakes_are_not_merged(self):
+        """Test that people with the same name and different mailboxes stay apart"""
+        users = [make_user(100, "John Smith", "john.smith84@example.org"),
+                 make_user(101, "John Smith", "john.smith85@example.org"),
+                 make_user(102, "John Smith", "jsmith@example.org"),
+                 make_user(103, "John Smith", "john.smith84@yahoo.com"),
+                 make_user(104, "Jane Smith", "jane.smith84@example.org")]
+        self.assertEqual(find_duplicates(users), [])
+
+    def test_threshold(self):
+        """Test that a stricter threshold rejects a looser match"""
+        users = [make_user(100, "Elizabeth Rodriguez", "elizabeth.rodriguez633@example.org"),
+                 make_user(101, "Elizabeht Rodriguez", "elizabeth.rodirguez633@example.org")]
+        self.assertEqual(len(find_duplicates(users, threshold=0.6)), 1)
+        self.assertEqual(find_duplicates(users, threshold=0.95), [])
+
+    def test_large_bucket_is_bounded(self):
+        """Test that a crowd of similar users is compared in O(n * window), and one mailbox still merges"""
+        deduplicator = PatronDeduplicator(window=4)
+        deduplicator.add_all(make_user(100 + n, "John Smith", f"john.smith+{n}@example.org") for n in range(500))
+        # The same name and mailbox at 500 different domains share every LSH bucket.
+        deduplicator.add_all(make_user(1000 + n, "John Smith", f"john.smith@{chr(97 + n % 26)}{chr(97 + n // 26)}.org")
+                             for n in range(500))
+        clusters = deduplicator.clusters()
+        self.assertEqual(len(deduplicator), 1000)
+        self.assertLessEqual(deduplicator.comparisons, 500 * 4 * deduplicator.bands)
+        self.assertEqual(clusters[0].survivor, 100)
+        self.assertTrue(set(range(101, 600)) <= set(clusters[0].duplicates))
+
+    def test_repeatable(self):
+        """Test that the same users and seed give the same clusters"""
+        users = [make_user(100 + n, f"Patron {n % 50}", f"patron{n % 50}.{n % 7}@example.org") for n in range(300)]
+        self.assertEqual(find_duplicates(users), find_duplicates(reversed(users)))
+
+    def test_invalid_options(self):
+        """Test that thresholds and band sizes are checked"""
+        with self.assertRaises(ValueError) as context:
+            PatronDeduplicator(threshold=0)
+        self.assertEqual(str(context.exception), "Threshold must be between 0 and 1.")
+        with self.assertRaises(ValueError) as context:
+            PatronDeduplicator(rows=0)
+        self.assertEqual(str(context.exception), "Bands, rows and window must be positive integers.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
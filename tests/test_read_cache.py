@@ -0,0 +1,206 @@
+"""
+Description: Unit tests for the ReadThroughCache and CachedRepository classes.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_read_cache.py
+"""
+
+# Importing the necessary modules for testing.
+import threading
+import unittest
+from read_cache import ReadThroughCache, CachedRepository  # Importing the classes to be tested.
+from repository import SQLiteRepository
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+# Defining the test class for ReadThroughCache, inheriting from unittest.TestCase.
+class TestReadThroughCache(unittest.TestCase):
+
+    def setUp(self):
+        """Create a cache over a counting lookup that knows the even keys"""
+        self.loads = []
+        self.clock = FakeClock()
+        self.cache = ReadThroughCache(self.load, capacity=4, ttl=10.0, negative_ttl=2.0, clock=self.clock)
+
+    def load(self, key):
+        self.loads.append(key)
+        return f"value {key}" if key % 2 == 0 else None
+
+    def test_hits_after_first_load(self):
+        """Test that a repeated lookup is answered from the cache"""
+        self.assertEqual(self.cache.get(2), "value 2")
+        self.assertEqual(self.cache.get(2), "value 2")
+        self.assertEqual(self.loads, [2])
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+        self.assertEqual(self.cache.load_latency.count, 1)
+
+    def test_time_to_live(self):
+        """Test that an entry is reloaded once its time to live has passed"""
+        self.cache.get(2)
+        self.clock.now = 9.9
+        self.cache.get(2)
+        self.clock.now = 10.0
+        self.cache.get(2)
+        self.assertEqual(self.loads, [2, 2])
+        self.assertEqual(self.cache.stats().expirations, 1)
+
+    def test_negative_caching(self):
+        """Test that a missing key is cached for the shorter negative time to live"""
+        self.assertIsNone(self.cache.get(3))
+        self.assertIsNone(self.cache.get(3))
+        self.assertEqual(self.cache.stats().negative_hits, 1)
+        self.clock.now = 2.0
+        self.cache.get(3)
+        self.assertEqual(self.loads, [3, 3])
+
+    def test_invalidate(self):
+        """Test that an invalidated key is read from the lookup again"""
+        self.cache.get(2)
+        self.cache.invalidate(2)
+        self.cache.get(2)
+        self.assertEqual(self.loads, [2, 2])
+
+    def test_lru_eviction_without_admission(self):
+        """Test that a full cache without admission evicts the least recently used key"""
+        cache = ReadThroughCache(self.load, capacity=2, admission=False, clock=self.clock)
+        cache.get(2)
+        cache.get(4)
+        cache.get(2)
+        cache.get(6)
+        self.loads.clear()
+        cache.get(2)
+        cache.get(4)
+        self.assertEqual(self.loads, [4])
+        self.assertEqual(cache.stats().evictions, 2)
+
+    def test_admission_keeps_popular_keys(self):
+        """Test that one-off keys do not displace frequently used ones"""
+        for _ in range(5):
+            for key in (2, 4, 6, 8):
+                self.cache.get(key)
+        for key in range(100, 140, 2):
+            self.cache.get(key)
+        self.loads.clear()
+        for key in (2, 4, 6, 8):
+            self.cache.get(key)
+        self.assertEqual(self.loads, [])
+        self.assertEqual(self.cache.stats().rejections, 20)
+
+    def test_frequent_newcomer_is_admitted(self):
+        """Test that a key requested more often than the victim gets in"""
+        for key in (2, 4, 6, 8):
+            self.cache.get(key)
+        for _ in range(3):
+            self.cache.get(10)
+        self.cache.get(10)
+        self.assertEqual(self.cache.stats().evictions, 1)
+        self.assertEqual(len(self.cache), 4)
+
+    def test_coalescing(self):
+        """Test that concurrent misses on one key share a single lookup"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_load(key):
+            calls.append(key)
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        cache = ReadThroughCache(slow_load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get(1))) for _ in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while cache.stats().coalesced < 7:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ["slow"] * 8)
+
+    def test_invalidate_during_load(self):
+        """Test that a value loaded before an invalidation is not cached"""
+        def load(key):
+            self.cache.invalidate(key)
+            self.loads.append(key)
+            return "stale"
+
+        cache = self.cache = ReadThroughCache(load, clock=self.clock)
+        self.assertEqual(cache.get(2), "stale")
+        self.assertEqual(len(cache), 0)
+
+    def test_failed_load_is_not_cached(self):
+        """Test that an exception from the lookup reaches the caller and is not cached"""
+        def load(key):
+            raise OSError("backend down")
+
+        cache = ReadThroughCache(load)
+        with self.assertRaises(OSError):
+            cache.get(1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_capacity(self):
+        """Test that the capacity must be a positive integer"""
+        with self.assertRaises(ValueError) as context:
+            ReadThroughCache(self.load, capacity=0)
+        self.assertEqual(str(context.exception), "Capacity must be a positive integer.")
+
+# Defining the test class for CachedRepository, inheriting from unittest.TestCase.
+class TestCachedRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Create a cached repository over SQLite holding one item and one user"""
+        self.backend = SQLiteRepository()
+        self.backend.save_items([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)])
+        self.backend.save_users([LibraryUser(200, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)])
+        self.repository = CachedRepository(self.backend, capacity=16)
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_reads_through(self):
+        """Test that lookups are served from the cache after the first, as the same shared object"""
+        self.assertIs(self.repository.get_item(100), self.repository.get_item(100))
+        self.assertIsNone(self.repository.get_user(999))
+        self.assertEqual(self.repository.items.stats().hits, 1)
+
+    def test_writes_invalidate(self):
+        """Test that changes are written through and seen by the next lookup"""
+        self.assertFalse(self.repository.get_item(100).is_borrowed)
+        self.repository.set_borrowed(100, True)
+        self.assertTrue(self.repository.get_item(100).is_borrowed)
+        self.assertTrue(self.backend.get_item(100).is_borrowed)
+
+        self.repository.get_user(200)
+        self.repository.set_status(200, BorrowerStatus.DELINQUENT)
+        self.assertEqual(self.repository.get_user(200).status, BorrowerStatus.DELINQUENT)
+
+    def test_save_invalidates_negative_entries(self):
+        """Test that saving a previously missing id makes it visible"""
+        self.assertIsNone(self.repository.get_user(201))
+        self.repository.save_users([LibraryUser(201, "Bo Park", "bo@example.com", BorrowerStatus.ACTIVE)])
+        self.assertEqual(self.repository.get_user(201).name, "Bo Park")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Description: Unit tests for the memory-mapped item and user record files.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_record_file.py
+"""
+
+# Importing the necessary modules for testing.
+import os
+import tempfile
+import unittest
+from record_file import ItemFile, UserFile, write_items, write_users  # Importing the record files to be tested.
+from library_item import LibraryItem  # Importing LibraryItem for the items written.
+from library_user import LibraryUser  # Importing LibraryUser for the users written.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for the record files, inheriting from unittest.TestCase.
+class TestRecordFile(unittest.TestCase):
+
+    def setUp(self):
+        """Write an item file and a user file to a temporary directory"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.items_path = os.path.join(self.directory.name, "items.bin")
+        self.users_path = os.path.join(self.directory.name, "users.bin")
+        write_items(self.items_path, [
+            LibraryItem(102, "Dune", "Frank Herbert", 1965, Genre.SCIFI, True),
+            LibraryItem(100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False),
+            LibraryItem(101, "Cien años de soledad", "Gabriel García Márquez", 1967, Genre.FICTION, False),
+        ])
+        write_users(self.users_path, [
+            LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.DELINQUENT),
+            LibraryUser(101, "Jane Doe", "jane.doe@example.com", BorrowerStatus.MINOR),
+        ])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_item_lookup(self):
+        """Test that an item is found by id and decoded correctly"""
+        with ItemFile(self.items_path) as items:
+            self.assertEqual(len(items), 3)
+            record = items.get(101)
+            self.assertEqual(record.title, "Cien años de soledad")
+            self.assertEqual(record.author, "Gabriel García Márquez")
+            self.assertEqual(record.publication_year, 1967)
+            self.assertEqual(record.genre, Genre.FICTION)
+            self.assertIsNone(items.get(103))
+            self.assertEqual([record.item_id for record in items], [100, 101, 102])
+            item = items.get(102).to_item()
+            self.assertEqual((item.title, item.is_borrowed), ("Dune", True))
+
+    def test_set_borrowed_in_place(self):
+        """Test that the borrowed flag is changed in place and survives reopening"""
+        size = os.path.getsize(self.items_path)
+        with ItemFile(self.items_path, writable=True) as items:
+            record = items.get(100)
+            items.set_borrowed(100, True)
+            self.assertTrue(record.is_borrowed)
+            items.flush()
+        self.assertEqual(os.path.getsize(self.items_path), size)
+        with ItemFile(self.items_path) as items:
+            self.assertTrue(items.get(100).is_borrowed)
+            self.assertFalse(items.get(101).is_borrowed)
+            with self.assertRaises(TypeError):
+                items.set_borrowed(100, False)
+
+    def test_user_lookup_and_status_change(self):
+        """Test user lookups and in-place status changes"""
+        with UserFile(self.users_path, writable=True) as users:
+            record = users.get(100)
+            self.assertEqual((record.name, record.email, record.status),
+                             ("John Doe", "john.doe@example.com", BorrowerStatus.DELINQUENT))
+            users.set_status(100, BorrowerStatus.ACTIVE)
+            self.assertEqual(record.status, BorrowerStatus.ACTIVE)
+            self.assertEqual(users.get(101).to_user().status, BorrowerStatus.MINOR)
+            with self.assertRaises(ValueError) as context:
+                users.set_status(999, BorrowerStatus.ACTIVE)
+            self.assertEqual(str(context.exception), "User Id not found in the file.")
+
+    def test_invalid_files_raise_exception(self):
+        """Test that ValueError is raised for duplicates and for the wrong kind of file"""
+        with self.assertRaises(ValueError) as context:
+            write_items(self.items_path, [LibraryItem(100, "A", "B", 2000, Genre.FICTION)] * 2)
+        self.assertEqual(str(context.exception), "Item Id already exists in the file.")
+        with self.assertRaises(ValueError) as context:
+            ItemFile(self.users_path)
+        self.assertEqual(str(context.exception), "Invalid record file.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Description: Unit tests for the SQLiteRepository class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_repository.py
+"""
+
+# Importing the necessary modules for testing.
+import os
+import tempfile
+import threading
+import unittest
+from repository import Repository, SQLiteRepository, ConnectionPool  # Importing the classes to be tested.
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+# Defining the test class for SQLiteRepository, inheriting from unittest.TestCase.
+class TestSQLiteRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Create an in-memory repository holding one item and one user"""
+        self.repository = SQLiteRepository()
+        self.repository.save_items([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)])
+        self.repository.save_users([LibraryUser(200, "Ann Lee", "ann@example.com", BorrowerStatus.MINOR)])
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_round_trip(self):
+        """Test that stored items and users are read back unchanged"""
+        item = self.repository.get_item(100)
+        self.assertEqual((item.item_id, item.title, item.author, item.publication_year, item.genre, item.is_borrowed),
+                         (100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False))
+        user = self.repository.get_user(200)
+        self.assertEqual((user.user_id, user.name, user.email, user.status),
+                         (200, "Ann Lee", "ann@example.com", BorrowerStatus.MINOR))
+
+    def test_missing_ids(self):
+        """Test that unknown ids are reported as None"""
+        self.assertIsNone(self.repository.get_item(999))
+        self.assertIsNone(self.repository.get_user(999))
+
+    def test_updates(self):
+        """Test changing an item's borrowed status and a user's status"""
+        self.repository.set_borrowed(100, True)
+        self.repository.set_status(200, BorrowerStatus.DELINQUENT)
+        self.assertTrue(self.repository.get_item(100).is_borrowed)
+        self.assertEqual(self.repository.get_user(200).status, BorrowerStatus.DELINQUENT)
+
+    def test_save_replaces(self):
+        """Test that saving an existing id replaces the stored row"""
+        self.repository.save_items([LibraryItem(100, "Dune Messiah", "Frank Herbert", 1969, Genre.SCIFI)])
+        self.assertEqual(self.repository.get_item(100).title, "Dune Messiah")
+
+    def test_save_updates_in_place(self):
+        """Test that saving an existing id is an upsert, not a second row"""
+        self.repository.save_items([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI, True),
+                                    LibraryItem(101, "Emma", "Jane Austen", 1815, Genre.FICTION)])
+        self.assertEqual([(item.item_id, item.is_borrowed) for item in self.repository.load_items()],
+                         [(100, True), (101, False)])
+        self.assertEqual([user.user_id for user in self.repository.load_users()], [200])
+
+    def test_write_changes(self):
+        """Test applying many changes at once"""
+        self.repository.save_items([LibraryItem(101, "Emma", "Jane Austen", 1815, Genre.FICTION)])
+        self.repository.write_changes({100: True, 101: True}, {200: BorrowerStatus.INACTIVE})
+        self.assertTrue(all(item.is_borrowed for item in self.repository.load_items()))
+        self.assertEqual(self.repository.get_user(200).status, BorrowerStatus.INACTIVE)
+
+    def test_write_changes_rolls_back_on_error(self):
+        """Test that a failed batch leaves nothing half written"""
+        with self.assertRaises(AttributeError):
+            self.repository.write_changes({100: True}, {200: "not a status"})
+        self.assertFalse(self.repository.get_item(100).is_borrowed)
+
+    def test_interface_is_abstract(self):
+        """Test that neither the base Repository nor an incomplete subclass can be created"""
+        class ReadOnlyRepository(Repository):
+            def get_item(self, item_id):
+                return None
+
+        for cls in (Repository, ReadOnlyRepository):
+            with self.assertRaises(TypeError):
+                cls()
+
+# Defining the test class for ConnectionPool, inheriting from unittest.TestCase.
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for database files"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "library.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_database_uses_wal(self):
+        """Test that every pooled connection to a file is in write-ahead-log mode"""
+        pool = ConnectionPool(self.path, size=2)
+        with pool.connection() as first, pool.connection() as second:
+            self.assertIsNot(first, second)
+            self.assertEqual(first.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        pool.close()
+
+    def test_memory_database_has_one_connection(self):
+        """Test that an in-memory pool holds a single connection"""
+        pool = ConnectionPool(size=8)
+        self.assertEqual(pool.size, 1)
+        pool.close()
+
+    def test_threads_share_the_pool(self):
+        """Test concurrent writers and readers through a file repository"""
+        with SQLiteRepository(self.path, pool_size=3) as repository:
+            def save(start):
+                repository.save_items(LibraryItem(item_id, "Title", "Author", 2000, Genre.HISTORY)
+                                      for item_id in range(start, start + 100))
+                for item_id in range(start, start + 100, 10):
+                    self.assertIsNotNone(repository.get_item(item_id))
+
+            threads = [threading.Thread(target=save, args=(100 + 100 * n,)) for n in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(repository.load_items()), 600)
+
+    def test_invalid_size(self):
+        """Test that the pool size must be a positive integer"""
+        with self.assertRaises(ValueError) as context:
+            ConnectionPool(size=0)
+        self.assertEqual(str(context.exception), "Pool size must be a positive integer.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
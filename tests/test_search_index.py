@@ -0,0 +1,84 @@
+"""
+Description: Unit tests for the SearchIndex class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_search_index.py
+"""
+
+# Importing the necessary modules for testing.
+import unittest
+from search_index import SearchIndex, tokenize  # Importing the SearchIndex class to be tested.
+from library_item import LibraryItem  # Importing LibraryItem for the items indexed.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+
+# Defining the test class for SearchIndex, inheriting from unittest.TestCase.
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Create an index over a handful of items"""
+        self.gatsby = LibraryItem(100, "The Great Gatsby", "F. Scott Fitzgerald", 1925, Genre.FICTION, False)
+        self.paradise = LibraryItem(101, "This Side of Paradise", "F. Scott Fitzgerald", 1920, Genre.FICTION, True)
+        self.dune = LibraryItem(102, "Dune", "Frank Herbert", 1965, Genre.SCIFI, False)
+        self.scott = LibraryItem(103, "Scott of the Antarctic", "David Crane", 2005, Genre.BIOGRAPHY, False)
+        self.index = SearchIndex([self.gatsby, self.paradise, self.dune, self.scott])
+
+    def test_tokenize(self):
+        """Test case folding and punctuation splitting"""
+        self.assertEqual(tokenize("F. Scott FITZGERALD's"), ["f", "scott", "fitzgerald", "s"])
+
+    def test_exact_and_prefix_matches(self):
+        """Test exact, prefix and multi-word queries"""
+        self.assertEqual(self.index.search("dune"), [self.dune])
+        self.assertEqual(self.index.search("GATS"), [self.gatsby])
+        self.assertEqual(self.index.search("fitz para"), [self.paradise])
+        self.assertEqual(self.index.search("tolkien"), [])
+        self.assertEqual(self.index.search("  "), [])
+
+    def test_ranking(self):
+        """Test that title matches outrank author matches"""
+        self.assertEqual(self.index.search("scott"), [self.scott, self.gatsby, self.paradise])
+        self.assertEqual(self.index.search("scott", limit=1), [self.scott])
+
+    def test_filters(self):
+        """Test the genre and availability filters"""
+        self.assertEqual(self.index.search("scott", genre=Genre.FICTION), [self.gatsby, self.paradise])
+        self.assertEqual(self.index.search("scott", available_only=True), [self.scott, self.gatsby])
+        # Availability is read from the item at query time.
+        self.gatsby.is_borrowed = True
+        self.assertEqual(self.index.search("fitzgerald", available_only=True), [])
+
+    def test_incremental_updates(self):
+        """Test that added and removed items are reflected in searches"""
+        self.index.remove(102)
+        self.assertEqual(self.index.search("dune"), [])
+        messiah = LibraryItem(104, "Dune Messiah", "Frank Herbert", 1969, Genre.SCIFI, False)
+        self.index.add(messiah)
+        self.assertEqual(self.index.search("mess"), [messiah])
+        self.index.add(self.dune)
+        self.assertEqual(self.index.search("dun"), [self.dune, messiah])
+        self.assertEqual(len(self.index), 5)
+
+    def test_prefix_expansion_is_complete_or_reported(self):
+        """Test that a common prefix finds every item by default, and a capped search says it was cut short"""
+        items = [LibraryItem(200 + n, f"Word{n}", "Author", 2000, Genre.FICTION, False) for n in range(100)]
+        self.assertEqual(len(SearchIndex(items).search("wor", limit=200)), 100)
+        capped = SearchIndex(items, max_expansions=10)
+        self.assertEqual(len(capped.search("wor", limit=200)), 10)
+        self.assertTrue(capped.truncated)
+        capped.search("word7")
+        self.assertFalse(capped.truncated)
+
+    def test_duplicates_and_missing_ids_raise_exception(self):
+        """Test that ValueError is raised for duplicate and unknown ids"""
+        with self.assertRaises(ValueError) as context:
+            self.index.add(self.dune)
+        self.assertEqual(str(context.exception), "Item Id already exists in the index.")
+        with self.assertRaises(ValueError) as context:
+            self.index.remove(999)
+        self.assertEqual(str(context.exception), "Item Id not found in the index.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Description: Unit tests for the ShardedEngine class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_sharded_engine.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import unittest
+from sharded_engine import ShardedEngine  # Importing the ShardedEngine class to be tested.
+from library_item import LibraryItem  # Importing LibraryItem for the items being lent.
+from library_user import LibraryUser  # Importing LibraryUser for the borrowers.
+from genre import Genre  # Importing the Genre enum for assigning genres to LibraryItem.
+from borrower_status import BorrowerStatus  # Importing BorrowerStatus for assigning user statuses.
+
+# Defining the test class for ShardedEngine, inheriting from unittest.TestCase.
+class TestShardedEngine(unittest.TestCase):
+
+    def setUp(self):
+        """Start a three-shard engine over twenty items and three users"""
+        items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, n == 5) for n in range(20)]
+        self.users = [
+            LibraryUser(100, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE),
+            LibraryUser(101, "Jane Doe", "jane.doe@example.com", BorrowerStatus.MINOR),
+            LibraryUser(102, "Late Larry", "larry@example.com", BorrowerStatus.DELINQUENT),
+        ]
+        self.engine = ShardedEngine(items, self.users, shards=3)
+        self.addCleanup(self.engine.close)
+
+    def test_borrow_follows_can_borrow_rules(self):
+        """Test that borrowed items, DELINQUENT users and full quotas are refused"""
+        self.assertEqual(self.engine.borrow_many([(100, 100), (101, 100), (102, 101), (100, 105)]),
+                         [True, False, False, False])
+        self.assertTrue(self.engine.is_borrowed(100))
+        self.assertFalse(self.engine.is_borrowed(101))
+
+    def test_quota_spans_shards(self):
+        """Test that a MINOR user's quota holds across items owned by different shards"""
+        quota = LibraryUser.quota_for(BorrowerStatus.MINOR)
+        results = self.engine.borrow_many([(101, 110 + n) for n in range(quota + 2)])
+        self.assertEqual(results, [True] * quota + [False, False])
+        self.assertFalse(self.engine.is_borrowed(110 + quota))
+
+    def test_return(self):
+        """Test returning items, including by users who do not hold them"""
+        self.engine.borrow(100, 100)
+        self.assertEqual(self.engine.return_many([(101, 100), (100, 100), (102, 105)]), [False, True, False])
+        self.assertFalse(self.engine.is_borrowed(100))
+        self.assertTrue(self.engine.is_borrowed(105))
+        self.assertEqual(self.engine.status_of(102), BorrowerStatus.DELINQUENT)
+        with self.assertRaises(Exception) as context:
+            self.engine.return_item(100, 100)
+        self.assertEqual(str(context.exception), "The user has not borrowed the item.")
+
+    def test_loans_held_before_start(self):
+        """Test that a user stays DELINQUENT until their overdue loans are returned"""
+        items = [LibraryItem(100 + n, f"Title {n}", "Author", 2000, Genre.FICTION, True) for n in range(3)]
+        user = LibraryUser(100, "Late Larry", "larry@example.com", BorrowerStatus.ACTIVE)
+        user.restore_loans([100, 101, 102])
+        user.mark_overdue(100)
+        with ShardedEngine(items, [user, self.users[1]], shards=2) as engine:
+            self.assertEqual(engine.return_many([(101, 100), (100, 101)]), [False, True])
+            self.assertEqual(engine.status_of(100), BorrowerStatus.DELINQUENT)
+            self.assertEqual(engine.return_many([(100, 100), (100, 102)]), [True, True])
+            self.assertEqual(engine.status_of(100), BorrowerStatus.ACTIVE)
+
+    def test_sparse_ids(self):
+        """Test that shared memory is sized by the number of ids, not the largest one"""
+        items = [LibraryItem(item_id, "Title", "Author", 2000, Genre.FICTION, False) for item_id in (100, 10**15)]
+        user = LibraryUser(10**15 + 1, "John Doe", "john.doe@example.com", BorrowerStatus.ACTIVE)
+        with ShardedEngine(items, [user], shards=2) as engine:
+            engine.borrow(10**15 + 1, 10**15)
+            self.assertTrue(engine.is_borrowed(10**15))
+            self.assertFalse(engine.is_borrowed(100))
+
+    def test_unknown_ids_raise_exception(self):
+        """Test that ids the engine does not know are rejected"""
+        with self.assertRaises(ValueError) as context:
+            self.engine.borrow(999, 100)
+        self.assertEqual(str(context.exception), "User Id not found.")
+        with self.assertRaises(ValueError) as context:
+            self.engine.is_borrowed(10_000)
+        self.assertEqual(str(context.exception), "Item Id not found in the catalog.")
+
+    def test_matches_single_process_rules(self):
+        """Test random batches against a dictionary model of the claim-then-charge rules"""
+        rng = random.Random(7)
+        holders = {105: None}
+        counts = {}
+        quotas = {100: 10, 101: LibraryUser.quota_for(BorrowerStatus.MINOR), 102: 0}
+        for _ in range(30):
+            pairs = [(rng.choice([100, 101, 102]), rng.randrange(100, 120)) for _ in range(8)]
+            expected = []
+            if rng.random() < 0.5:
+                # Every claim in a batch is made before any quota is charged.
+                claimed = set()
+                for user_id, item_id in pairs:
+                    ok = item_id not in holders and item_id not in claimed and quotas[user_id] > 0
+                    if ok:
+                        claimed.add(item_id)
+                    expected.append(ok)
+                for position, (user_id, item_id) in enumerate(pairs):
+                    if expected[position]:
+                        expected[position] = counts.get(user_id, 0) < quotas[user_id]
+                        if expected[position]:
+                            holders[item_id] = user_id
+                            counts[user_id] = counts.get(user_id, 0) + 1
+                self.assertEqual(self.engine.borrow_many(pairs), expected)
+            else:
+                for user_id, item_id in pairs:
+                    ok = holders.get(item_id) == user_id
+                    if ok:
+                        del holders[item_id]
+                        counts[user_id] -= 1
+                        if user_id == 102:
+                            quotas[102] = 10  # A DELINQUENT user who returns an item becomes ACTIVE.
+                    expected.append(ok)
+                self.assertEqual(self.engine.return_many(pairs), expected)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Description: Unit tests for the validation module.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute 
+the following command:
+    python -m unittest tests/test_validation.py
+"""
+
+# Importing the necessary modules for testing.
+import random
+import re
+import unittest
+from validation import (is_valid_user_id, is_valid_name, is_valid_email, is_valid_email_cached, valid_emails,
+                        email_cache_info, clear_email_cache)  # Importing the validators to be tested.
+
+# Defining the test class for the validators, inheriting from unittest.TestCase.
+class TestValidation(unittest.TestCase):
+
+    def test_user_id(self):
+        """Test that only integers greater than 99 are valid ids"""
+        self.assertTrue(is_valid_user_id(100))
+        self.assertFalse(is_valid_user_id(99))
+        self.assertFalse(is_valid_user_id("100"))
+
+    def test_name(self):
+        """Test that blank and non-string names are invalid"""
+        self.assertTrue(is_valid_name(" Apurba Khan "))
+        self.assertFalse(is_valid_name(""))
+        self.assertFalse(is_valid_name(" \t\n"))
+        self.assertFalse(is_valid_name(None))
+
+    def test_email_examples(self):
+        """Test typical valid and invalid addresses"""
+        self.assertTrue(is_valid_email("apurba.khan@hotmail.com"))
+        self.assertTrue(is_valid_email("a@b.c"))
+        for email in ["", "   ", "invalid-email", "@b.c", "a@.c", "a@b.", "a@@b.c", "a@b@c.d", 42, None]:
+            self.assertFalse(is_valid_email(email), email)
+            self.assertFalse(is_valid_email_cached(email), email)
+
+    def test_email_agrees_with_pattern(self):
+        """Test that every mode accepts exactly what the constructor's old inline check accepted"""
+        rng = random.Random(13)
+        emails = ["".join(rng.choice("a.@ \n") for _ in range(rng.randint(0, 8))) for _ in range(20_000)]
+        expected = [bool(email.strip()) and bool(re.match(r"[^@]+@[^@]+\.[^@]+", email)) for email in emails]
+        self.assertEqual([is_valid_email(email) for email in emails], expected)
+        self.assertEqual([is_valid_email_cached(email) for email in emails], expected)
+        self.assertEqual(valid_emails(emails), expected)
+
+    def test_batch_with_non_strings(self):
+        """Test that the batch mode reports non-strings as invalid"""
+        self.assertEqual(valid_emails(["a@b.c", None, 7, "nope"]), [True, False, False, False])
+
+    def test_cache_is_bounded_and_reused(self):
+        """Test that repeated addresses hit the cache and its size stays bounded"""
+        clear_email_cache()
+        for n in range(10_000):
+            is_valid_email_cached(f"user{n % 10}@example.com")
+        info = email_cache_info()
+        self.assertEqual(info.misses, 10)
+        self.assertEqual(info.hits, 9_990)
+        for n in range(info.maxsize * 2):
+            is_valid_email_cached(f"user{n}@example.com")
+        self.assertEqual(email_cache_info().currsize, info.maxsize)
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Description: Unit tests for the WriteCoalescer class.
+Author: Apurba Khan
+Date: 2026-10-17
+Usage: To execute all tests in the terminal execute
+the following command:
+    python -m unittest tests/test_write_coalescer.py
+"""
+
+# Importing the necessary modules for testing.
+import threading
+import unittest
+from write_coalescer import WriteCoalescer  # Importing the WriteCoalescer class to be tested.
+from repository import Repository, SQLiteRepository
+from read_cache import CachedRepository
+from library_item import LibraryItem
+from library_user import LibraryUser
+from genre import Genre
+from borrower_status import BorrowerStatus
+
+class RecordingRepository(Repository):
+    """A repository that records every batch it is asked to write"""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def get_item(self, item_id):
+        return None
+
+    def get_user(self, user_id):
+        return None
+
+    def save_items(self, items):
+        pass
+
+    def save_users(self, users):
+        pass
+
+    def set_borrowed(self, item_id, is_borrowed):
+        self.write_changes({item_id: is_borrowed}, {})
+
+    def set_status(self, user_id, status):
+        self.write_changes({}, {user_id: status})
+
+    def write_changes(self, borrowed, statuses):
+        if self.fail:
+            raise OSError("disk full")
+        self.batches.append((dict(borrowed), dict(statuses)))
+
+# Defining the test class for WriteCoalescer, inheriting from unittest.TestCase.
+class TestWriteCoalescer(unittest.TestCase):
+
+    def test_coalesces_changes_to_one_id(self):
+        """Test that only the latest change to each id is written"""
+        repository = RecordingRepository()
+        with WriteCoalescer(repository, max_delay=60) as coalescer:
+            coalescer.set_borrowed(100, True)
+            coalescer.set_borrowed(100, False)
+            coalescer.set_borrowed(101, True)
+            coalescer.set_status(200, BorrowerStatus.DELINQUENT)
+            coalescer.flush()
+            self.assertEqual(repository.batches, [({100: False, 101: True}, {200: BorrowerStatus.DELINQUENT})])
+            self.assertEqual((coalescer.queued, coalescer.rows, coalescer.batches), (4, 3, 1))
+            self.assertEqual(len(coalescer), 0)
+
+    def test_full_batch_is_written_without_flush(self):
+        """Test that reaching max_batch wakes the writer"""
+        repository = RecordingRepository()
+        coalescer = WriteCoalescer(repository, max_batch=3, max_delay=60)
+        for item_id in range(100, 103):
+            coalescer.set_borrowed(item_id, True)
+        for _ in range(1000):
+            if repository.batches:
+                break
+            threading.Event().wait(0.005)
+        self.assertEqual(repository.batches, [({100: True, 101: True, 102: True}, {})])
+        coalescer.close()
+
+    def test_delay_writes_without_flush(self):
+        """Test that a lone change is written after max_delay"""
+        repository = RecordingRepository()
+        coalescer = WriteCoalescer(repository, max_delay=0.001)
+        coalescer.set_status(200, BorrowerStatus.ACTIVE)
+        for _ in range(1000):
+            if repository.batches:
+                break
+            threading.Event().wait(0.005)
+        self.assertEqual(len(repository.batches), 1)
+        coalescer.close()
+
+    def test_close_writes_pending_changes(self):
+        """Test that closing writes what is queued and refuses new changes"""
+        repository = RecordingRepository()
+        coalescer = WriteCoalescer(repository, max_delay=60)
+        coalescer.set_borrowed(100, True)
+        coalescer.close()
+        self.assertEqual(repository.batches, [({100: True}, {})])
+        with self.assertRaises(ValueError) as context:
+            coalescer.set_borrowed(100, False)
+        self.assertEqual(str(context.exception), "Write coalescer is closed.")
+        coalescer.close()
+
+    def test_errors_are_raised_from_flush(self):
+        """Test that a failed batch is reported by the next flush only"""
+        coalescer = WriteCoalescer(RecordingRepository(fail=True))
+        coalescer.set_borrowed(100, True)
+        with self.assertRaises(OSError):
+            coalescer.flush()
+        coalescer.flush()
+        coalescer.close()
+
+    def test_concurrent_writers(self):
+        """Test that changes from many threads all reach the repository"""
+        repository = RecordingRepository()
+        coalescer = WriteCoalescer(repository, max_batch=50)
+
+        def flip(start):
+            for item_id in range(start, start + 500):
+                coalescer.set_borrowed(item_id, True)
+
+        threads = [threading.Thread(target=flip, args=(100 + 500 * n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        coalescer.close()
+        written = {}
+        for borrowed, _ in repository.batches:
+            written.update(borrowed)
+        self.assertEqual(written, {item_id: True for item_id in range(100, 2100)})
+
+    def test_writes_to_sqlite(self):
+        """Test that flushed changes are visible in a SQLite repository"""
+        with SQLiteRepository() as repository:
+            repository.save_items([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)])
+            repository.save_users([LibraryUser(200, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)])
+            with WriteCoalescer(repository) as coalescer:
+                coalescer.set_borrowed(100, True)
+                coalescer.set_status(200, BorrowerStatus.DELINQUENT)
+                coalescer.flush()
+                self.assertTrue(repository.get_item(100).is_borrowed)
+                self.assertEqual(repository.get_user(200).status, BorrowerStatus.DELINQUENT)
+
+    def test_writes_through_cache(self):
+        """Test that changes written through a CachedRepository drop the stale cached copies"""
+        with SQLiteRepository() as backend:
+            backend.save_items([LibraryItem(100, "Dune", "Frank Herbert", 1965, Genre.SCIFI)])
+            backend.save_users([LibraryUser(200, "Ann Lee", "ann@example.com", BorrowerStatus.ACTIVE)])
+            repository = CachedRepository(backend)
+            self.assertFalse(repository.get_item(100).is_borrowed)
+            self.assertEqual(repository.get_user(200).status, BorrowerStatus.ACTIVE)
+            with WriteCoalescer(repository) as coalescer:
+                coalescer.set_borrowed(100, True)
+                coalescer.set_status(200, BorrowerStatus.DELINQUENT)
+                coalescer.flush()
+                self.assertTrue(repository.get_item(100).is_borrowed)
+                self.assertEqual(repository.get_user(200).status, BorrowerStatus.DELINQUENT)
+
+    def test_invalid_max_batch(self):
+        """Test that max_batch must be a positive integer"""
+        with self.assertRaises(ValueError) as context:
+            WriteCoalescer(RecordingRepository(), max_batch=0)
+        self.assertEqual(str(context.exception), "Max batch must be a positive integer.")
+
+# The entry point for running the tests when the script is executed.
+if __name__ == '__main__':
+    unittest.main()
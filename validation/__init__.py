@@ -0,0 +1,11 @@
+"""
+Description: The validation package.  It re-exports the public names of
+validation/validation.py.
+"""
+
+from .validation import (EMAIL_PATTERN, is_valid_user_id, is_valid_name, is_valid_email,
+                         is_valid_email_cached, valid_emails, email_cache_info, clear_email_cache)
+
+# The names this package exports.
+__all__ = ["EMAIL_PATTERN", "is_valid_user_id", "is_valid_name", "is_valid_email",
+           "is_valid_email_cached", "valid_emails", "email_cache_info", "clear_email_cache"]
@@ -0,0 +1,76 @@
+"""
+Description: Validation of library user fields: ids, names and email
+addresses, with a bounded cache of recently checked addresses and a
+batch mode for bulk imports.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# re: Compiles the email pattern once.
+# lru_cache: Remembers the most recently validated addresses.
+# repeat: Lets the batch mode check every type in one C-level pass.
+import re
+from functools import lru_cache
+from itertools import repeat
+
+# The email rule, compiled once.  Calling its bound match method directly
+# skips the pattern cache lookup that re.match makes on every call.
+EMAIL_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_match_email = EMAIL_PATTERN.match
+
+# The number of recently validated addresses to remember.
+EMAIL_CACHE_SIZE = 4096
+
+def is_valid_user_id(user_id):
+    """Returns True if user_id is an integer greater than 99."""
+    return isinstance(user_id, int) and user_id > 99
+
+def is_valid_name(name):
+    """Returns True if name is a string that is not blank once stripped."""
+    return isinstance(name, str) and bool(name) and not name.isspace()
+
+def is_valid_email(email):
+    """
+    Returns True if email is a string matching EMAIL_PATTERN.
+
+    Non-strings and empty strings are rejected without running the pattern.
+    A blank address can never match it, so no separate strip is needed.
+    """
+    return isinstance(email, str) and email != "" and _match_email(email) is not None
+
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _cached_check(email):
+    return _match_email(email) is not None
+
+def is_valid_email_cached(email):
+    """
+    Returns the same result as is_valid_email, remembering recent addresses.
+
+    Use it where the same addresses are checked again and again, such as 
+    patron lookups.  For addresses that are mostly seen once, as in a bulk
+    import, use is_valid_email or valid_emails: a cache miss costs more than
+    running the pattern.
+    """
+    return isinstance(email, str) and _cached_check(email)
+
+def valid_emails(emails):
+    """
+    Validates many email addresses at once.
+
+    Args:
+        emails (list): The values to check.
+
+    Returns:
+        list of bool: Whether each value is a valid email address.
+    """
+    if all(map(isinstance, emails, repeat(str))):
+        return list(map(bool, map(_match_email, emails)))
+    return [isinstance(email, str) and _match_email(email) is not None for email in emails]
+
+def email_cache_info():
+    """Returns the hit, miss and size statistics of the email cache."""
+    return _cached_check.cache_info()
+
+def clear_email_cache():
+    """Empties the email cache."""
+    _cached_check.cache_clear()
@@ -0,0 +1,9 @@
+"""
+Description: The write_coalescer package.  It re-exports the public names of
+write_coalescer/write_coalescer.py.
+"""
+
+from .write_coalescer import WriteCoalescer
+
+# The names this package exports.
+__all__ = ["WriteCoalescer"]
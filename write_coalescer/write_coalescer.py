@@ -0,0 +1,191 @@
+"""
+Description: A background writer that batches item borrowed-status flips
+and user status changes into single repository transactions.
+Author: Apurba Khan
+Date: 2026-10-17
+"""
+
+# threading: Runs the writer thread and lets callers wait for their writes.
+import threading
+
+class WriteCoalescer:
+    """
+    A class to queue circulation writes and apply them to a repository in batches.
+
+    set_borrowed and set_status return at once; a writer thread collects
+    the queued changes and applies them with one Repository.write_changes
+    call, which SQLiteRepository runs as a single transaction.  Changes to
+    the same id are coalesced, so only the latest value of each is written.
+    A batch is written when it reaches max_batch ids, when flush is called,
+    or max_delay seconds after its first change.
+
+    Reads from the repository see a change once it has been written, so
+    call flush before reading back something just changed.  The changes go
+    straight to the repository given, so to keep a CachedRepository's
+    cache in step, give the coalescer the CachedRepository itself.  If a batch
+    fails to write, its changes are dropped and the error is raised from
+    the next flush or close.
+
+    Attributes:
+        max_batch (int): The number of pending ids that triggers a write.
+        max_delay (float): The longest a change waits before being written, in seconds.
+        queued (int): The number of changes queued.
+        rows (int): The number of rows written, after coalescing.
+        batches (int): The number of batches written.
+    """
+
+    def __init__(self, repository, max_batch=10_000, max_delay=0.01):
+        """
+        Initializes the WriteCoalescer and starts its writer thread.
+
+        Args:
+            repository (Repository): The repository to write to.
+            max_batch (int, optional): The number of pending ids that triggers a write. Defaults to 10,000.
+            max_delay (float, optional): The longest a change waits, in seconds. Defaults to 0.01.
+
+        Raises:
+            ValueError: If max_batch is not a positive integer.
+        """
+        if not isinstance(max_batch, int) or max_batch <= 0:
+            raise ValueError("Max batch must be a positive integer.")
+
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queued = 0
+        self.rows = 0
+        self.batches = 0
+        self.__repository = repository
+        self.__condition = threading.Condition()
+        self.__borrowed = {}
+        self.__statuses = {}
+        # The number of queued changes that have been written (or dropped on error).
+        self.__written = 0
+        self.__flush_requested = False
+        self.__stopping = False
+        self.__error = None
+        self.__writer = threading.Thread(target=self.__run, name="write-coalescer", daemon=True)
+        self.__writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self.__condition:
+            return len(self.__borrowed) + len(self.__statuses)
+
+    def set_borrowed(self, item_id, is_borrowed):
+        """
+        Queues a change to an item's borrowed status.
+
+        Args:
+            item_id (int): The unique identifier of the item.
+            is_borrowed (bool): The new borrowed status.
+
+        Raises:
+            ValueError: If the coalescer is closed.
+        """
+        with self.__condition:
+            self.__check_open()
+            self.__borrowed[item_id] = is_borrowed
+            self.__queue_one()
+
+    def set_status(self, user_id, status):
+        """
+        Queues a change to a user's status.
+
+        Args:
+            user_id (int): The unique identifier of the user.
+            status (BorrowerStatus): The new status.
+
+        Raises:
+            ValueError: If the coalescer is closed.
+        """
+        with self.__condition:
+            self.__check_open()
+            self.__statuses[user_id] = status
+            self.__queue_one()
+
+    def flush(self):
+        """
+        Waits until every change queued so far has been written.
+
+        Raises:
+            Exception: The error raised by a batch that failed to write since the last flush.
+        """
+        with self.__condition:
+            target = self.queued
+            if self.__written < target:
+                self.__flush_requested = True
+                self.__condition.notify_all()
+            self.__condition.wait_for(lambda: self.__written >= target)
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Writes every queued change and stops the writer thread.
+
+        Raises:
+            Exception: The error raised by a batch that failed to write since the last flush.
+        """
+        with self.__condition:
+            if self.__stopping:
+                return
+            self.__stopping = True
+            self.__condition.notify_all()
+        self.__writer.join()
+        with self.__condition:
+            error, self.__error = self.__error, None
+        if error is not None:
+            raise error
+
+    def __check_open(self):
+        if self.__stopping:
+            raise ValueError("Write coalescer is closed.")
+
+    def __queue_one(self):
+        # Count a queued change, and wake the writer for a new batch's first change or once it is full.
+        self.queued += 1
+        pending = len(self.__borrowed) + len(self.__statuses)
+        if pending == 1 or pending >= self.max_batch:
+            self.__condition.notify_all()
+
+    def __ready(self):
+        return (self.__stopping or self.__flush_requested
+                or len(self.__borrowed) + len(self.__statuses) >= self.max_batch)
+
+    def __run(self):
+        # The writer loop: wait for a change, give the batch max_delay to fill, then write it.
+        condition = self.__condition
+        while True:
+            with condition:
+                condition.wait_for(lambda: self.__borrowed or self.__statuses or self.__stopping)
+                if not self.__ready():
+                    condition.wait_for(self.__ready, timeout=self.max_delay)
+                borrowed, self.__borrowed = self.__borrowed, {}
+                statuses, self.__statuses = self.__statuses, {}
+                target = self.queued
+                self.__flush_requested = False
+                stopping = self.__stopping
+
+            error = None
+            if borrowed or statuses:
+                try:
+                    self.__repository.write_changes(borrowed, statuses)
+                except Exception as exception:
+                    error = exception
+
+            with condition:
+                if error is not None:
+                    self.__error = error
+                elif borrowed or statuses:
+                    self.rows += len(borrowed) + len(statuses)
+                    self.batches += 1
+                self.__written = target
+                condition.notify_all()
+            if stopping:
+                return